@@ -1,4 +1,5 @@
 DEFAULT_DELAY_SEC = 4
+DEFAULT_RETRY_DELAY_SEC = 1
 MAX_DELAY_SEC = 120
 
 STARK_KEY_LENGTH = 66
@@ -17,10 +18,65 @@ LOGGING_LEVEL = "INFO"
 
 EXPLORER_BASE_URL = "https://starkscan.co/"
 
-GAS_TIME_EXP_PARAMS = [5.96675324e+02, -4.72323892e+02, 8.01930382e-03, 1.33939118e+00]
 GAS_PRICE_MUL = 100
+GAS_ORACLE_POLL_INTERVAL_SEC = 30
+GAS_ORACLE_MAX_AGE_SEC = 60
+GAS_ORACLE_MAX_FAILURES = 3
+ETH_MAINNET_RPC_URL = "https://rpc.ankr.com/eth"
+
+GECKO_PRICE_TTL_SEC = 60
+GECKO_PRICE_MAX_STALE_SEC = 600
+GECKO_PRICE_SYNC_TIMEOUT_SEC = 30
+
+METADATA_ACCOUNT_VERSION_TTL_SEC = 24 * 60 * 60
 
 DEFAULT_WALLETS_THREADS_NUM = 4
+DEFAULT_WALLETS_CONCURRENCY = 200
+DEFAULT_SHARD_PROCESSES_NUM = 4
+
+EVENTS_BATCH_MAX_SIZE = 500
+EVENTS_COALESCE_INTERVAL_SEC = 0.25
+
+DEFAULT_RATE_LIMIT_RPS = 20
+DEFAULT_RATE_LIMIT_BURST = 40
+HOSTS_RATE_LIMITS = {
+    # host: (requests per second, burst)
+    "api.coingecko.com": (0.5, 5),
+    "alpha-mainnet.starknet.io": (2, 5),
+}
+
+RPC_REQUEST_TIMEOUT_SEC = 30
+RPC_PROBE_INTERVAL_SEC = 30
+RPC_ENDPOINT_MAX_FAILURES = 3
+RPC_LATENCY_SMOOTHING = 0.3
+RPC_BATCH_MAX_SIZE = 50
+
+PREFETCH_READ_TIMEOUT_SEC = 30
+
+RECEIPT_POLL_INTERVAL_SEC = 5
+
+TXN_FEE_ESTIMATE_MULTIPLIER = 1.5
+
+PIPELINE_SIGN_WORKERS = 2
+PIPELINE_ESTIMATE_WORKERS = 32
+PIPELINE_SUBMIT_WORKERS = 32
+PIPELINE_QUEUE_SIZE = 64
+
+QUOTE_BLOCK_CHECK_INTERVAL_SEC = 5
+
+BALANCE_SCAN_CONCURRENCY = 20
+BALANCE_SNAPSHOT_MIN_FEE_ETH = 0.0002
+
+TRANSPORT_POOL_LIMIT = 100
+TRANSPORT_POOL_LIMIT_PER_HOST = 20
+TRANSPORT_DNS_CACHE_TTL_SEC = 300
+TRANSPORT_KEEPALIVE_TIMEOUT_SEC = 60
+TRANSPORT_IDLE_TIMEOUT_SEC = 300
+
+PROXY_CHECK_TTL_SEC = 600
+PROXY_FAILED_RECHECK_SEC = 60
+PROXY_DEFER_SEC = 60
+PROXY_MAX_DEFERRALS = 3
 
 VIRTUAL_TASK_PARAMETER = "is_virtual"
 
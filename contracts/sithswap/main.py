@@ -1,9 +1,9 @@
 from src.paths import SithSwapDir
-from utils.file_manager import FileManager
+from src.contract_registry import ContractRegistry
 
 
 class SithSwapContracts:
     def __init__(self):
         self.router_address = '0x028c858a586fa12123a1ccb337a0a3b369281f91ea00544d0c086524b759f627'
-        self.router_abi = FileManager.read_abi_from_file(SithSwapDir.ROUTER_ABI_FILE)
-        self.pool_abi = FileManager.read_abi_from_file(SithSwapDir.POOL_ABI_FILE)
+        self.router_abi = ContractRegistry().get_abi(SithSwapDir.ROUTER_ABI_FILE)
+        self.pool_abi = ContractRegistry().get_abi(SithSwapDir.POOL_ABI_FILE)
@@ -1,23 +1,43 @@
-from typing import Union
+from typing import Union, Optional, Tuple, Dict
 
 from loguru import logger
 
 from contracts.base import TokenBase
 from utils.file_manager import FileManager
+from src.contract_registry import ContractRegistry
 from src.paths import TempFiles
 from src.paths import TOKENS_ABI_DIR
 
 
 class Tokens:
-    def __init__(self):
-        self.all_tokens_data_from_file = FileManager().read_data_from_json_file(TempFiles().TOKENS_JSON_FILE)
-        self.all_tokens = [*self.default_tokens, *self.custom_tokens]
+    """
+    Shared registry of default and custom tokens from tokens.json, indexed by symbol,
+    contract address and protocol. Registry is immutable after load, use
+    'update_tokens_data' to reload it from file.
+    """
+    _instance = None
+
+    all_tokens_data_from_file: Optional[list]
+    all_tokens: Tuple[TokenBase, ...]
+    _general_tokens: Tuple[TokenBase, ...]
+    _tokens_by_symbol: Dict[str, TokenBase]
+    _tokens_by_address: Dict[int, TokenBase]
+    _tokens_by_protocol: Dict[str, Tuple[TokenBase, ...]]
+
+    def __new__(cls):
+        if not cls._instance:
+            instance = super(Tokens, cls).__new__(cls)
+            instance.update_tokens_data()
+
+            cls._instance = instance
+
+        return cls._instance
 
     def _get_token_abi(
             self,
             symbol: str
     ):
-        return FileManager.read_abi_from_file(f"{TOKENS_ABI_DIR}\\{symbol.lower()}.abi")
+        return ContractRegistry().get_abi(f"{TOKENS_ABI_DIR}\\{symbol.lower()}.abi")
 
     def _get_tokens_obj(self, tokens_data: list):
         try:
@@ -29,8 +49,7 @@ class Tokens:
 
     @property
     def general_tokens(self) -> list:
-        symbols = ["eth", "usdt", "usdc", "dai"]
-        return [token for token in self.all_tokens if token.symbol in symbols]
+        return list(self._general_tokens)
 
     @property
     def default_tokens(self) -> list:
@@ -67,31 +86,51 @@ class Tokens:
                 exit(1)
 
     def update_tokens_data(self):
+        """
+        Reload tokens from file and rebuild indexes
+        """
         self.all_tokens_data_from_file = FileManager().read_data_from_json_file(TempFiles().TOKENS_JSON_FILE)
-        self.all_tokens = [*self.default_tokens, *self.custom_tokens]
+        all_tokens = (*self.default_tokens, *self.custom_tokens)
+
+        general_symbols = ["eth", "usdt", "usdc", "dai"]
+
+        tokens_by_symbol = {}
+        tokens_by_address = {}
+        tokens_by_protocol = {}
+        for token in all_tokens:
+            tokens_by_symbol.setdefault(token.symbol.lower(), token)
+            tokens_by_address.setdefault(int(token.contract_address, 16), token)
+
+            for protocol in token.available_protocol:
+                tokens_by_protocol.setdefault(protocol, []).append(token)
+
+        self._general_tokens = tuple(token for token in all_tokens if token.symbol in general_symbols)
+        self._tokens_by_symbol = tokens_by_symbol
+        self._tokens_by_address = tokens_by_address
+        self._tokens_by_protocol = {protocol: tuple(tokens) for protocol, tokens in tokens_by_protocol.items()}
+        self.all_tokens = all_tokens
 
     def get_by_name(self, name_query) -> Union[TokenBase, None]:
-        for token in self.all_tokens:
-            if token.symbol.lower() == name_query.lower():
-                return token
-        logger.error(f"Token {name_query} not found")
-        return None
+        token = self._tokens_by_symbol.get(name_query.lower())
+        if token is None:
+            logger.error(f"Token {name_query} not found")
+
+        return token
 
     def get_cg_id_by_name(self, name_query):
-        for token in self.all_tokens:
-            if token.symbol.lower() == name_query.lower():
-                return token.coin_gecko_id
-        logger.error(f"Token {name_query} not found")
-        return None
+        token = self.get_by_name(name_query)
+        if token is None:
+            return None
+
+        return token.coin_gecko_id
 
     def get_by_contract_address(self, contract_address_query: str):
         try:
-            for token in self.all_tokens:
-                if int(token.contract_address, 16) == int(contract_address_query, 16):
-                    return token
+            token = self._tokens_by_address.get(int(contract_address_query, 16))
+            if token is None:
+                logger.error(f"Token {contract_address_query} not found")
 
-            logger.error(f"Token {contract_address_query} not found")
-            return None
+            return token
 
         except Exception as e:
             logger.error(f"Error while getting token by contract address: {e}")
@@ -101,8 +140,4 @@ class Tokens:
             self,
             protocol: str
     ) -> list:
-        tokens = []
-        for token in self.all_tokens:
-            if protocol.lower() in token.available_protocol:
-                tokens.append(token)
-        return tokens
+        return list(self._tokens_by_protocol.get(protocol.lower(), ()))
@@ -8,7 +8,7 @@ from src import paths
 from src.gecko_pricer import GeckoPricer
 from gui.main_window.tools_window import ToolsWindow
 from gui.main_window.settings_window import SettingsWindow
-from utils.gas_price import GasPrice, get_eth_mainnet_gas_price
+from src.gas_oracle import GasOracle
 
 from PIL import Image
 
@@ -328,19 +328,17 @@ class PriceFrame(customtkinter.CTkFrame):
         self.set_gas_data()
 
     def fetch_gas_data(self) -> tuple[str, str, str]:
-        stark_gp = GasPrice(block_number='pending')
-
         loop = asyncio.get_event_loop()
-        stark_gas_price = loop.run_until_complete(stark_gp.get_stark_block_gas_price())
+        gas_price_snapshot = loop.run_until_complete(GasOracle().get_latest())
 
-        if stark_gas_price is None:
-            stark_gas_price = "N/A"
-        else:
-            stark_gas_price = round(stark_gas_price / 10 ** 9, 2)
+        stark_gas_price = "N/A"
+        l1_gas_price = "N/A"
+
+        if gas_price_snapshot is not None:
+            stark_gas_price = round(gas_price_snapshot.get_gas_price_gwei(), 2)
 
-        l1_gas_price = get_eth_mainnet_gas_price('https://rpc.ankr.com/eth')
-        if l1_gas_price is None:
-            l1_gas_price = "N/A"
+            if gas_price_snapshot.eth_gas_price is not None:
+                l1_gas_price = round(gas_price_snapshot.get_gas_price_gwei(eth_mainnet=True), 2)
 
         eth_price = GeckoPricer.get_simple_price_of_token_sync("ethereum")
         if eth_price is None:
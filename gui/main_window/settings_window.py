@@ -68,6 +68,9 @@ class AppConfigFrame(customtkinter.CTkFrame):
             values=[
                 enums.RunMode.SYNC.upper(),
                 enums.RunMode.ASYNC.upper(),
+                enums.RunMode.LOOP.upper(),
+                enums.RunMode.SHARDED.upper(),
+                enums.RunMode.SCHEDULED.upper(),
             ],
         )
         self.run_mode_combobox.set(run_mode.upper())
@@ -185,13 +188,139 @@ class AppConfigFrame(customtkinter.CTkFrame):
         self.use_proxy_checkbox.grid(row=13, column=0, sticky="w", pady=(0, 20), padx=15)
         self.use_proxy_checkbox.select() if use_proxy else self.use_proxy_checkbox.deselect()
 
+        self.wallets_concurrency_limit_label = customtkinter.CTkLabel(
+            master=self,
+            text="Wallets concurrency (loop/scheduled mode):",
+            font=customtkinter.CTkFont(size=12, weight="bold")
+        )
+        self.wallets_concurrency_limit_label.grid(row=14, column=0, sticky="w", pady=(5, 0), padx=15)
+
+        self.wallets_concurrency_limit_spinbox = FloatSpinbox(
+            master=self,
+            step_size=10,
+            width=110,
+            start_index=1
+        )
+        self.wallets_concurrency_limit_spinbox.entry.configure(
+            textvariable=tkinter.Variable(value=self.app_config.wallets_concurrency_limit))
+
+        self.wallets_concurrency_limit_spinbox.grid(
+            row=15, column=0, sticky="w", pady=(0, 10), padx=15
+        )
+
+        self.shard_processes_num_label = customtkinter.CTkLabel(
+            master=self,
+            text="Shard processes (sharded mode):",
+            font=customtkinter.CTkFont(size=12, weight="bold")
+        )
+        self.shard_processes_num_label.grid(row=16, column=0, sticky="w", pady=(5, 0), padx=15)
+
+        self.shard_processes_num_spinbox = FloatSpinbox(
+            master=self,
+            step_size=1,
+            width=110,
+            start_index=1
+        )
+        self.shard_processes_num_spinbox.entry.configure(
+            textvariable=tkinter.Variable(value=self.app_config.shard_processes_num))
+
+        self.shard_processes_num_spinbox.grid(
+            row=17, column=0, sticky="w", pady=(0, 10), padx=15
+        )
+
+        self.requests_rate_limit_rps_label = customtkinter.CTkLabel(
+            master=self,
+            text="Requests per second (per host):",
+            font=customtkinter.CTkFont(size=12, weight="bold")
+        )
+        self.requests_rate_limit_rps_label.grid(row=18, column=0, sticky="w", pady=(5, 0), padx=15)
+
+        self.requests_rate_limit_rps_spinbox = FloatSpinbox(
+            master=self,
+            step_size=1,
+            width=110,
+            start_index=1
+        )
+        self.requests_rate_limit_rps_spinbox.entry.configure(
+            textvariable=tkinter.Variable(value=self.app_config.requests_rate_limit_rps))
+
+        self.requests_rate_limit_rps_spinbox.grid(
+            row=19, column=0, sticky="w", pady=(0, 10), padx=15
+        )
+
+        self.requests_rate_limit_burst_label = customtkinter.CTkLabel(
+            master=self,
+            text="Requests burst (per host):",
+            font=customtkinter.CTkFont(size=12, weight="bold")
+        )
+        self.requests_rate_limit_burst_label.grid(row=20, column=0, sticky="w", pady=(5, 0), padx=15)
+
+        self.requests_rate_limit_burst_spinbox = FloatSpinbox(
+            master=self,
+            step_size=1,
+            width=110,
+            start_index=1
+        )
+        self.requests_rate_limit_burst_spinbox.entry.configure(
+            textvariable=tkinter.Variable(value=self.app_config.requests_rate_limit_burst))
+
+        self.requests_rate_limit_burst_spinbox.grid(
+            row=21, column=0, sticky="w", pady=(0, 10), padx=15
+        )
+
+        self.extra_rpc_urls_label = customtkinter.CTkLabel(
+            master=self, text="Extra RPC URLs (comma separated):", font=customtkinter.CTkFont(size=12, weight="bold")
+        )
+        self.extra_rpc_urls_label.grid(row=22, column=0, sticky="w", pady=(5, 0), padx=15)
+
+        self.extra_rpc_urls_entry = customtkinter.CTkEntry(
+            master=self,
+            width=280,
+            font=customtkinter.CTkFont(size=12),
+            textvariable=tkinter.StringVar(value=", ".join(self.app_config.extra_rpc_urls)),
+        )
+        self.extra_rpc_urls_entry.grid(row=23, column=0, sticky="w", pady=(0, 10), padx=15)
+
+        rpc_pin_writes = self.app_config.rpc_pin_writes
+        self.rpc_pin_writes_checkbox = customtkinter.CTkCheckBox(
+            master=self,
+            text="Send transactions to main RPC",
+            font=customtkinter.CTkFont(size=12, weight="bold"),
+            checkbox_width=18,
+            checkbox_height=18,
+            text_color="#6fc276" if rpc_pin_writes else "#F47174",
+            onvalue=True,
+            offvalue=False,
+            command=self.rpc_pin_writes_checkbox_event,
+        )
+        self.rpc_pin_writes_checkbox.grid(row=24, column=0, sticky="w", pady=(0, 20), padx=15)
+        self.rpc_pin_writes_checkbox.select() if rpc_pin_writes else self.rpc_pin_writes_checkbox.deselect()
+
+        check_balances_before_run = self.app_config.check_balances_before_run
+        self.check_balances_before_run_checkbox = customtkinter.CTkCheckBox(
+            master=self,
+            text="Check balances before run",
+            font=customtkinter.CTkFont(size=12, weight="bold"),
+            checkbox_width=18,
+            checkbox_height=18,
+            text_color="#6fc276" if check_balances_before_run else "#F47174",
+            onvalue=True,
+            offvalue=False,
+            command=self.check_balances_before_run_checkbox_event,
+        )
+        self.check_balances_before_run_checkbox.grid(row=25, column=0, sticky="w", pady=(0, 20), padx=15)
+        if check_balances_before_run:
+            self.check_balances_before_run_checkbox.select()
+        else:
+            self.check_balances_before_run_checkbox.deselect()
+
         self.save_button = customtkinter.CTkButton(
             master=self,
             text="Save",
             font=customtkinter.CTkFont(size=12, weight="bold"),
             command=self.save_button_event
         )
-        self.save_button.grid(row=14, column=0, sticky="w", pady=(0, 20), padx=15)
+        self.save_button.grid(row=26, column=0, sticky="w", pady=(0, 20), padx=15)
 
     def is_timeout_needed_checkbox_event(self):
         if self.is_timeout_needed_checkbox.get():
@@ -225,6 +354,26 @@ class AppConfigFrame(customtkinter.CTkFrame):
                 text_color="#F47174"
             )
 
+    def rpc_pin_writes_checkbox_event(self):
+        if self.rpc_pin_writes_checkbox.get():
+            self.rpc_pin_writes_checkbox.configure(
+                text_color="#6fc276"
+            )
+        else:
+            self.rpc_pin_writes_checkbox.configure(
+                text_color="#F47174"
+            )
+
+    def check_balances_before_run_checkbox_event(self):
+        if self.check_balances_before_run_checkbox.get():
+            self.check_balances_before_run_checkbox.configure(
+                text_color="#6fc276"
+            )
+        else:
+            self.check_balances_before_run_checkbox.configure(
+                text_color="#F47174"
+            )
+
     def save_button_event(self):
         try:
             app_config = AppConfigSchema(
@@ -232,10 +381,17 @@ class AppConfigFrame(customtkinter.CTkFrame):
                 preserve_logs=bool(self.preserve_logs_checkbox.get()),
                 use_proxy=bool(self.use_proxy_checkbox.get()),
                 rpc_url=self.stark_rpc_url_entry.get(),
+                extra_rpc_urls=self.extra_rpc_urls_entry.get(),
+                rpc_pin_writes=bool(self.rpc_pin_writes_checkbox.get()),
+                check_balances_before_run=bool(self.check_balances_before_run_checkbox.get()),
                 target_gas_price=self.target_eth_gas_price_spinbox.get(),
                 time_to_wait_target_gas_price_sec=self.max_time_to_wait_target_gas_price_spinbox.get(),
                 wallets_amount_to_execute_in_test_mode=self.wallets_amount_to_execute_in_test_mode_spinbox.get(),
                 is_gas_price_wait_timeout_needed=bool(self.is_timeout_needed_checkbox.get()),
+                wallets_concurrency_limit=self.wallets_concurrency_limit_spinbox.get(),
+                shard_processes_num=self.shard_processes_num_spinbox.get(),
+                requests_rate_limit_rps=self.requests_rate_limit_rps_spinbox.get(),
+                requests_rate_limit_burst=self.requests_rate_limit_burst_spinbox.get(),
             )
 
             Storage().update_app_config(app_config)
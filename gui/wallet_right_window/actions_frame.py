@@ -12,6 +12,7 @@ from gui.modules.frames import FloatSpinbox
 from gui.wallet_right_window.wallets_table import WalletsTable
 
 from src.schemas.tasks import TaskBase
+from src.schemas import event_item
 from src.schemas.wallet_data import WalletData
 from src.tasks_executor import task_executor
 from src.repr.repr_manager import repr_manager
@@ -117,10 +118,7 @@ class ActionsFrame(customtkinter.CTkFrame):
         )
 
     def set_task_exec_event_manager_callbacks(self):
-        task_executor.event_manager.on_task_started(self.on_task_started)
-        task_executor.event_manager.on_task_completed(self.on_task_completed)
-        task_executor.event_manager.on_wallet_started(self.on_wallet_started)
-        task_executor.event_manager.on_wallet_completed(self.on_wallet_completed)
+        task_executor.event_manager.on_events_batch(self.on_events_batch)
 
     def get_wallet_actions(
             self,
@@ -291,7 +289,6 @@ class ActionsFrame(customtkinter.CTkFrame):
     def on_wallet_started(self, started_wallet: "WalletData"):
         wallet_item = self.wallets_table.get_wallet_item_by_wallet_id(wallet_id=started_wallet.wallet_id)
         self.active_wallet = wallet_item
-        self.master.update_active_wallet_label(wallet_name=started_wallet.name)
         self.wallets_completed_tasks[started_wallet.wallet_id] = []
         wallet_item.set_wallet_active()
 
@@ -329,13 +326,33 @@ class ActionsFrame(customtkinter.CTkFrame):
             action_item.set_task_empty()
 
         self.active_wallet = None
+
+    def on_events_batch(self, events: list):
+        # Called from listening thread, widgets are updated from Tk thread once per batch
+        self.after(0, self.apply_events_batch, events)
+
+    def apply_events_batch(self, events: list):
+        event_handlers = {
+            event_item.WalletStartedEventItem: self.on_wallet_started,
+            event_item.TaskStartedEventItem: self.on_task_started,
+            event_item.WalletCompletedEventItem: self.on_wallet_completed,
+            event_item.TaskCompletedEventItem: self.on_task_completed,
+        }
+
+        for event in events:
+            try:
+                event_handlers[event.__class__](*event.get_data())
+            except Exception as ex:
+                logger.exception(ex)
+
+        active_wallet_name = self.active_wallet.wallet_data.name if self.active_wallet else "None"
+        self.master.update_active_wallet_label(wallet_name=active_wallet_name)
+
         self.master.update_wallets_stats_labels(
             completed_wallets=self.completed_wallets_amount,
             failed_wallets=self.failed_wallets_amount
         )
 
-        self.master.update_active_wallet_label(wallet_name="None")
-
     def is_wallet_failed(self, wallet_id: UUID) -> bool:
         for key, values in self.wallets_completed_tasks.items():
             value: List[TaskBase]
@@ -401,6 +418,11 @@ class ActionsFrame(customtkinter.CTkFrame):
                 task_exec_event_manager=task_executor.event_manager
             )
 
+        if task_exec_run_mode in (enums.RunMode.LOOP, enums.RunMode.SHARDED, enums.RunMode.SCHEDULED):
+            task_executor.event_manager.set_coalescing()
+        else:
+            task_executor.event_manager.set_coalescing(None)
+
         task_executor.process(
             wallets=wallets,
             tasks=self.tasks,
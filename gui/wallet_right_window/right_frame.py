@@ -1,8 +1,11 @@
+import asyncio
+import threading as th
 import tkinter.messagebox
 import tkinter.filedialog
 from typing import List, Union, TYPE_CHECKING
 
 import customtkinter
+from loguru import logger
 
 from gui.wallet_right_window.wallet_window import WalletWindow
 from gui.wallet_right_window.wallets_table import WalletsTable
@@ -13,6 +16,9 @@ from src import enums
 from src.schemas.wallet_data import WalletData
 from src.wallet_manager import WalletManager
 from src.storage import Storage
+from src.balance_scanner import BalanceScanner
+from src.balance_scanner import BalanceSnapshot
+from src.transport_registry import TransportRegistry
 
 if TYPE_CHECKING:
     from gui.main_window.main import MainWindow
@@ -78,19 +84,29 @@ class RightFrame(customtkinter.CTkFrame):
         )
         self.remove_button.grid(row=0, column=3, padx=0, pady=10, sticky="wn")
 
+        self.balances_button = customtkinter.CTkButton(
+            self.button_frame,
+            text="Balances",
+            font=customtkinter.CTkFont(size=12, weight="bold"),
+            width=100,
+            height=30,
+            command=self.balances_button_clicked,
+        )
+        self.balances_button.grid(row=0, column=4, padx=(20, 0), pady=10, sticky="wn")
+
         self.mode_label = customtkinter.CTkLabel(
             self.button_frame,
             text=f"Mode: {Storage().app_config.run_mode.value.title()}",
             font=customtkinter.CTkFont(size=12, weight="bold"),
         )
-        self.mode_label.grid(row=0, column=4, padx=20, pady=10, sticky="wn")
+        self.mode_label.grid(row=0, column=5, padx=20, pady=10, sticky="wn")
 
         self.selected_wallets_label = customtkinter.CTkLabel(
             self.button_frame,
             text="Selected: 0",
             font=customtkinter.CTkFont(size=12, weight="bold"),
         )
-        self.selected_wallets_label.grid(row=0, column=5, padx=20, pady=10, sticky="wn")
+        self.selected_wallets_label.grid(row=0, column=6, padx=20, pady=10, sticky="wn")
 
         self.completed_wallets_stats_label = customtkinter.CTkLabel(
             self.button_frame,
@@ -98,7 +114,7 @@ class RightFrame(customtkinter.CTkFrame):
             font=customtkinter.CTkFont(size=12, weight="bold"),
         )
         self.completed_wallets_stats_label.grid(
-            row=0, column=6, padx=20, pady=10, sticky="wn"
+            row=0, column=7, padx=20, pady=10, sticky="wn"
         )
 
         self.failed_wallets_stats_label = customtkinter.CTkLabel(
@@ -107,7 +123,7 @@ class RightFrame(customtkinter.CTkFrame):
             font=customtkinter.CTkFont(size=12, weight="bold"),
         )
         self.failed_wallets_stats_label.grid(
-            row=0, column=7, padx=20, pady=10, sticky="wn"
+            row=0, column=8, padx=20, pady=10, sticky="wn"
         )
 
         self.active_wallet_label = customtkinter.CTkLabel(
@@ -115,7 +131,7 @@ class RightFrame(customtkinter.CTkFrame):
             text="Active wallet: None",
             font=customtkinter.CTkFont(size=12, weight="bold"),
         )
-        self.active_wallet_label.grid(row=0, column=8, padx=20, pady=10, sticky="wn")
+        self.active_wallet_label.grid(row=0, column=9, padx=20, pady=10, sticky="wn")
 
         self.actions_frame = ActionsFrame(self)
         self.actions_frame.grid(row=9, column=0, padx=20, pady=10, sticky="nsew")
@@ -201,6 +217,34 @@ class RightFrame(customtkinter.CTkFrame):
         self.wallets_table.remove_all_wallets()
         self.wallets_table.update_selected_wallets_labels()
 
+    def balances_button_clicked(self):
+        wallets = self.wallets_table.selected_wallets or self.wallets
+        if not wallets:
+            return
+
+        self.balances_button.configure(state="disabled", text="Scanning...")
+        th.Thread(target=self.scan_balances, args=(wallets,), daemon=True).start()
+
+    def scan_balances(self, wallets: List[WalletData]):
+        loop = asyncio.new_event_loop()
+
+        try:
+            balance_snapshot = loop.run_until_complete(BalanceScanner().scan(wallets))
+        except Exception as ex:
+            logger.error(f"Error while scanning balances: {ex}")
+            balance_snapshot = None
+        finally:
+            loop.run_until_complete(TransportRegistry().close_sessions())
+            loop.close()
+
+        self.after(0, self.on_balances_scanned, balance_snapshot)
+
+    def on_balances_scanned(self, balance_snapshot: Union[BalanceSnapshot, None]):
+        self.balances_button.configure(state="normal", text="Balances")
+
+        if balance_snapshot is not None:
+            self.wallets_table.set_balance_snapshot(balance_snapshot)
+
     def add_wallet_button_clicked(self):
         if self.add_wallet_window is not None:
             return
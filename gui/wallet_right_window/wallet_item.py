@@ -1,4 +1,4 @@
-from typing import Union, TYPE_CHECKING
+from typing import Union, Dict, TYPE_CHECKING
 
 import customtkinter
 from PIL import Image
@@ -155,6 +155,19 @@ class WalletItem(customtkinter.CTkFrame):
             sticky="e"
         )
 
+        self.balance_label = customtkinter.CTkLabel(
+            self.frame,
+            text="",
+            font=customtkinter.CTkFont(size=12, weight="bold")
+        )
+        self.balance_label.grid(
+            row=0,
+            column=5,
+            padx=(0, 0),
+            pady=pad_y,
+            sticky="w"
+        )
+
         # EDIT WALLET
         self.edit_window = None
 
@@ -221,6 +234,22 @@ class WalletItem(customtkinter.CTkFrame):
         self.proxy_address_label.grid(padx=(padx_proxy, 0))
         self.wallet_type_label.configure(text=f"{wallet_data.type.title()} (Cairo: {wallet_data.cairo_version})")
 
+    def set_balances(self, balances: Dict[str, float]):
+        if not balances:
+            self.balance_label.configure(text="")
+            return
+
+        eth_balance = balances.get("eth")
+        other_tokens_amount = len([
+            symbol for symbol, balance in balances.items() if symbol != "eth" and balance > 0
+        ])
+
+        text = f"{eth_balance:.4f} ETH" if eth_balance is not None else "- ETH"
+        if other_tokens_amount:
+            text += f" +{other_tokens_amount}"
+
+        self.balance_label.configure(text=text)
+
     def edit_wallet_button_clicked(self):
         if self.edit_window is not None:
             return
@@ -6,6 +6,7 @@ import customtkinter
 from gui.wallet_right_window.wallet_item import WalletItem
 from gui.wallet_right_window.frames import WalletsTableTop
 from src.schemas.wallet_data import WalletData
+from src.balance_scanner import BalanceSnapshot
 
 if TYPE_CHECKING:
     from gui.wallet_right_window.right_frame import RightFrame
@@ -52,6 +53,16 @@ class WalletsTable(customtkinter.CTkScrollableFrame):
 
         return None
 
+    def set_balance_snapshot(self, balance_snapshot: BalanceSnapshot):
+        """
+        Show scanned balances of wallets
+        Args:
+            balance_snapshot: scanned balances
+        Returns: None
+        """
+        for wallet_item in self.wallets_items:
+            wallet_item.set_balances(balance_snapshot.get_wallet_balances(wallet_item.wallet_data))
+
     def update_selected_wallets_labels(self):
         self.master.selected_wallets_label.configure(text=f"Selected: {len(self.selected_wallets)}")
 
@@ -1,8 +1,11 @@
 import random
-import time
+import asyncio
 from typing import Union
+from typing import List
 from typing import TYPE_CHECKING
 from typing import Callable
+from typing import Optional
+from typing import Any
 
 from starknet_py.net.account.account import Account
 from starknet_py.net.models import StarknetChainId
@@ -11,7 +14,6 @@ from starknet_py.contract import Contract
 from starknet_py.net.client_errors import ClientError
 from starknet_py.net.client_models import Call, TransactionReceipt
 from starknet_py.hash.selector import get_selector_from_name
-from starknet_py.net.http_client import HttpMethod
 from loguru import logger
 
 from utils.key_manager.key_manager import get_key_pair_from_pk
@@ -21,9 +23,23 @@ from src.schemas.action_models import ModuleExecutionResult, TransactionPayloadD
 from src.gecko_pricer import GeckoPricer
 from src.storage import Storage
 from src.execution_storage import ExecutionStorage
+from src.wallet_context import get_wallet_context
+from src.nonce_manager import NonceManager
+from src.receipt_tracker import ReceiptTracker
+from src.transaction_builder import InvokeTransactionBuilder
+from src.transaction_pipeline import TransactionPipeline
+from src.gas_oracle import GasOracle
+from src.metadata_cache import MetadataCache
+from src.quote_engine import QuoteEngine
+from src.quote_engine import get_sorted_reserves
+from src.quote_engine import get_amount_out_constant_product
+from src.contract_registry import ContractRegistry
+from src.prefetch import PrefetchRead
+from src.prefetch import PrefetchResult
+from src.prefetch import run_prefetch
+from src import pacer
 from src import paths
 from src import enums
-from utils.file_manager import FileManager
 from utils.misc import decode_wallet_version
 from contracts.tokens.main import Tokens
 from contracts.base import TokenBase
@@ -52,14 +68,17 @@ class ModuleBase:
         self.gecko_pricer = GeckoPricer(client=self.client)
         self.storage = Storage()
         self.tokens = Tokens()
+        self.metadata_cache = MetadataCache()
         self.is_task_virtual = getattr(task, 'is_virtual', False)
 
         self.task = task
         self.wallet_data = wallet_data
+        self.wallet_context = get_wallet_context(wallet_data)
 
         self.execution_storage = ExecutionStorage()
 
         self.module_execution_result = ModuleExecutionResult(test_mode=self.task.test_mode)
+        self.prefetched = PrefetchResult()
 
     def i16(
             self,
@@ -72,6 +91,59 @@ class ModuleBase:
         self.module_execution_result.execution_status = False
         self.module_execution_result.execution_info += msg + "\n"
 
+    def get_prefetch_reads(self) -> List[PrefetchRead]:
+        """
+        Returns independent reads needed to build transaction payload data (balances, decimals, quotes,
+        allowances). Reimplemented in modules, reads are run concurrently by 'prefetch'.
+        :return:
+        """
+        return []
+
+    def get_token_prefetch_reads(
+            self,
+            token: TokenBase,
+            suffix: str
+    ) -> List[PrefetchRead]:
+        """
+        Returns balance and decimals reads of a token, named 'balance_<suffix>' and 'decimals_<suffix>'.
+        :param token:
+        :param suffix:
+        :return:
+        """
+        return [
+            PrefetchRead(
+                name=f'balance_{suffix}',
+                fetch=lambda: self.get_token_balance(
+                    token_address=token.contract_address,
+                    account=self.account
+                )
+            ),
+            PrefetchRead(
+                name=f'decimals_{suffix}',
+                fetch=lambda: self.get_token_decimals(
+                    contract_address=token.contract_address,
+                    abi=token.abi,
+                    provider=self.account
+                )
+            ),
+        ]
+
+    async def prefetch(self) -> bool:
+        """
+        Runs declared prefetch reads concurrently and stores results in 'prefetched'.
+        :return: False if any required read failed
+        """
+        self.prefetched = await run_prefetch(self.get_prefetch_reads())
+
+        if not self.prefetched.is_ok:
+            self.log_error(f"Prefetch failed: {self.prefetched.get_error_message()}")
+            return False
+
+        if self.prefetched.errors:
+            logger.warning(f"Optional prefetch reads failed: {self.prefetched.get_error_message()}")
+
+        return True
+
     async def get_cairo_version_for_txn_execution(
             self,
             account: Account,
@@ -81,6 +153,31 @@ class ModuleBase:
         :param account:
         :return:
         """
+        is_wallet_account = account.address == self.wallet_context.account.address
+        if is_wallet_account and self.wallet_context.get_chain_state("cairo_version") is not None:
+            return self.wallet_context.get_chain_state("cairo_version")
+
+        cairo_version = await self.metadata_cache.get_or_fetch(
+            contract_address=account.address,
+            selector='getVersion',
+            fetch=lambda: self.fetch_cairo_version(account=account),
+            ttl_sec=config.METADATA_ACCOUNT_VERSION_TTL_SEC
+        )
+
+        if is_wallet_account and cairo_version is not None:
+            self.wallet_context.set_chain_state("cairo_version", cairo_version)
+
+        return cairo_version
+
+    async def fetch_cairo_version(
+            self,
+            account: Account,
+    ) -> Union[int, None]:
+        """
+        Fetches the Cairo version of the account contract from the chain.
+        :param account:
+        :return:
+        """
         try:
             account_contract = await self.get_account_contract(account=account)
             version = await account_contract.functions['getVersion'].call()
@@ -89,10 +186,7 @@ class ModuleBase:
 
             major, minor, patch = version_decoded.split('.')
 
-            if int(major) > 0 or int(minor) >= 3:
-                return 1
-
-            return 0
+            return 1 if int(major) > 0 or int(minor) >= 3 else 0
 
         except ClientError:
             return None
@@ -114,31 +208,15 @@ class ModuleBase:
 
     async def get_eth_mainnet_gas_price(self) -> Union[int, None]:
         """
-        Returns the current gas price on Ethereum mainnet. Rpc url is taken from the app_config.json.
+        Returns the current gas price on Ethereum mainnet from the shared gas oracle.
         :return:
         """
-        try:
-            url = self.storage.app_config.eth_mainnet_rpc_url
-
-            payload = {
-                "jsonrpc": "2.0",
-                "method": "eth_gasPrice",
-                "params": [],
-                "id": "1"
-            }
-
-            resp = await self.client._client.request(
-                address=url,
-                http_method=HttpMethod.POST,
-                payload=payload,
-                params=None
-            )
-
-            return self.i16(resp['result'])
-
-        except ClientError:
+        gas_price_snapshot = await GasOracle().get_latest()
+        if gas_price_snapshot is None:
             return None
 
+        return gas_price_snapshot.eth_gas_price
+
     async def gas_price_check_loop(
             self,
             target_price_wei: int,
@@ -153,40 +231,16 @@ class ModuleBase:
         :return:
         """
 
-        current_gas_price = await self.get_eth_mainnet_gas_price()
-        if current_gas_price is None:
-            logger.error(f"Error while getting gas price, waiting 1 min for rate limit to reset or change ETH RPC URL")
-            time.sleep(60)
-
-            current_gas_price = await self.get_eth_mainnet_gas_price()
-            if current_gas_price is None:
-                return False, current_gas_price
-
-        if current_gas_price <= target_price_wei:
-            return True, current_gas_price
-
-        msg = f"Waiting for gas price to be lower than {target_price_wei / 10 ** 9} Gwei. "
-        if is_timeout_needed is True:
-            msg += f"Timeout: {time_out_sec} sec."
-
-        logger.info(msg)
-
-        start_time = time.time()
-        delay = config.DEFAULT_DELAY_SEC
-        while True:
-            current_gas_price = await self.get_eth_mainnet_gas_price()
-            if current_gas_price is None:
-                continue
-
-            if current_gas_price <= target_price_wei:
-                return True, current_gas_price
-
-            if is_timeout_needed is True:
-                delay *= 2
-                if time.time() - start_time > time_out_sec:
-                    return False, current_gas_price
+        gas_price_snapshot = await GasOracle().below(
+            target_price_gwei=target_price_wei / 10 ** 9,
+            eth_mainnet=True,
+            timeout_sec=time_out_sec if is_timeout_needed is True else None,
+        )
+        if gas_price_snapshot is not None:
+            return True, gas_price_snapshot.eth_gas_price
 
-            time.sleep(delay)
+        current_gas_price = await self.get_eth_mainnet_gas_price()
+        return False, current_gas_price
 
     def get_random_amount_out_of_token(
             self,
@@ -249,13 +303,13 @@ class ModuleBase:
             provider
     ) -> Contract:
         """
-        Returns a Contract object.
+        Returns a Contract object bound to the provider, abi is parsed once per process.
         :param address:
         :param abi:
         :param provider:
         :return:
         """
-        return Contract(
+        return ContractRegistry().get_contract(
             address=address,
             abi=abi,
             provider=provider
@@ -268,7 +322,30 @@ class ModuleBase:
             provider
     ) -> Union[int, None]:
         """
-        Returns the decimals of a token.
+        Returns the decimals of a token, cached in metadata cache.
+        :param contract_address:
+        :param abi:
+        :param provider:
+        :return:
+        """
+        return await self.metadata_cache.get_or_fetch(
+            contract_address=contract_address,
+            selector='decimals',
+            fetch=lambda: self.fetch_token_decimals(
+                contract_address=contract_address,
+                abi=abi,
+                provider=provider
+            )
+        )
+
+    async def fetch_token_decimals(
+            self,
+            contract_address,
+            abi,
+            provider
+    ) -> Union[int, None]:
+        """
+        Fetches the decimals of a token from the chain.
         :param contract_address:
         :param abi:
         :param provider:
@@ -302,7 +379,24 @@ class ModuleBase:
             account: Account
     ) -> Union[int, None]:
         """
-        Returns the decimals of a token by calling the contract.
+        Returns the decimals of a token by calling the contract, cached in metadata cache.
+        :param token_address:
+        :param account:
+        :return:
+        """
+        return await self.metadata_cache.get_or_fetch(
+            contract_address=token_address,
+            selector='decimals',
+            fetch=lambda: self.fetch_tokens_decimals_by_call(token_address=token_address, account=account)
+        )
+
+    async def fetch_tokens_decimals_by_call(
+            self,
+            token_address: int,
+            account: Account
+    ) -> Union[int, None]:
+        """
+        Fetches the decimals of a token by calling the contract.
         :param token_address:
         :param account:
         :return:
@@ -359,6 +453,64 @@ class ModuleBase:
             ]
         )
 
+    async def get_pool_reserves(
+            self,
+            pool_key: tuple,
+            fetch: Callable
+    ) -> Union[Any, None]:
+        """
+        Returns pool reserves read once per block and shared between wallets, None on error.
+        :param pool_key: DEX name and pool identifier
+        :param fetch: coroutine function reading reserves of the pool
+        :return:
+        """
+        try:
+            return await QuoteEngine().get_reserves(
+                pool_key=pool_key,
+                client=self.client,
+                fetch=fetch
+            )
+
+        except Exception as ex:
+            logger.debug(f"Error while getting reserves of pool {pool_key}: {ex}")
+            return None
+
+    async def get_constant_product_amount_out(
+            self,
+            pool_key: tuple,
+            token_in_address: str,
+            amount_in_wei: int,
+            fetch_reserves: Callable
+    ) -> Union[int, None]:
+        """
+        Returns swap output of constant product (Uniswap V2 like) pool computed locally from cached reserves,
+        None if reserves are not available.
+        :param pool_key: DEX name and pair address
+        :param token_in_address: input token address
+        :param amount_in_wei: input amount in wei
+        :param fetch_reserves: coroutine function returning token0 address, reserve0 and reserve1 of the pair
+        :return:
+        """
+        reserves = await self.get_pool_reserves(pool_key=pool_key, fetch=fetch_reserves)
+        if reserves is None:
+            return None
+
+        token0_address, reserve0, reserve1 = reserves
+        reserve_in, reserve_out = get_sorted_reserves(
+            token_in=self.i16(token_in_address),
+            token0=token0_address,
+            reserve0=reserve0,
+            reserve1=reserve1
+        )
+
+        amount_out_wei = get_amount_out_constant_product(
+            amount_in=amount_in_wei,
+            reserve_in=reserve_in,
+            reserve_out=reserve_out
+        )
+
+        return amount_out_wei or None
+
     async def get_eth_balance(
             self,
             account: Account
@@ -430,30 +582,55 @@ class ModuleBase:
         except ClientError:
             return 0
 
-    async def execute_call_transaction(
+    def get_nonce_manager(
+            self,
+            account: Account
+    ) -> Optional[NonceManager]:
+        """
+        Returns local nonce manager of the wallet account, None for other accounts.
+        :param account:
+        :return:
+        """
+        if account.address != self.wallet_context.account.address:
+            return None
+
+        return self.wallet_context.nonce_manager
+
+    def get_transaction_builder(
             self,
             account: Account,
             calls: list,
-            max_fee: Union[int, None],
-            auto_estimate: Union[bool, None],
-            cairo_version: int
-    ) -> tuple:
+            cairo_version: int,
+            max_fee: Union[int, None] = None
+    ) -> InvokeTransactionBuilder:
         """
-        Executes a transaction.
+        Returns invoke transaction builder, fee is estimated if max fee is not forced.
         :param account:
         :param calls:
-        :param max_fee:
-        :param auto_estimate:
         :param cairo_version:
+        :param max_fee: forced max fee
+        :return:
+        """
+        return InvokeTransactionBuilder(
+            account=account,
+            calls=calls,
+            cairo_version=cairo_version,
+            max_fee=max_fee,
+            nonce_manager=self.get_nonce_manager(account=account)
+        )
+
+    async def send_built_transaction(
+            self,
+            transaction_builder: InvokeTransactionBuilder
+    ) -> tuple:
+        """
+        Sends transaction of a builder through signing and submission stages of transaction pipeline,
+        estimated fee of the builder is reused.
+        :param transaction_builder:
         :return: bool, response
         """
         try:
-            resp = await account.execute(
-                calls=calls,
-                max_fee=max_fee,
-                cairo_version=cairo_version,
-                auto_estimate=auto_estimate
-            )
+            resp = await TransactionPipeline().submit(transaction_builder=transaction_builder)
             return True, resp
 
         except Exception as ex:
@@ -486,21 +663,38 @@ class ModuleBase:
             time_out_sec: int
     ) -> Union[TransactionReceipt, None]:
         """
-        Waits for a transaction receipt.
+        Waits for a transaction receipt in shared receipt tracker.
         :param tx_hash:
         :param time_out_sec:
-        :return:
+        :return: receipt of accepted transaction, None if transaction is failed or timed out
         """
+        receipt_tracker = ReceiptTracker()
+
         try:
-            return await self.client.wait_for_tx(
+            receipt = await receipt_tracker.wait_for_receipt(
                 tx_hash=tx_hash,
-                check_interval=5,
-                retries=(time_out_sec // 5) + 1
+                timeout_sec=time_out_sec,
+                transport_key=self.wallet_context.proxy_manager.get_transport_key()
             )
         except Exception as ex:
             logger.error(f"Error while waiting for txn receipt: {ex}")
             return None
 
+        if receipt is None:
+            return None
+
+        failure_reason = receipt_tracker.get_failure_reason(receipt)
+        if failure_reason is not None:
+            logger.error(f"Txn {hex(tx_hash)} failed: {failure_reason}")
+
+            # Rejected transaction doesn't use its nonce, local nonce is ahead of chain
+            if receipt_tracker.is_rejected(receipt):
+                self.wallet_context.nonce_manager.invalidate()
+
+            return None
+
+        return receipt
+
     async def get_account_contract(
             self,
             account: Account,
@@ -511,13 +705,13 @@ class ModuleBase:
         :return:
         """
         try:
-            acc_abi = FileManager.read_abi_from_file(paths.ACCOUNT_ABI_FILE)
+            acc_abi = ContractRegistry().get_abi(paths.ACCOUNT_ABI_FILE)
             if acc_abi is None:
                 return None
 
-            return Contract(
+            return self.get_contract(
                 address=account.address,
-                abi=FileManager.read_abi_from_file(paths.ACCOUNT_ABI_FILE),
+                abi=acc_abi,
                 provider=account
             )
 
@@ -532,9 +726,12 @@ class ModuleBase:
             auto_estimate: bool = False
     ) -> Union[Invoke, None]:
 
+        nonce_manager = self.get_nonce_manager(account=account)
+
         try:
             return await account.sign_invoke_transaction(
                 calls=calls,
+                nonce=await nonce_manager.get_nonce(account.client) if nonce_manager is not None else None,
                 max_fee=0 if auto_estimate is False else None,
                 cairo_version=cairo_version,
                 auto_estimate=auto_estimate if auto_estimate is True else None
@@ -542,6 +739,10 @@ class ModuleBase:
 
         except ClientError as ex:
             logger.error(f"Error while signing transaction: {ex}")
+
+            if nonce_manager is not None:
+                nonce_manager.invalidate()
+
             return None
 
     async def build_txn_payload_data(self) -> TransactionPayloadData:
@@ -593,7 +794,7 @@ class ModuleBase:
             if result.execution_status is True:
                 return result
 
-            time.sleep(1)
+            await pacer.retry_delay()
         else:
             logger.error(f"Failed to send txn after {retries} attempts")
             return result
@@ -618,27 +819,35 @@ class ModuleBase:
             self.log_error("Error while getting Cairo version")
             return self.module_execution_result
 
-        signed_invoke_transaction = await self.sign_invoke_transaction(
+        max_fee = int(self.task.max_fee) * 10 ** 9 if self.task.forced_gas_limit is True else None
+
+        transaction_builder = self.get_transaction_builder(
             account=account,
             calls=calls,
             cairo_version=cairo_version,
-            auto_estimate=not self.task.forced_gas_limit
+            max_fee=max_fee
         )
-        if signed_invoke_transaction is None:
-            self.log_error("Error while signing transaction (Usually caused by incorrect payload data)")
-            return self.module_execution_result
 
-        time.sleep(1)
-        estimate_transaction = await self.get_estimated_transaction_fee(
-            account=account,
-            transaction=signed_invoke_transaction
+        # Balance is read while transaction waits in signing and estimation stages
+        estimate_transaction, wallet_eth_balance = await asyncio.gather(
+            TransactionPipeline().estimate(transaction_builder=transaction_builder),
+            self.get_eth_balance(account=account),
+            return_exceptions=True
         )
-        if estimate_transaction is None:
-            self.log_error("Transaction estimation failed")
+
+        if isinstance(estimate_transaction, ClientError):
+            self.log_error(
+                f"Transaction estimation failed (Usually caused by incorrect payload data): {estimate_transaction.message}"
+            )
             return self.module_execution_result
 
+        if isinstance(estimate_transaction, Exception):
+            raise estimate_transaction
+
+        if isinstance(wallet_eth_balance, Exception):
+            raise wallet_eth_balance
+
         estimate_gas_decimals = estimate_transaction / 10 ** 18
-        wallet_eth_balance = await self.get_eth_balance(account=account)
         if wallet_eth_balance is None:
             self.log_error("Error while getting wallet ETH balance")
             return self.module_execution_result
@@ -656,21 +865,13 @@ class ModuleBase:
         estimate_msg = f"Transaction estimation success, overall fee: {estimate_gas_decimals} ETH."
         logger.success(estimate_msg)
 
-        max_fee = int(self.task.max_fee) * 10 ** 9 if self.task.forced_gas_limit is True else None
-
         if self.task.test_mode is True:
             self.module_execution_result.execution_info += estimate_msg
             self.module_execution_result.execution_status = True
             logger.info(f"Test mode enabled. Skipping transaction")
             return self.module_execution_result
 
-        response_data = await self.execute_call_transaction(
-            account=account,
-            calls=calls,
-            max_fee=max_fee,
-            cairo_version=cairo_version,
-            auto_estimate=not self.task.forced_gas_limit
-        )
+        response_data = await self.send_built_transaction(transaction_builder=transaction_builder)
         response_status, response = response_data
         if response_status is False:
             self.log_error(f"Error while sending txn, {response}")
@@ -759,19 +960,28 @@ class SwapModuleBase(ModuleBase):
             self.token_x_decimals = None
             self.token_y_decimals = None
 
+    def get_prefetch_reads(self) -> List[PrefetchRead]:
+        """
+        Returns balances and decimals reads for both tokens.
+        :return:
+        """
+        return [
+            *self.get_token_prefetch_reads(token=self.coin_x, suffix='x'),
+            *self.get_token_prefetch_reads(token=self.coin_y, suffix='y'),
+        ]
+
     async def set_fetched_tokens_data(self):
         """
         Fetches initial balances and token decimals for both tokens.
         :return:
         """
-        self.initial_balance_x_wei = await self.get_token_balance(
-            token_address=self.coin_x.contract_address,
-            account=self.account
-        )
-        self.initial_balance_y_wei = await self.get_token_balance(
-            token_address=self.coin_y.contract_address,
-            account=self.account
-        )
+        await self.prefetch()
+
+        self.initial_balance_x_wei = self.prefetched.get('balance_x')
+        self.initial_balance_y_wei = self.prefetched.get('balance_y')
+
+        self.token_x_decimals = self.prefetched.get('decimals_x')
+        self.token_y_decimals = self.prefetched.get('decimals_y')
 
         self.execution_storage.set_pre_execution_data(
             wallet_id=self.wallet_data.wallet_id,
@@ -782,17 +992,6 @@ class SwapModuleBase(ModuleBase):
             },
         )
 
-        self.token_x_decimals = await self.get_token_decimals(
-            contract_address=self.coin_x.contract_address,
-            abi=self.coin_x.abi,
-            provider=self.account
-        )
-        self.token_y_decimals = await self.get_token_decimals(
-            contract_address=self.coin_y.contract_address,
-            abi=self.coin_y.abi,
-            provider=self.account
-        )
-
     def check_local_tokens_data(self) -> bool:
         """
         Checks if token decimals are fetched.
@@ -802,6 +1001,10 @@ class SwapModuleBase(ModuleBase):
             logger.error(f"Token decimals not fetched")
             return False
 
+        if self.initial_balance_x_wei is None or self.initial_balance_y_wei is None:
+            logger.error(f"Token balances not fetched")
+            return False
+
     async def calculate_amount_out_from_balance(
             self,
             coin_x: TokenBase
@@ -960,30 +1163,28 @@ class LiquidityModuleBase(ModuleBase):
             self.token_x_decimals = None
             self.token_y_decimals = None
 
+    def get_prefetch_reads(self) -> List[PrefetchRead]:
+        """
+        Returns balances and decimals reads for both tokens.
+        :return:
+        """
+        return [
+            *self.get_token_prefetch_reads(token=self.coin_x, suffix='x'),
+            *self.get_token_prefetch_reads(token=self.coin_y, suffix='y'),
+        ]
+
     async def set_fetched_tokens_data(self):
         """
         Fetches initial balances and token decimals for both tokens.
         :return:
         """
-        self.initial_balance_x_wei = await self.get_token_balance(
-            token_address=self.coin_x.contract_address,
-            account=self._account
-        )
-        self.initial_balance_y_wei = await self.get_token_balance(
-            token_address=self.coin_y.contract_address,
-            account=self._account
-        )
+        await self.prefetch()
 
-        self.token_x_decimals = await self.get_token_decimals(
-            contract_address=self.coin_x.contract_address,
-            abi=self.coin_x.abi,
-            provider=self._account
-        )
-        self.token_y_decimals = await self.get_token_decimals(
-            contract_address=self.coin_y.contract_address,
-            abi=self.coin_y.abi,
-            provider=self._account
-        )
+        self.initial_balance_x_wei = self.prefetched.get('balance_x')
+        self.initial_balance_y_wei = self.prefetched.get('balance_y')
+
+        self.token_x_decimals = self.prefetched.get('decimals_x')
+        self.token_y_decimals = self.prefetched.get('decimals_y')
 
     def check_local_tokens_data(self) -> bool:
         """
@@ -994,6 +1195,10 @@ class LiquidityModuleBase(ModuleBase):
             logger.error(f"Token decimals not fetched")
             return False
 
+        if self.initial_balance_x_wei is None or self.initial_balance_y_wei is None:
+            logger.error(f"Token balances not fetched")
+            return False
+
     async def calculate_amount_out_from_balance(
             self,
             coin_x: TokenBase
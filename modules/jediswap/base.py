@@ -1,4 +1,6 @@
+import asyncio
 from typing import Union
+from typing import Tuple
 from typing import TYPE_CHECKING
 
 from loguru import logger
@@ -52,13 +54,21 @@ class JediSwapBase(ModuleBase):
             router_contract
     ) -> Union[int, None]:
         """
-        Get the amount in for coin pair, using router contract.
+        Get the amount in for coin pair, computed from cached pair reserves, router contract is used as fallback.
         :param amount_out_wei:
         :param coin_x_obj:
         :param coin_y_obj:
         :param router_contract:
         :return:
         """
+        amount_in_wei = await self.get_local_amount_in(
+            amount_out_wei=amount_out_wei,
+            coin_x_obj=coin_x_obj,
+            coin_y_obj=coin_y_obj
+        )
+        if amount_in_wei is not None:
+            return amount_in_wei
+
         path = [int(coin_x_obj.contract_address, 16),
                 int(coin_y_obj.contract_address, 16)]
 
@@ -72,3 +82,83 @@ class JediSwapBase(ModuleBase):
         except Exception as e:
             self.log_error(f'Error while getting amount in: {e}')
             return None
+
+    async def get_local_amount_in(
+            self,
+            amount_out_wei: int,
+            coin_x_obj: TokenBase,
+            coin_y_obj: TokenBase
+    ) -> Union[int, None]:
+        """
+        Get the amount in for coin pair from pair reserves, read once per block for all wallets.
+        :param amount_out_wei:
+        :param coin_x_obj:
+        :param coin_y_obj:
+        :return:
+        """
+        try:
+            pair_address = await self.get_pair_address(coin_x_obj=coin_x_obj, coin_y_obj=coin_y_obj)
+            if pair_address is None:
+                return None
+
+            return await self.get_constant_product_amount_out(
+                pool_key=('jediswap', pair_address),
+                token_in_address=coin_x_obj.contract_address,
+                amount_in_wei=amount_out_wei,
+                fetch_reserves=lambda: self.fetch_pair_reserves(pair_address=pair_address)
+            )
+
+        except Exception as e:
+            logger.debug(f'Error while calculating amount in from reserves: {e}')
+            return None
+
+    async def get_pair_address(
+            self,
+            coin_x_obj: TokenBase,
+            coin_y_obj: TokenBase
+    ) -> Union[int, None]:
+        """
+        Get the pair address from factory, cached in metadata cache.
+        :param coin_x_obj:
+        :param coin_y_obj:
+        :return:
+        """
+        token_addresses = sorted([self.i16(coin_x_obj.contract_address), self.i16(coin_y_obj.contract_address)])
+
+        async def fetch():
+            response = await self.factory_contract.functions["get_pair"].call(*token_addresses)
+            return response.pair or None
+
+        return await self.metadata_cache.get_or_fetch(
+            contract_address=self.factory_contract.address,
+            selector='get_pair',
+            args=token_addresses,
+            fetch=fetch
+        )
+
+    async def fetch_pair_reserves(self, pair_address: int) -> Tuple[int, int, int]:
+        """
+        Fetch token0 address and reserves of pair.
+        :param pair_address:
+        :return: token0 address, reserve0, reserve1
+        """
+        pool_contract = self.get_contract(
+            address=pair_address,
+            abi=self.jedi_contracts.pool_abi,
+            provider=self.account
+        )
+
+        async def fetch_token0():
+            response = await pool_contract.functions["token0"].call()
+            return response.address
+
+        token0_address, reserves = await asyncio.gather(
+            self.metadata_cache.get_or_fetch(
+                contract_address=pair_address,
+                selector='token0',
+                fetch=fetch_token0
+            ),
+            pool_contract.functions["get_reserves"].call()
+        )
+
+        return token0_address, reserves.reserve0, reserves.reserve1
@@ -137,14 +137,14 @@ class JediSwapRemoveLiquidity(JediSwapBase, LiquidityModuleBase):
         :return:
         """
         try:
-            response = await self.factory_contract.functions['get_pair'].call(
-                self.i16(self.coin_x.contract_address),
-                self.i16(self.coin_y.contract_address)
+            pool_addr = await self.metadata_cache.get_or_fetch(
+                contract_address=self.factory_contract.address,
+                selector='get_pair',
+                args=(self.i16(self.coin_x.contract_address), self.i16(self.coin_y.contract_address)),
+                fetch=self.fetch_pool_address
             )
 
-            pool_addr = response.pair
-
-            if pool_addr == 0:
+            if pool_addr is None:
                 self.log_error(f"Can not find pool address for "
                                f"{self.coin_x.symbol.upper()} and {self.coin_y.symbol.upper()}")
                 return None
@@ -155,6 +155,18 @@ class JediSwapRemoveLiquidity(JediSwapBase, LiquidityModuleBase):
             self.log_error(f"Error while getting pool address")
             return None
 
+    async def fetch_pool_address(self) -> Union[int, None]:
+        """
+        Fetch the liquidity pool address for the coin pair from the factory, None if pool does not exist.
+        :return:
+        """
+        response = await self.factory_contract.functions['get_pair'].call(
+            self.i16(self.coin_x.contract_address),
+            self.i16(self.coin_y.contract_address)
+        )
+
+        return response.pair or None
+
     async def get_lp_supply(
             self,
             lp_addr
@@ -1,3 +1,4 @@
+import asyncio
 from typing import Union
 from typing import Tuple
 from typing import TYPE_CHECKING
@@ -53,12 +54,20 @@ class K10SwapBase(ModuleBase):
             amount_in_wei: int,
     ) -> Union[TupleDataclass, None]:
         """
-        Get the amount in for coin pair, using router contract.
+        Get the amount in for coin pair, computed from cached pair reserves, router contract is used as fallback.
         :param coin_x:
         :param coin_y:
         :param amount_in_wei:
         :return:
         """
+        amount_out_wei = await self.get_local_amount_out(
+            coin_x=coin_x,
+            coin_y=coin_y,
+            amount_in_wei=amount_in_wei
+        )
+        if amount_out_wei is not None:
+            return TupleDataclass.from_dict({'amounts': [amount_in_wei, amount_out_wei]})
+
         path = [
             int(coin_x.contract_address, 16),
             int(coin_y.contract_address, 16)
@@ -86,16 +95,32 @@ class K10SwapBase(ModuleBase):
         :return:
         """
         try:
-            pair = await self.factory_contract.functions["getPair"].call(
-                int(coin_x.contract_address, 16),
-                int(coin_y.contract_address, 16)
+            return await self.metadata_cache.get_or_fetch(
+                contract_address=self.factory_contract.address,
+                selector="getPair",
+                args=(int(coin_x.contract_address, 16), int(coin_y.contract_address, 16)),
+                fetch=lambda: self.fetch_token_pair_address(coin_x=coin_x, coin_y=coin_y)
             )
-            return pair.pair
 
         except Exception as e:
             self.log_error(f'Error while getting pool data: {e}')
             return None
 
+    async def fetch_token_pair_address(
+            self,
+            coin_x: TokenBase,
+            coin_y: TokenBase,
+    ) -> Union[int, None]:
+        """
+        Fetch the token pair address from the factory, None if pair does not exist.
+        :return:
+        """
+        pair = await self.factory_contract.functions["getPair"].call(
+            int(coin_x.contract_address, 16),
+            int(coin_y.contract_address, 16)
+        )
+        return pair.pair or None
+
     async def get_token_pair(
             self,
             token_pair_address: int
@@ -120,4 +145,58 @@ class K10SwapBase(ModuleBase):
             self.log_error(f'Error while getting pool data: {e}')
             return None
 
+    async def get_local_amount_out(
+            self,
+            coin_x: TokenBase,
+            coin_y: TokenBase,
+            amount_in_wei: int,
+    ) -> Union[int, None]:
+        """
+        Get the amount out for coin pair from pair reserves, read once per block for all wallets.
+        :param coin_x:
+        :param coin_y:
+        :param amount_in_wei:
+        :return:
+        """
+        try:
+            pair_address = await self.get_token_pair_address(coin_x=coin_x, coin_y=coin_y)
+            if pair_address is None:
+                return None
+
+            return await self.get_constant_product_amount_out(
+                pool_key=('k10swap', pair_address),
+                token_in_address=coin_x.contract_address,
+                amount_in_wei=amount_in_wei,
+                fetch_reserves=lambda: self.fetch_pair_reserves(pair_address=pair_address)
+            )
+
+        except Exception as e:
+            logger.debug(f'Error while calculating amount out from reserves: {e}')
+            return None
+
+    async def fetch_pair_reserves(self, pair_address: int) -> Tuple[int, int, int]:
+        """
+        Fetch token0 address and reserves of pair.
+        :param pair_address:
+        :return: token0 address, reserve0, reserve1
+        """
+        pool_contract = self.get_contract(
+            address=pair_address,
+            abi=self.k10_contracts.pool_abi,
+            provider=self.account
+        )
+
+        async def fetch_token0():
+            response = await pool_contract.functions["token0"].call()
+            return response.token0
+
+        token0_address, reserves = await asyncio.gather(
+            self.metadata_cache.get_or_fetch(
+                contract_address=pair_address,
+                selector='token0',
+                fetch=fetch_token0
+            ),
+            pool_contract.functions["getReserves"].call()
+        )
 
+        return token0_address, reserves.reserve0, reserves.reserve1
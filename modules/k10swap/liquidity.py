@@ -204,24 +204,22 @@ class K10SwapRemoveLiquidity(K10SwapBase, LiquidityModuleBase):
             pair_address: int
     ) -> Union[Tuple[int, int], None]:
         """
-        Get the reserves for the given pair address.
+        Get the reserves for the given pair address, read once per block for all wallets.
         :param pair_address:
         :return:
         """
-        try:
-            call = self.build_call(
-                to_addr=pair_address,
-                func_name='getReserves',
-                call_data=[]
-            )
-            resp = await self.account.client.call_contract(call)
-
-            return resp[0], resp[1]
-
-        except Exception as ex:
+        reserves = await self.get_pool_reserves(
+            pool_key=('k10swap', pair_address),
+            fetch=lambda: self.fetch_pair_reserves(pair_address=pair_address)
+        )
+        if reserves is None:
             self.log_error(f"Error while getting reserves")
             return None
 
+        _, reserve0, reserve1 = reserves
+
+        return reserve0, reserve1
+
     async def get_amounts_out(
             self,
             pair_address: int,
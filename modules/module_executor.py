@@ -3,9 +3,6 @@ from datetime import datetime
 from typing import Union
 
 from loguru import logger
-from starknet_py.net.account.account import Account
-from starknet_py.net.full_node_client import FullNodeClient
-from starknet_py.net.models import StarknetChainId
 
 from src.schemas import tasks
 from src.schemas.wallet_data import WalletData
@@ -15,10 +12,11 @@ from src.storage import Storage
 from src.storage import ActionStorage
 from src.action_logger import ActionLogger
 
-from src.proxy_manager import ProxyManager
+from src.wallet_context import get_wallet_context
+from src import pacer
 
-from utils.key_manager.key_manager import get_key_pair_from_pk
-from utils.gas_price import GasPrice
+from src.gas_oracle import GasOracle
+from src.metadata_cache import MetadataCache
 
 from src import enums
 import config as cfg
@@ -45,7 +43,7 @@ class ModuleExecutor:
         self.wallet_data = wallet
 
     async def start(self) -> ModuleExecutionResult:
-        time.sleep(cfg.DEFAULT_DELAY_SEC)
+        await pacer.sleep(cfg.DEFAULT_DELAY_SEC)
 
         if not self.app_config.rpc_url:
             logger.error("Please, set RPC URL in tools window or app_config.json file")
@@ -66,19 +64,16 @@ class ModuleExecutor:
             base_url: str
     ) -> Union[ModuleExecutionResult, None]:
         proxy_data = wallet_data.proxy
-        proxy_manager = ProxyManager(proxy_data)
+        wallet_context = get_wallet_context(wallet_data)
 
         action_log_data = WalletActionSchema(
             date_time=datetime.now().strftime("%d-%m-%Y_%H-%M-%S"),
-            wallet_address=wallet_data.address,
+            wallet_address=wallet_context.address,
         )
 
         self.action_storage.update_current_action(action_data=action_log_data)
-        key_pair = get_key_pair_from_pk(wallet_data.private_key)
 
-        custom_session = proxy_manager.get_session()
-
-        current_ip = await proxy_manager.get_ip()
+        current_ip = await wallet_context.get_proxy_ip()
         if current_ip is None and proxy_data:
             err_msg = f"Proxy {wallet_data.proxy.host}:{wallet_data.proxy.port} is not valid or bad auth params"
             action_log_data.set_error(err_msg)
@@ -100,18 +95,12 @@ class ModuleExecutor:
 
         logger.info(f"Current ip: {current_ip}\n")
 
-        client = FullNodeClient(node_url=base_url, session=custom_session)
+        is_gas_price_check_needed = self.task.test_mode is False and self.app_config.skip_gas_price_check is False
 
-        if self.task.test_mode is False and self.app_config.skip_gas_price_check is False:
-            gas_price = GasPrice(
-                block_number=enums.BlockStatus.PENDING.value,
-                session=custom_session
-            )
-            status, gas_price = await gas_price.check_loop(
-                target_price_gwei=self.app_config.target_gas_price,
-            )
+        if is_gas_price_check_needed:
+            gas_price_snapshot = await GasOracle().below(target_price_gwei=self.app_config.target_gas_price)
 
-            if gas_price is None:
+            if gas_price_snapshot is None:
                 err_msg = f"Error while getting gas price"
                 action_log_data.set_error(err_msg)
                 return ModuleExecutionResult(
@@ -121,17 +110,12 @@ class ModuleExecutor:
 
             logger.info(
                 f"Gas price is under target value ({self.app_config.target_gas_price}), "
-                f"now = {gas_price / 10 ** 9} Gwei."
+                f"now = {gas_price_snapshot.get_gas_price_gwei()} Gwei."
             )
         else:
             logger.warning(f"Test mode enabled, gas price check is skipped")
 
-        account = Account(
-            address=wallet_data.address,
-            client=client,
-            key_pair=key_pair,
-            chain=StarknetChainId.MAINNET,
-        )
+        account = wallet_context.account
 
         retries = self.task.retries if self.task.test_mode is False else 1
 
@@ -150,6 +134,10 @@ class ModuleExecutor:
             module = self.task.module(account=account, task=self.task, wallet_data=wallet_data)
             execution_status = await module.try_send_txn(retries=retries)
 
+        if self.module_type in (enums.ModuleType.DEPLOY, enums.ModuleType.UPGRADE):
+            wallet_context.invalidate_chain_state()
+            MetadataCache().invalidate(wallet_context.address, selector='getVersion')
+
         if self.task.test_mode is False:
             action_log_data.module_name = self.module_name.value
             action_log_data.module_type = self.module_type.value
@@ -162,7 +150,4 @@ class ModuleExecutor:
             action_logger.add_action_to_log_storage(action_data=action_log_data)
             action_logger.log_action_from_storage()
 
-        await custom_session.close()
-        await proxy_manager.close_connector()
-
         return execution_status
@@ -95,7 +95,7 @@ class MySwapBase(ModuleBase):
             router_contract
     ) -> Union[dict, None]:
         """
-        Get pool reserves data from router
+        Get pool reserves data from router, pool is read once per block for all wallets
         :param coin_x_symbol:
         :param coin_y_symbol:
         :param router_contract:
@@ -109,7 +109,10 @@ class MySwapBase(ModuleBase):
             self.log_error(f"Failed to get pool id for {coin_x_symbol} and {coin_y_symbol}")
             return None
 
-        reserves_data = await router_contract.functions['get_pool'].call(pool_id)
+        reserves_data = await self.get_pool_reserves(
+            pool_key=('myswap', pool_id),
+            fetch=lambda: router_contract.functions['get_pool'].call(pool_id)
+        )
         if reserves_data is None:
             self.log_error(f"Failed to get reserves data for pool id {pool_id}")
             return None
@@ -1,5 +1,6 @@
 import random
 from typing import Union
+from typing import List
 from typing import TYPE_CHECKING
 
 from starknet_py.net.http_client import HttpMethod
@@ -12,6 +13,7 @@ from contracts.orbiter.main import OrbiterContracts
 from contracts.chains.main import Chains
 from contracts.base import TokenBase
 from src.schemas.action_models import ModuleExecutionResult, TransactionPayloadData
+from src.prefetch import PrefetchRead
 from utils.orbiter_utils import get_orbiter_bridge_data_by_token
 
 if TYPE_CHECKING:
@@ -55,6 +57,13 @@ class OrbiterBridge(ModuleBase):
         self.initial_balance_x_wei = None
         self.token_x_decimals = None
 
+    def get_prefetch_reads(self) -> List[PrefetchRead]:
+        """
+        Returns balance and decimals reads of coin x.
+        :return:
+        """
+        return self.get_token_prefetch_reads(token=self.coin_x, suffix='x')
+
     async def get_tokens_data(self) -> Union[list, None]:
         url = "https://api3.loopring.io/api/v3/exchange/tokens"
 
@@ -91,19 +100,16 @@ class OrbiterBridge(ModuleBase):
             coin_x: TokenBase
     ) -> Union[int, None]:
         """
-        Returns random amount out of token x balance.
+        Returns random amount out of prefetched token x balance.
         :param coin_x:
         :return:
         """
-        balance_x_wei = await self.get_token_balance(
-            token_address=self.coin_x.contract_address,
-            account=self.account
-        )
-        token_x_decimals = await self.get_token_decimals(
-            contract_address=self.coin_x.contract_address,
-            abi=self.coin_x.abi,
-            provider=self.account
-        )
+        balance_x_wei = self.prefetched.get('balance_x')
+        token_x_decimals = self.prefetched.get('decimals_x')
+        if balance_x_wei is None or token_x_decimals is None:
+            self.log_error(f"Token {coin_x.symbol.upper()} balance or decimals not fetched")
+            return None
+
         if balance_x_wei == 0:
             self.log_error(f"Wallet {coin_x.symbol.upper()} balance = 0")
             return None
@@ -221,6 +227,9 @@ class OrbiterBridge(ModuleBase):
         Sends transaction.
         :return:
         """
+        if await self.prefetch() is False:
+            return self.module_execution_result
+
         txn_payload_data = await self.build_txn_payload_data()
         if txn_payload_data is None:
             self.log_error(f"Failed to build txn payload data")
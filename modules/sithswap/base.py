@@ -1,3 +1,4 @@
+import asyncio
 from typing import Union
 from typing import TYPE_CHECKING
 
@@ -9,6 +10,8 @@ from contracts.base import TokenBase
 from contracts.tokens.main import Tokens
 from contracts.sithswap.main import SithSwapContracts
 from modules.sithswap.math import get_amount_in_from_reserves
+from modules.sithswap.math import get_amount_out
+from modules.sithswap.math import FEE_PROBE_AMOUNT
 
 if TYPE_CHECKING:
     from src.schemas.tasks.sithswap import SithSwapTask
@@ -77,12 +80,17 @@ class SithBase(ModuleBase):
         :return:
         """
         try:
-            response = await router_contract.functions['pairFor'].call(
-                self.i16(coin_x_address),
-                self.i16(coin_y_address),
-                stable
+            return await self.metadata_cache.get_or_fetch(
+                contract_address=router_contract.address,
+                selector='pairFor',
+                args=(self.i16(coin_x_address), self.i16(coin_y_address), stable),
+                fetch=lambda: self.fetch_pool_for_pair(
+                    stable=stable,
+                    router_contract=router_contract,
+                    coin_x_address=coin_x_address,
+                    coin_y_address=coin_y_address
+                )
             )
-            return response.res
 
         except ClientError:
             self.log_error(f"Can't get pool for pair {coin_x_address} {coin_y_address}")
@@ -99,18 +107,56 @@ class SithBase(ModuleBase):
         :return:
         """
         try:
-            pool_contract = self.get_contract(address=pool_addr,
-                                              abi=pool_abi,
-                                              provider=self.account)
-            response = await pool_contract.functions['getTokens'].call()
-
-            return [response.token0,
-                    response.token1]
+            return await self.metadata_cache.get_or_fetch(
+                contract_address=pool_addr,
+                selector='getTokens',
+                fetch=lambda: self.fetch_sorted_tokens(pool_addr=pool_addr, pool_abi=pool_abi)
+            )
 
         except ClientError:
             self.log_error(f"Can't get sorted tokens for pool {pool_addr}")
             return None
 
+    async def fetch_pool_for_pair(
+            self,
+            stable: int,
+            router_contract,
+            coin_x_address: str,
+            coin_y_address: str
+    ) -> Union[int, None]:
+        """
+        Fetch pool id for pair from router
+        :param stable:
+        :param router_contract:
+        :param coin_x_address:
+        :param coin_y_address:
+        :return:
+        """
+        response = await router_contract.functions['pairFor'].call(
+            self.i16(coin_x_address),
+            self.i16(coin_y_address),
+            stable
+        )
+        return response.res
+
+    async def fetch_sorted_tokens(
+            self,
+            pool_addr: str,
+            pool_abi) -> list[int, int]:
+        """
+        Fetch sorted tokens for pool
+        :param pool_addr:
+        :param pool_abi:
+        :return:
+        """
+        pool_contract = self.get_contract(address=pool_addr,
+                                          abi=pool_abi,
+                                          provider=self.account)
+        response = await pool_contract.functions['getTokens'].call()
+
+        return [response.token0,
+                response.token1]
+
     async def get_reserves(
             self,
             router_contract,
@@ -119,29 +165,33 @@ class SithBase(ModuleBase):
             stable: int
     ) -> Union[dict, None]:
         """
-        Get reserves for pair
+        Get reserves for pair, read once per block for all wallets
         :param router_contract:
         :param coin_x_address:
         :param coin_y_address:
         :param stable:
         :return:
         """
-        try:
-            response = await router_contract.functions['getReserves'].call(
-                self.i16(coin_x_address),
-                self.i16(coin_y_address),
-                stable
-            )
-
-            return {
-                coin_x_address: response.reserve_a,
-                coin_y_address: response.reserve_b
-            }
+        token_a, token_b = sorted([self.i16(coin_x_address), self.i16(coin_y_address)])
 
-        except ClientError:
+        reserves = await self.get_pool_reserves(
+            pool_key=('sithswap', token_a, token_b, stable),
+            fetch=lambda: router_contract.functions['getReserves'].call(token_a, token_b, stable)
+        )
+        if reserves is None:
             self.log_error(f"Can't get reserves for {coin_x_address} {coin_y_address}")
             return None
 
+        reserves_by_address = {
+            token_a: reserves.reserve_a,
+            token_b: reserves.reserve_b
+        }
+
+        return {
+            coin_x_address: reserves_by_address[self.i16(coin_x_address)],
+            coin_y_address: reserves_by_address[self.i16(coin_y_address)]
+        }
+
     async def get_direct_amount_in_and_pool_type(
             self,
             amount_in_wei: int,
@@ -150,13 +200,22 @@ class SithBase(ModuleBase):
             router_contract
     ) -> Union[dict, None]:
         """
-        Get amount in wei and pool type from router function
+        Get amount in wei and pool type, computed from cached pool reserves, router function is used as fallback
         :param amount_in_wei:
         :param coin_x:
         :param coin_y:
         :param router_contract:
         :return:
         """
+        local_amount_data = await self.get_local_amount_in_and_pool_type(
+            amount_in_wei=amount_in_wei,
+            coin_x=coin_x,
+            coin_y=coin_y,
+            router_contract=router_contract
+        )
+        if local_amount_data is not None:
+            return local_amount_data
+
         try:
             response = await router_contract.functions['getAmountOut'].call(
                 amount_in_wei,
@@ -219,3 +278,105 @@ class SithBase(ModuleBase):
         except Exception as e:
             self.log_error(f"Error while getting amount in and pool id: {e}")
             return None
+
+    async def get_local_amount_in_and_pool_type(
+            self,
+            amount_in_wei: int,
+            coin_x: TokenBase,
+            coin_y: TokenBase,
+            router_contract
+    ) -> Union[dict, None]:
+        """
+        Calculate amount in wei from pool reserves and trade fees, read once per block for all wallets
+        :param amount_in_wei:
+        :param coin_x:
+        :param coin_y:
+        :param router_contract:
+        :return:
+        """
+        try:
+            stable = 1 if self.is_pool_stable(coin_x_symbol=coin_x.symbol, coin_y_symbol=coin_y.symbol) else 0
+
+            pool_addr = await self.metadata_cache.get_or_fetch(
+                contract_address=router_contract.address,
+                selector='pairFor',
+                args=(self.i16(coin_x.contract_address), self.i16(coin_y.contract_address), stable),
+                fetch=lambda: self.fetch_pool_for_pair(
+                    stable=stable,
+                    router_contract=router_contract,
+                    coin_x_address=coin_x.contract_address,
+                    coin_y_address=coin_y.contract_address
+                )
+            )
+            if not pool_addr:
+                return None
+
+            pool_data, decimals_x, decimals_y = await asyncio.gather(
+                self.get_pool_reserves(
+                    pool_key=('sithswap', pool_addr),
+                    fetch=lambda: self.fetch_pool_reserves_and_fees(pool_addr=pool_addr)
+                ),
+                self.get_token_decimals(contract_address=coin_x.contract_address, abi=coin_x.abi, provider=self.account),
+                self.get_token_decimals(contract_address=coin_y.contract_address, abi=coin_y.abi, provider=self.account)
+            )
+            if pool_data is None or decimals_x is None or decimals_y is None:
+                return None
+
+            if pool_data['token0'] == self.i16(coin_x.contract_address):
+                reserve_in, reserve_out, trade_fee = pool_data['reserve0'], pool_data['reserve1'], pool_data['fee0']
+            else:
+                reserve_in, reserve_out, trade_fee = pool_data['reserve1'], pool_data['reserve0'], pool_data['fee1']
+
+            amount_out_wei = get_amount_out(
+                amount_in=amount_in_wei,
+                reserve_in=reserve_in,
+                reserve_out=reserve_out,
+                trade_fee_per_probe=trade_fee,
+                stable=bool(stable),
+                decimals_in=decimals_x,
+                decimals_out=decimals_y
+            )
+            if not amount_out_wei:
+                return None
+
+            return {
+                'amount_in_wei': amount_out_wei,
+                'stable': stable
+            }
+
+        except Exception as e:
+            logger.debug(f"Error while calculating amount in from reserves: {e}")
+            return None
+
+    async def fetch_pool_reserves_and_fees(self, pool_addr: int) -> dict:
+        """
+        Fetch pool reserves and trade fees of FEE_PROBE_AMOUNT in both directions
+        :param pool_addr:
+        :return:
+        """
+        sorted_tokens = await self.metadata_cache.get_or_fetch(
+            contract_address=pool_addr,
+            selector='getTokens',
+            fetch=lambda: self.fetch_sorted_tokens(pool_addr=pool_addr, pool_abi=self.sith_swap_contracts.pool_abi)
+        )
+        token0, token1 = sorted_tokens
+
+        pool_contract = self.get_contract(
+            address=pool_addr,
+            abi=self.sith_swap_contracts.pool_abi,
+            provider=self.account
+        )
+
+        reserves, fee0, fee1 = await asyncio.gather(
+            pool_contract.functions['getReserves'].call(),
+            pool_contract.functions['getTradeFee'].call(FEE_PROBE_AMOUNT, token0),
+            pool_contract.functions['getTradeFee'].call(FEE_PROBE_AMOUNT, token1)
+        )
+
+        return {
+            'token0': token0,
+            'reserve0': reserves.reserve0,
+            'reserve1': reserves.reserve1,
+            'fee0': fee0.amount_fee,
+            'fee1': fee1.amount_fee
+        }
@@ -20,6 +20,120 @@ def get_amount_in_from_reserves(
     return amount_in
 
 
+FEE_PROBE_AMOUNT = 10 ** 18
+STABLE_PRECISION = 10 ** 18
+
+
+def get_amount_after_fee(
+        amount_in: int,
+        trade_fee_per_probe: int
+) -> int:
+    """
+    Get amount in after pool trade fee, fee is linear in amount
+    :param amount_in:
+    :param trade_fee_per_probe: trade fee of FEE_PROBE_AMOUNT
+    :return:
+    """
+    return amount_in - amount_in * trade_fee_per_probe // FEE_PROBE_AMOUNT
+
+
+def stable_f(
+        x0: int,
+        y: int
+) -> int:
+    """
+    x0 * y^3 + x0^3 * y with 1e18 precision
+    """
+    return (
+            x0 * (y * y // STABLE_PRECISION * y // STABLE_PRECISION) // STABLE_PRECISION
+            + (x0 * x0 // STABLE_PRECISION * x0 // STABLE_PRECISION) * y // STABLE_PRECISION
+    )
+
+
+def stable_d(
+        x0: int,
+        y: int
+) -> int:
+    """
+    Derivative of stable_f by y with 1e18 precision
+    """
+    return (
+            3 * x0 * (y * y // STABLE_PRECISION) // STABLE_PRECISION
+            + (x0 * x0 // STABLE_PRECISION * x0 // STABLE_PRECISION)
+    )
+
+
+def stable_get_y(
+        x0: int,
+        xy: int,
+        y: int
+) -> int:
+    """
+    Solve x0 * y^3 + x0^3 * y = xy for y with Newton's method
+    :param x0: new reserve in
+    :param xy: pool invariant
+    :param y: reserve out, initial guess
+    :return:
+    """
+    for _ in range(255):
+        y_prev = y
+        k = stable_f(x0, y)
+        d = stable_d(x0, y)
+        if d == 0:
+            return y
+
+        if k < xy:
+            y = y + (xy - k) * STABLE_PRECISION // d
+        else:
+            y = y - (k - xy) * STABLE_PRECISION // d
+
+        if abs(y - y_prev) <= 1:
+            return y
+
+    return y
+
+
+def get_amount_out(
+        amount_in: int,
+        reserve_in: int,
+        reserve_out: int,
+        trade_fee_per_probe: int,
+        stable: bool,
+        decimals_in: int,
+        decimals_out: int
+) -> int:
+    """
+    Get amount out of volatile (x * y) or stable (x^3 * y + y^3 * x) pool
+    :param amount_in:
+    :param reserve_in:
+    :param reserve_out:
+    :param trade_fee_per_probe: trade fee of FEE_PROBE_AMOUNT of input token
+    :param stable:
+    :param decimals_in:
+    :param decimals_out:
+    :return:
+    """
+    if amount_in <= 0 or reserve_in <= 0 or reserve_out <= 0:
+        return 0
+
+    amount_in = get_amount_after_fee(amount_in=amount_in, trade_fee_per_probe=trade_fee_per_probe)
+
+    if not stable:
+        return amount_in * reserve_out // (reserve_in + amount_in)
+
+    unit_in = 10 ** decimals_in
+    unit_out = 10 ** decimals_out
+
+    reserve_in_norm = reserve_in * STABLE_PRECISION // unit_in
+    reserve_out_norm = reserve_out * STABLE_PRECISION // unit_out
+    amount_in_norm = amount_in * STABLE_PRECISION // unit_in
+
+    xy = stable_f(reserve_in_norm, reserve_out_norm)
+    y = reserve_out_norm - stable_get_y(amount_in_norm + reserve_in_norm, xy, reserve_out_norm)
+
+    return max(y, 0) * unit_out // STABLE_PRECISION
+
+
 def calculate_price_impact(
         reserve_in: int,
         amount_in: int,
@@ -1,4 +1,6 @@
+import asyncio
 from typing import Union
+from typing import Tuple
 from typing import TYPE_CHECKING
 
 from loguru import logger
@@ -52,13 +54,21 @@ class StarkExBase(ModuleBase):
             router_contract
     ) -> Union[int, None]:
         """
-        Get the amount in for coin pair, using router contract.
+        Get the amount in for coin pair, computed from cached pair reserves, router contract is used as fallback.
         :param amount_out_wei:
         :param coin_x_obj:
         :param coin_y_obj:
         :param router_contract:
         :return:
         """
+        amount_in_wei = await self.get_local_amount_in(
+            amount_out_wei=amount_out_wei,
+            coin_x_obj=coin_x_obj,
+            coin_y_obj=coin_y_obj
+        )
+        if amount_in_wei is not None:
+            return amount_in_wei
+
         path = [
             int(coin_x_obj.contract_address, 16),
             int(coin_y_obj.contract_address, 16)
@@ -74,3 +84,107 @@ class StarkExBase(ModuleBase):
         except Exception as e:
             self.log_error(f'Error while getting amount in: {e}')
             return None
+
+    async def get_local_amount_in(
+            self,
+            amount_out_wei: int,
+            coin_x_obj: TokenBase,
+            coin_y_obj: TokenBase
+    ) -> Union[int, None]:
+        """
+        Get the amount in for coin pair from pair reserves, read once per block for all wallets.
+        :param amount_out_wei:
+        :param coin_x_obj:
+        :param coin_y_obj:
+        :return:
+        """
+        try:
+            pair_address = await self.get_pair_address(coin_x_obj=coin_x_obj, coin_y_obj=coin_y_obj)
+            if pair_address is None:
+                return None
+
+            return await self.get_constant_product_amount_out(
+                pool_key=('starkex', pair_address),
+                token_in_address=coin_x_obj.contract_address,
+                amount_in_wei=amount_out_wei,
+                fetch_reserves=lambda: self.fetch_pair_reserves(pair_address=pair_address)
+            )
+
+        except Exception as e:
+            logger.debug(f'Error while calculating amount in from reserves: {e}')
+            return None
+
+    async def get_factory_address(self) -> Union[int, None]:
+        """
+        Get the factory address from router, cached in metadata cache.
+        :return:
+        """
+        async def fetch():
+            response = await self.router_contract.functions["factory"].call()
+            return response.factory
+
+        return await self.metadata_cache.get_or_fetch(
+            contract_address=self.router_contract.address,
+            selector='factory',
+            fetch=fetch
+        )
+
+    async def get_pair_address(
+            self,
+            coin_x_obj: TokenBase,
+            coin_y_obj: TokenBase
+    ) -> Union[int, None]:
+        """
+        Get the pair address from factory, cached in metadata cache.
+        :param coin_x_obj:
+        :param coin_y_obj:
+        :return:
+        """
+        factory_address = await self.get_factory_address()
+        if factory_address is None:
+            return None
+
+        token_addresses = sorted([self.i16(coin_x_obj.contract_address), self.i16(coin_y_obj.contract_address)])
+
+        async def fetch():
+            call = self.build_call(
+                to_addr=factory_address,
+                func_name='getPair',
+                call_data=token_addresses
+            )
+            response = await self.account.client.call_contract(call)
+            return response[0] or None
+
+        return await self.metadata_cache.get_or_fetch(
+            contract_address=factory_address,
+            selector='getPair',
+            args=token_addresses,
+            fetch=fetch
+        )
+
+    async def fetch_pair_reserves(self, pair_address: int) -> Tuple[int, int, int]:
+        """
+        Fetch token0 address and reserves of pair, pair ABI is not shipped so raw calls are used.
+        :param pair_address:
+        :return: token0 address, reserve0, reserve1
+        """
+        async def fetch_token0():
+            call = self.build_call(to_addr=pair_address, func_name='token0', call_data=[])
+            return (await self.account.client.call_contract(call))[0]
+
+        reserves_call = self.build_call(to_addr=pair_address, func_name='getReserves', call_data=[])
+
+        token0_address, response = await asyncio.gather(
+            self.metadata_cache.get_or_fetch(
+                contract_address=pair_address,
+                selector='token0',
+                fetch=fetch_token0
+            ),
+            self.account.client.call_contract(reserves_call)
+        )
+
+        # Reserves are (Uint256, Uint256, timestamp) or (felt, felt, timestamp)
+        if len(response) >= 5:
+            return token0_address, response[0] + (response[1] << 128), response[2] + (response[3] << 128)
+
+        return token0_address, response[0], response[1]
@@ -1,5 +1,5 @@
 import random
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Union, List
 
 from starknet_py.net.client_errors import ClientError
 
@@ -8,6 +8,7 @@ from modules.base import ModuleBase
 from src.schemas.wallet_data import WalletData
 from contracts.tokens.main import Tokens
 from src.schemas.action_models import ModuleExecutionResult
+from src.prefetch import PrefetchRead
 
 if TYPE_CHECKING:
     from src.schemas.tasks.transfer import TransferTask
@@ -43,28 +44,37 @@ class Transfer(ModuleBase):
         self.initial_balance_x_wei = None
         self.coin_x_decimals = None
 
+    def is_eth_transfer_fee_required(self) -> bool:
+        return self.coin_x.symbol.upper() == 'ETH' and self.task.use_all_balance is True
+
+    def get_prefetch_reads(self) -> List[PrefetchRead]:
+        """
+        Returns balance and decimals reads of coin x, with ETH transfer fee estimation if all ETH balance is sent.
+        :return:
+        """
+        reads = self.get_token_prefetch_reads(token=self.coin_x, suffix='x')
+
+        if self.is_eth_transfer_fee_required():
+            reads.append(PrefetchRead(name='eth_transfer_fee', fetch=self.estimate_eth_transfer_fee))
+
+        return reads
+
     async def set_fetched_tokens_data(self):
         """
         Fetches initial balances and token decimals for both tokens.
         :return:
         """
-        self.initial_balance_x_wei = await self.get_token_balance(
-            token_address=self.coin_x.contract_address,
-            account=self.account
-        )
+        await self.prefetch()
 
-        self.coin_x_decimals = await self.get_token_decimals(
-            contract_address=self.coin_x.contract_address,
-            abi=self.coin_x.abi,
-            provider=self.account
-        )
+        self.initial_balance_x_wei = self.prefetched.get('balance_x')
+        self.coin_x_decimals = self.prefetched.get('decimals_x')
 
     def check_local_tokens_data(self) -> bool:
         """
         Checks if token decimals are fetched.
         :return:
         """
-        if self.initial_balance_x_wei is None and self.coin_x_decimals is None:
+        if self.initial_balance_x_wei is None or self.coin_x_decimals is None:
             self.log_error(f"Token {self.coin_x.symbol.upper()} decimals not fetched")
             return False
 
@@ -176,14 +186,13 @@ class Transfer(ModuleBase):
             self.log_error(f"Error while calculating amount out for {self.coin_x.symbol.upper()}")
             return None
 
-        if self.coin_x.symbol.upper() == 'ETH':
-            if self.task.use_all_balance is True:
-                eth_transfer_fee = await self.estimate_eth_transfer_fee()
-                if eth_transfer_fee is None:
-                    self.log_error(f"Error while estimating ETH transfer fee")
-                    return None
+        if self.is_eth_transfer_fee_required():
+            eth_transfer_fee = self.prefetched.get('eth_transfer_fee')
+            if eth_transfer_fee is None:
+                self.log_error(f"Error while estimating ETH transfer fee")
+                return None
 
-                amount_out_wei -= int(eth_transfer_fee * 1.8)
+            amount_out_wei -= int(eth_transfer_fee * 1.8)
 
         recipient_address = self.wallet_data.pair_address
         transfer_call = self.build_call(
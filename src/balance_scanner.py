@@ -0,0 +1,255 @@
+import time
+import asyncio
+from uuid import UUID
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+import numpy as np
+import pandas as pd
+from loguru import logger
+from starknet_py.hash.selector import get_selector_from_name
+from starknet_py.net.client_models import Call
+from starknet_py.net.full_node_client import FullNodeClient
+
+from contracts.base import TokenBase
+from contracts.tokens.main import Tokens
+from src.metadata_cache import MetadataCache
+from src.wallet_context import WalletContext
+from src import enums
+import config
+
+if TYPE_CHECKING:
+    from src.schemas.tasks.base.base import TaskBase
+    from src.schemas.wallet_data import WalletData
+
+
+class BalanceSnapshot:
+    """
+    Token balances of wallets in token units, as a table with wallet addresses as rows
+    and token symbols as columns. Balances that failed to be fetched are NaN.
+    """
+
+    def __init__(
+            self,
+            balances: pd.DataFrame,
+            wallet_addresses: Optional[Dict[UUID, str]] = None,
+    ):
+        self.balances = balances
+        self.wallet_addresses = wallet_addresses or {}
+        self.scanned_at = time.time()
+
+    def get_wallet_address(self, wallet: "WalletData") -> str:
+        wallet_address = self.wallet_addresses.get(wallet.wallet_id)
+        if wallet_address is None:
+            wallet_address = wallet.address
+
+        return wallet_address
+
+    def get_balance(self, wallet: "WalletData", token_symbol: str) -> Optional[float]:
+        """
+        Get wallet balance of a token, None if balance is unknown
+        Args:
+            wallet: wallet data
+            token_symbol: token symbol
+        """
+        try:
+            balance = self.balances.at[self.get_wallet_address(wallet), token_symbol.lower()]
+        except KeyError:
+            return None
+
+        if pd.isna(balance):
+            return None
+
+        return float(balance)
+
+    def get_wallet_balances(self, wallet: "WalletData") -> Dict[str, float]:
+        """
+        Get known balances of a wallet by token symbol
+        Args:
+            wallet: wallet data
+        """
+        wallet_address = self.get_wallet_address(wallet)
+        if wallet_address not in self.balances.index:
+            return {}
+
+        return self.balances.loc[wallet_address].dropna().to_dict()
+
+    def has_fee_balance(self, wallet: "WalletData") -> bool:
+        eth_balance = self.get_balance(wallet, "eth")
+        return eth_balance is None or eth_balance >= config.BALANCE_SNAPSHOT_MIN_FEE_ETH
+
+    def can_execute(self, wallet: "WalletData", task: "TaskBase") -> bool:
+        """
+        Check if wallet holds enough ETH for fees and enough of task 'coin_x' to execute the task.
+        Unknown balances are considered sufficient.
+        Args:
+            wallet: wallet data
+            task: task to check
+        """
+        if not self.has_fee_balance(wallet):
+            return False
+
+        coin_x = getattr(task, "coin_x", None)
+        if not coin_x or coin_x == enums.MiscTypes.RANDOM:
+            return True
+
+        balance = self.get_balance(wallet, coin_x)
+        if balance is None:
+            return True
+
+        if getattr(task, "use_all_balance", False) or getattr(task, "send_percent_balance", False):
+            return balance > 0
+
+        return balance > 0 and balance >= getattr(task, "min_amount_out", 0)
+
+    def sort_wallets(
+            self,
+            wallets: List["WalletData"],
+            tasks: List["TaskBase"],
+    ) -> Tuple[List["WalletData"], List["WalletData"]]:
+        """
+        Split wallets into wallets to process and skipped wallets without ETH for fees.
+        Wallets which can't execute first task are moved to the end.
+        Args:
+            wallets: wallets to sort
+            tasks: tasks to be executed by each wallet
+        Returns: wallets to process, skipped wallets
+        """
+        ready_wallets = []
+        deprioritized_wallets = []
+        skipped_wallets = []
+
+        for wallet in wallets:
+            if not self.has_fee_balance(wallet):
+                skipped_wallets.append(wallet)
+
+            elif tasks and not self.can_execute(wallet, tasks[0]):
+                deprioritized_wallets.append(wallet)
+
+            else:
+                ready_wallets.append(wallet)
+
+        return [*ready_wallets, *deprioritized_wallets], skipped_wallets
+
+
+class BalanceScanner:
+    """
+    Fetches balances of all wallets for all tokens concurrently.
+    Balance reads of a wallet are issued at once and sent through the wallet proxy client,
+    so they are coalesced into one batch request. Amount of wallets scanned at once is
+    limited by 'BALANCE_SCAN_CONCURRENCY', requests are rate limited by the session.
+    """
+
+    def __init__(self, tokens: Optional[List[TokenBase]] = None):
+        if tokens is None:
+            tokens = Tokens().all_tokens
+
+        # Custom tokens may repeat default ones, keep first token of each symbol
+        self.tokens: List[TokenBase] = []
+        for token in tokens:
+            if token.symbol.lower() not in [known_token.symbol.lower() for known_token in self.tokens]:
+                self.tokens.append(token)
+
+    @staticmethod
+    async def fetch_balance_wei(
+            client: FullNodeClient,
+            token: TokenBase,
+            wallet_address: str,
+    ) -> int:
+        call = Call(
+            to_addr=int(token.contract_address, 16),
+            selector=get_selector_from_name("balanceOf"),
+            calldata=[int(wallet_address, 16)],
+        )
+        response = await client.call_contract(call)
+
+        # uint256 is returned as (low, high)
+        return response[0] + (response[1] << 128 if len(response) > 1 else 0)
+
+    @staticmethod
+    async def fetch_decimals(client: FullNodeClient, token: TokenBase) -> Optional[int]:
+        async def fetch():
+            call = Call(
+                to_addr=int(token.contract_address, 16),
+                selector=get_selector_from_name("decimals"),
+                calldata=[],
+            )
+            return (await client.call_contract(call))[0]
+
+        return await MetadataCache().get_or_fetch(
+            contract_address=token.contract_address,
+            selector="decimals",
+            fetch=fetch,
+        )
+
+    async def scan_wallet(
+            self,
+            wallet_context: WalletContext,
+            decimals: List[Optional[int]],
+            semaphore: asyncio.Semaphore,
+    ) -> List[float]:
+        """
+        Fetch balances of a wallet for all tokens
+        Args:
+            wallet_context: wallet context
+            decimals: decimals of each token
+            semaphore: semaphore limiting amount of wallets scanned at once
+        Returns: balances in token units, NaN for failed reads
+        """
+        async with semaphore:
+            balances_wei = await asyncio.gather(
+                *[
+                    self.fetch_balance_wei(
+                        client=wallet_context.client,
+                        token=token,
+                        wallet_address=wallet_context.address,
+                    )
+                    for token in self.tokens
+                ],
+                return_exceptions=True,
+            )
+
+        balances = []
+        for token, balance_wei, token_decimals in zip(self.tokens, balances_wei, decimals):
+            if isinstance(balance_wei, Exception) or token_decimals is None:
+                logger.debug(f"Failed to fetch {token.symbol.upper()} balance of {wallet_context.address}: {balance_wei}")
+                balances.append(np.nan)
+                continue
+
+            balances.append(balance_wei / 10 ** token_decimals)
+
+        return balances
+
+    async def scan(self, wallets: List["WalletData"]) -> BalanceSnapshot:
+        """
+        Fetch balances of all wallets for all tokens
+        Args:
+            wallets: wallets to scan
+        """
+        symbols = [token.symbol.lower() for token in self.tokens]
+        if not wallets:
+            return BalanceSnapshot(balances=pd.DataFrame(columns=symbols, dtype=float))
+
+        wallet_contexts = [WalletContext(wallet) for wallet in wallets]
+
+        decimals = await asyncio.gather(
+            *[self.fetch_decimals(client=wallet_contexts[0].client, token=token) for token in self.tokens],
+            return_exceptions=True,
+        )
+        decimals = [None if isinstance(token_decimals, Exception) else token_decimals for token_decimals in decimals]
+
+        semaphore = asyncio.Semaphore(config.BALANCE_SCAN_CONCURRENCY)
+        rows = await asyncio.gather(*[
+            self.scan_wallet(wallet_context=wallet_context, decimals=decimals, semaphore=semaphore)
+            for wallet_context in wallet_contexts
+        ])
+
+        addresses = [wallet_context.address for wallet_context in wallet_contexts]
+        balances = pd.DataFrame(rows, index=addresses, columns=symbols, dtype=float)
+        balances = balances[~balances.index.duplicated()]
+
+        return BalanceSnapshot(
+            balances=balances,
+            wallet_addresses={
+                wallet.wallet_id: wallet_context.address for wallet, wallet_context in zip(wallets, wallet_contexts)
+            },
+        )
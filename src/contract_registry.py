@@ -0,0 +1,164 @@
+import copy
+import json
+import hashlib
+import threading as th
+from typing import Optional, Dict, Tuple, Union, List
+
+from starknet_py.contract import Contract
+from starknet_py.contract import ContractData
+from starknet_py.contract import ContractFunction
+from starknet_py.contract import _unpack_provider
+from starknet_py.net.models.address import parse_address
+
+from utils.file_manager import FileManager
+
+
+class ContractInterface:
+    """
+    Abi parsed once, with payload serializers of all contract functions.
+    Contract handles bound to an address and provider share the parsed data.
+    """
+
+    def __init__(self, abi: list, cairo_version: int = 0):
+        self.abi = abi
+        self.cairo_version = cairo_version
+
+        template_data = ContractData.from_abi(address=0, abi=abi, cairo_version=cairo_version)
+        self.parsed_abi = template_data.parsed_abi
+        self.functions: Dict[str, ContractFunction] = Contract._make_functions(
+            contract_data=template_data,
+            client=None,
+            account=None,
+            cairo_version=cairo_version,
+        )
+
+    def bind(self, address: Union[str, int], provider) -> Contract:
+        """
+        Get contract handle for address and provider without parsing abi again
+        Args:
+            address: contract address
+            provider: account or client
+        """
+        client, account = _unpack_provider(provider)
+
+        contract_data = ContractData.from_abi(
+            address=parse_address(address),
+            abi=self.abi,
+            cairo_version=self.cairo_version,
+        )
+        # ContractData is frozen, parsed abi is a cached property stored in instance dict
+        contract_data.__dict__["parsed_abi"] = self.parsed_abi
+
+        contract = Contract.__new__(Contract)
+        contract.account = account
+        contract.client = client
+        contract.data = contract_data
+        contract._functions = {
+            name: self._bind_function(function, contract_data, client, account)
+            for name, function in self.functions.items()
+        }
+
+        return contract
+
+    @staticmethod
+    def _bind_function(function: ContractFunction, contract_data: ContractData, client, account) -> ContractFunction:
+        bound_function = copy.copy(function)
+        bound_function.contract_data = contract_data
+        bound_function.client = client
+        bound_function.account = account
+
+        return bound_function
+
+
+class ContractRegistry:
+    """
+    Process-wide registry of abis read from files and of parsed contract interfaces.
+    Each abi file is read once and each abi is parsed once per cairo version.
+    """
+    _instance = None
+
+    _abis: Dict[str, Optional[list]]
+    _interfaces: Dict[Tuple[str, int], ContractInterface]
+    _abi_digests: Dict[int, Tuple[list, str]]
+    _lock: th.Lock
+
+    def __new__(cls):
+        if not cls._instance:
+            instance = super(ContractRegistry, cls).__new__(cls)
+            instance._abis = {}
+            instance._interfaces = {}
+            instance._abi_digests = {}
+            instance._lock = th.Lock()
+
+            cls._instance = instance
+
+        return cls._instance
+
+    def get_abi(self, file_path: str) -> Optional[list]:
+        """
+        Get abi from file, file is read only once
+        Args:
+            file_path: abi file path
+        """
+        with self._lock:
+            if file_path in self._abis:
+                return self._abis[file_path]
+
+        abi = FileManager.read_abi_from_file(file_path)
+
+        with self._lock:
+            abi = self._abis.setdefault(file_path, abi)
+            if abi is not None:
+                self._abi_digests[id(abi)] = (abi, self.get_abi_digest(abi))
+
+            return abi
+
+    @staticmethod
+    def get_abi_digest(abi: list) -> str:
+        return hashlib.sha1(json.dumps(abi, sort_keys=True).encode()).hexdigest()
+
+    def get_interface(self, abi: list, cairo_version: int = 0) -> ContractInterface:
+        """
+        Get parsed interface of abi
+        Args:
+            abi: contract abi
+            cairo_version: cairo version of contract
+        """
+        with self._lock:
+            known_abi = self._abi_digests.get(id(abi))
+
+        # Abis from 'get_abi' are kept alive by registry, so their ids are stable
+        if known_abi is not None and known_abi[0] is abi:
+            abi_digest = known_abi[1]
+        else:
+            abi_digest = self.get_abi_digest(abi)
+
+        key = (abi_digest, cairo_version)
+
+        with self._lock:
+            interface = self._interfaces.get(key)
+
+        if interface is None:
+            interface = ContractInterface(abi=abi, cairo_version=cairo_version)
+
+            with self._lock:
+                interface = self._interfaces.setdefault(key, interface)
+
+        return interface
+
+    def get_contract(
+            self,
+            address: Union[str, int],
+            abi: List[dict],
+            provider,
+            cairo_version: int = 0,
+    ) -> Contract:
+        """
+        Get provider bound contract handle
+        Args:
+            address: contract address
+            abi: contract abi
+            provider: account or client
+            cairo_version: cairo version of contract
+        """
+        return self.get_interface(abi=abi, cairo_version=cairo_version).bind(address=address, provider=provider)
@@ -1,15 +1,22 @@
+import time
+import weakref
 import warnings
 from typing import Optional
 
 import aiohttp.typedefs
 from aiohttp.client import ClientSession
 
+from src.rate_limiter import RateLimiter
+
 
 warnings.filterwarnings("ignore", category=DeprecationWarning)
 
 
 class CustomSession(ClientSession):
     proxy: Optional[aiohttp.typedefs.StrOrURL]
+    last_used_at: float
+    active_requests: int
+    holders: weakref.WeakSet
 
     def __init__(
             self,
@@ -22,14 +29,37 @@ class CustomSession(ClientSession):
             **kwargs
         )
         self.proxy = proxy
+        self.last_used_at = time.monotonic()
+
+        # Requests in flight and objects keeping the session, e.g. clients of accounts
+        self.active_requests = 0
+        self.holders = weakref.WeakSet()
+
+    @property
+    def is_in_use(self) -> bool:
+        return self.active_requests > 0 or len(self.holders) > 0
 
     async def _request(
             self,
+            method: str,
+            str_or_url: aiohttp.typedefs.StrOrURL,
             *args,
             **kwargs
     ):
-        return await super()._request(
-            *args,
-            **kwargs,
-            proxy=self.proxy
-        )
+        self.active_requests += 1
+
+        try:
+            await RateLimiter().acquire(str_or_url)
+            self.last_used_at = time.monotonic()
+
+            return await super()._request(
+                method,
+                str_or_url,
+                *args,
+                **kwargs,
+                proxy=self.proxy
+            )
+
+        finally:
+            self.active_requests -= 1
+            self.last_used_at = time.monotonic()
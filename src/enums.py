@@ -91,3 +91,6 @@ class BlockStatus(str, Enum):
 class RunMode(str, Enum):
     SYNC = "sync"
     ASYNC = "async"
+    LOOP = "loop"
+    SHARDED = "sharded"
+    SCHEDULED = "scheduled"
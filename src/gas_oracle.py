@@ -0,0 +1,301 @@
+import os
+import time
+import asyncio
+import threading as th
+from typing import Optional, List, Tuple, Callable, Any
+
+from loguru import logger
+
+from src.transport_registry import TransportRegistry
+from src import pacer
+from src import enums
+from utils.gas_price import GasPrice
+from utils.gas_price import get_eth_mainnet_gas_price_async
+import config
+
+
+class GasPriceSnapshot:
+    """
+    Gas prices fetched on one oracle poll, in wei
+    """
+
+    def __init__(
+            self,
+            stark_gas_price: int,
+            eth_gas_price: Optional[int] = None,
+    ):
+        self.stark_gas_price = stark_gas_price
+        self.eth_gas_price = eth_gas_price
+        self.fetched_at = time.monotonic()
+
+    @property
+    def age_sec(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+    def get_gas_price_gwei(self, eth_mainnet: bool = False) -> Optional[float]:
+        """
+        Get gas price in gwei
+        Args:
+            eth_mainnet: get Ethereum mainnet gas price instead of Starknet one
+        """
+        gas_price = self.eth_gas_price if eth_mainnet else self.stark_gas_price
+        if gas_price is None:
+            return None
+
+        return gas_price / 10 ** 9
+
+    def __str__(self):
+        return f"<GasPriceSnapshot stark: {self.stark_gas_price} eth: {self.eth_gas_price}>"
+
+
+class GasOracle:
+    """
+    Process-wide gas price oracle.
+    Polls Starknet pending block and Ethereum mainnet gas price once per 'GAS_ORACLE_POLL_INTERVAL_SEC'
+    in background thread while there are waiters or subscribers, so any amount of waiting
+    wallets costs one request per poll. State inherited by a forked process is reset, as polling
+    thread is not inherited.
+    """
+    _instance = None
+
+    latest: Optional[GasPriceSnapshot]
+    failures: int
+    _waiters: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]]
+    _subscribers: List[Callable[[GasPriceSnapshot], Any]]
+    _lock: th.Lock
+    _polling_thread: Optional[th.Thread]
+    _owner_pid: int
+
+    def __new__(cls):
+        if not cls._instance:
+            instance = super(GasOracle, cls).__new__(cls)
+            instance.latest = None
+            instance.failures = 0
+            instance._waiters = []
+            instance._subscribers = []
+            instance._lock = th.Lock()
+            instance._polling_thread = None
+            instance._owner_pid = os.getpid()
+
+            cls._instance = instance
+
+        return cls._instance
+
+    def _reset_after_fork(self):
+        """
+        Drop polling thread, waiters, subscribers and snapshot inherited from parent process
+        """
+        if self._owner_pid == os.getpid():
+            return
+
+        self._owner_pid = os.getpid()
+        self._lock = th.Lock()
+        self._polling_thread = None
+        self._waiters = []
+        self._subscribers = []
+        self.latest = None
+        self.failures = 0
+
+    def subscribe(self, callback: Callable[[GasPriceSnapshot], Any]):
+        """
+        Add callback called from polling thread on every new snapshot, keeps oracle polling
+        Args:
+            callback: callback with snapshot argument
+        """
+        self._reset_after_fork()
+
+        with self._lock:
+            self._subscribers.append(callback)
+
+        self.start_polling()
+
+    def unsubscribe(self, callback: Callable[[GasPriceSnapshot], Any]):
+        with self._lock:
+            if callback in self._subscribers:
+                self._subscribers.remove(callback)
+
+    def start_polling(self):
+        """
+        Start background polling thread if it is not running
+        """
+        self._reset_after_fork()
+
+        with self._lock:
+            if self._polling_thread is not None and self._polling_thread.is_alive():
+                return
+
+            self._polling_thread = th.Thread(target=self._run_polling, name="gas_oracle_polling", daemon=True)
+            self._polling_thread.start()
+
+    def _run_polling(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        try:
+            loop.run_until_complete(self.polling_loop())
+        finally:
+            loop.run_until_complete(TransportRegistry().close_sessions())
+            loop.close()
+
+    def _is_demanded(self) -> bool:
+        return bool(self._waiters or self._subscribers)
+
+    async def polling_loop(self):
+        while True:
+            await self.poll()
+            await pacer.sleep(config.GAS_ORACLE_POLL_INTERVAL_SEC)
+
+            with self._lock:
+                if not self._is_demanded():
+                    self._polling_thread = None
+                    return
+
+    async def fetch_snapshot(self) -> Optional[GasPriceSnapshot]:
+        """
+        Fetch gas prices, None if Starknet gas price is not available
+        """
+        session = TransportRegistry().get_session()
+
+        stark_gas_price = await GasPrice(
+            block_number=enums.BlockStatus.PENDING.value,
+            session=session,
+        ).get_stark_block_gas_price()
+
+        if stark_gas_price is None:
+            return None
+
+        try:
+            response = await get_eth_mainnet_gas_price_async(config.ETH_MAINNET_RPC_URL, session=session)
+            eth_gas_price = int(response["result"], 16)
+
+        except Exception as ex:
+            logger.debug(f"Error while getting Ethereum mainnet gas price: {ex}")
+            eth_gas_price = None
+
+        return GasPriceSnapshot(stark_gas_price=stark_gas_price, eth_gas_price=eth_gas_price)
+
+    async def poll(self):
+        """
+        Fetch gas prices and notify waiters and subscribers.
+        Waiters get None after 'GAS_ORACLE_MAX_FAILURES' failed polls in a row.
+        """
+        snapshot = await self.fetch_snapshot()
+
+        with self._lock:
+            if snapshot is None:
+                self.failures += 1
+                if self.failures < config.GAS_ORACLE_MAX_FAILURES:
+                    return
+            else:
+                self.failures = 0
+                self.latest = snapshot
+
+            waiters, self._waiters = self._waiters, []
+            subscribers = list(self._subscribers)
+
+        for loop, future in waiters:
+            try:
+                loop.call_soon_threadsafe(self._resolve_waiter, future, snapshot)
+            except RuntimeError:
+                # Waiter loop is closed
+                continue
+
+        if snapshot is None:
+            return
+
+        for callback in subscribers:
+            try:
+                callback(snapshot)
+            except Exception as ex:
+                logger.exception(ex)
+
+    @staticmethod
+    def _resolve_waiter(future: asyncio.Future, snapshot: Optional[GasPriceSnapshot]):
+        if not future.done():
+            future.set_result(snapshot)
+
+    async def wait_for_update(self) -> Optional[GasPriceSnapshot]:
+        """
+        Wait for next poll of the oracle
+        Returns: new snapshot, None if gas price is not available
+        """
+        self._reset_after_fork()
+
+        loop = asyncio.get_running_loop()
+        waiter = (loop, loop.create_future())
+
+        with self._lock:
+            self._waiters.append(waiter)
+
+        self.start_polling()
+
+        try:
+            return await waiter[1]
+        finally:
+            with self._lock:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+    async def get_latest(self, max_age_sec: float = config.GAS_ORACLE_MAX_AGE_SEC) -> Optional[GasPriceSnapshot]:
+        """
+        Get cached snapshot, waits for a poll if it is older than max age
+        Args:
+            max_age_sec: max age of cached snapshot
+        Returns: snapshot, None if gas price is not available
+        """
+        self._reset_after_fork()
+
+        snapshot = self.latest
+        if snapshot is not None and snapshot.age_sec < max_age_sec:
+            return snapshot
+
+        return await self.wait_for_update()
+
+    async def below(
+            self,
+            target_price_gwei: float,
+            eth_mainnet: bool = False,
+            timeout_sec: Optional[float] = None,
+    ) -> Optional[GasPriceSnapshot]:
+        """
+        Wait until gas price is not greater than the target price
+        Args:
+            target_price_gwei: target gas price in gwei
+            eth_mainnet: wait for Ethereum mainnet gas price instead of Starknet one
+            timeout_sec: max time to wait, None to wait without timeout
+        Returns: snapshot with gas price under target, None if gas price is not available or timeout is reached
+        """
+        if timeout_sec is None:
+            return await self._wait_below(target_price_gwei=target_price_gwei, eth_mainnet=eth_mainnet)
+
+        try:
+            return await asyncio.wait_for(
+                self._wait_below(target_price_gwei=target_price_gwei, eth_mainnet=eth_mainnet),
+                timeout=timeout_sec,
+            )
+        except asyncio.TimeoutError:
+            return None
+
+    async def _wait_below(
+            self,
+            target_price_gwei: float,
+            eth_mainnet: bool,
+    ) -> Optional[GasPriceSnapshot]:
+        is_waiting_logged = False
+
+        snapshot = await self.get_latest()
+        while snapshot is not None:
+            gas_price_gwei = snapshot.get_gas_price_gwei(eth_mainnet=eth_mainnet)
+            if gas_price_gwei is not None and gas_price_gwei <= target_price_gwei:
+                return snapshot
+
+            if not is_waiting_logged:
+                logger.info(
+                    f"Waiting for gas price to be lower than {target_price_gwei} Gwei, "
+                    f"now = {gas_price_gwei} Gwei"
+                )
+                is_waiting_logged = True
+
+            snapshot = await self.wait_for_update()
+
+        return None
@@ -1,45 +1,211 @@
-from typing import Union
-
-import httpx
-import aiohttp
+import os
+import time
+import asyncio
+import threading as th
+from concurrent.futures import Future
+from typing import Union, Optional, Dict, List
 
 from loguru import logger
 from starknet_py.net.full_node_client import FullNodeClient
-from starknet_py.net.http_client import HttpMethod
+
+from contracts.tokens.main import Tokens
+from src.transport_registry import TransportRegistry
+import config
+
+
+class GeckoPriceCache:
+    """
+    Process-wide cache of CoinGecko usd prices.
+    All 'coin_gecko_id's of tokens are fetched with a single batched '/simple/price' request on
+    a background event loop. Prices older than 'GECKO_PRICE_TTL_SEC' are served as is while being
+    revalidated, prices older than 'GECKO_PRICE_MAX_STALE_SEC' are refetched before being served.
+    Background loop is recreated in a forked process, as its thread is not inherited.
+    """
+    _instance = None
+
+    prices: Dict[str, float]
+    fetched_at: Optional[float]
+    _requested_ids: set
+    _refresh: Optional[Future]
+    _lock: th.Lock
+    _loop: Optional[asyncio.AbstractEventLoop]
+    _loop_thread: Optional[th.Thread]
+    _owner_pid: int
+
+    def __new__(cls):
+        if not cls._instance:
+            instance = super(GeckoPriceCache, cls).__new__(cls)
+            instance.prices = {}
+            instance.fetched_at = None
+            instance._requested_ids = set()
+            instance._refresh = None
+            instance._lock = th.Lock()
+            instance._loop = None
+            instance._loop_thread = None
+            instance._owner_pid = os.getpid()
+
+            cls._instance = instance
+
+        return cls._instance
+
+    @property
+    def age_sec(self) -> Optional[float]:
+        if self.fetched_at is None:
+            return None
+
+        return time.monotonic() - self.fetched_at
+
+    def _reset_after_fork(self):
+        """
+        Drop loop, refresh and lock inherited from parent process, none of them is usable after fork
+        """
+        if self._owner_pid == os.getpid():
+            return
+
+        self._owner_pid = os.getpid()
+        self._lock = th.Lock()
+        self._refresh = None
+        self._loop = None
+        self._loop_thread = None
+
+    @property
+    def _is_loop_running(self) -> bool:
+        return self._loop is not None and self._loop_thread is not None and self._loop_thread.is_alive()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        if not self._is_loop_running:
+            self._loop = asyncio.new_event_loop()
+            self._loop_thread = th.Thread(target=self._loop.run_forever, name="gecko_price_refresh", daemon=True)
+            self._loop_thread.start()
+
+        return self._loop
+
+    @staticmethod
+    def get_tokens_ids() -> List[str]:
+        return [token.coin_gecko_id.lower() for token in Tokens().all_tokens if token.coin_gecko_id]
+
+    async def fetch_prices(self, ids: List[str]) -> Dict[str, float]:
+        """
+        Fetch usd prices with a single request
+        Args:
+            ids: coin gecko ids
+        """
+        url = "https://api.coingecko.com/api/v3/simple/price"
+        params = {
+            "ids": ",".join(ids),
+            "vs_currencies": "usd"
+        }
+
+        session = TransportRegistry().get_session()
+        async with session.get(url=url, params=params) as response:
+            response.raise_for_status()
+            data = await response.json()
+
+        return {
+            coin_id: coin_data["usd"]
+            for coin_id, coin_data in data.items()
+            if coin_data.get("usd") is not None
+        }
+
+    async def _refresh_prices(self):
+        try:
+            tokens_ids = self.get_tokens_ids()
+            with self._lock:
+                ids = sorted({*tokens_ids, *self._requested_ids})
+
+            prices = await self.fetch_prices(ids)
+
+            with self._lock:
+                self.prices.update(prices)
+                self.fetched_at = time.monotonic()
+
+        except Exception as ex:
+            logger.error(f"Error while getting prices from CoinGecko: {ex}")
+
+        finally:
+            with self._lock:
+                self._refresh = None
+
+    def _start_refresh(self) -> Future:
+        """
+        Start background refresh of prices if it is not running
+        """
+        self._reset_after_fork()
+
+        with self._lock:
+            if self._refresh is None or not self._is_loop_running:
+                self._refresh = asyncio.run_coroutine_threadsafe(self._refresh_prices(), self._get_loop())
+
+            return self._refresh
+
+    def _get_cached(self, ids: List[str]) -> Optional[Dict[str, float]]:
+        """
+        Get cached prices if all of them are present and not too stale, start revalidation if needed
+        Args:
+            ids: coin gecko ids
+        """
+        self._reset_after_fork()
+
+        with self._lock:
+            unknown_ids = set(ids) - set(self.prices)
+            self._requested_ids.update(unknown_ids)
+
+        age_sec = self.age_sec
+        if unknown_ids or age_sec is None or age_sec >= config.GECKO_PRICE_MAX_STALE_SEC:
+            return None
+
+        if age_sec >= config.GECKO_PRICE_TTL_SEC:
+            self._start_refresh()
+
+        return {coin_id: self.prices[coin_id] for coin_id in ids}
+
+    def _get_refreshed(self, ids: List[str]) -> Optional[Dict[str, float]]:
+        with self._lock:
+            if not set(ids).issubset(self.prices):
+                return None
+
+            return {coin_id: self.prices[coin_id] for coin_id in ids}
+
+    async def get_prices(self, ids: List[str]) -> Optional[Dict[str, float]]:
+        """
+        Get usd prices, waits for a refresh only if prices are missing or too stale
+        Args:
+            ids: coin gecko ids
+        Returns: prices by id, None if any price is not available
+        """
+        prices = self._get_cached(ids)
+        if prices is not None:
+            return prices
+
+        await asyncio.wrap_future(self._start_refresh())
+        return self._get_refreshed(ids)
+
+    def get_prices_sync(self, ids: List[str]) -> Optional[Dict[str, float]]:
+        """
+        Blocking version of 'get_prices'
+        Args:
+            ids: coin gecko ids
+        Returns: prices by id, None if any price is not available
+        """
+        prices = self._get_cached(ids)
+        if prices is not None:
+            return prices
+
+        self._start_refresh().result(timeout=config.GECKO_PRICE_SYNC_TIMEOUT_SEC)
+        return self._get_refreshed(ids)
 
 
 class GeckoPricer:
-    def __init__(self, client: FullNodeClient):
+    def __init__(self, client: FullNodeClient = None):
         self.client = client
+        self.price_cache = GeckoPriceCache()
 
     async def get_simple_price_of_token_pair(
             self,
             x_token_id: str,
             y_token_id: str) -> Union[dict, None]:
         try:
-            url = f"https://api.coingecko.com/api/v3/simple/price"
-            params = {
-                "ids": f"{x_token_id},{y_token_id}",
-                "vs_currencies": "usd"
-            }
-
-            response = await self.client._client.request(
-                address=url,
-                http_method=HttpMethod.GET,
-                params=params,
-                payload=None,
-            )
-
-            x_token_price = response.get(x_token_id).get("usd")
-            y_token_price = response.get(y_token_id).get("usd")
-
-            if x_token_price is None or y_token_price is None:
-                return None
-
-            return {
-                x_token_id: x_token_price,
-                y_token_id: y_token_price
-            }
+            return await self.price_cache.get_prices([x_token_id, y_token_id])
 
         except Exception as e:
             logger.error(e)
@@ -50,23 +216,11 @@ class GeckoPricer:
             x_token_id: str,
     ) -> Union[None, int]:
         try:
-            url = f"https://api.coingecko.com/api/v3/simple/price"
-            params = {
-                "ids": f"{x_token_id}",
-                "vs_currencies": "usd"
-            }
-
-            response = httpx.get(
-                url=url,
-                params=params,
-            )
-
-            x_token_price = response.json().get(x_token_id).get("usd")
-
-            if x_token_price is None:
+            prices = GeckoPriceCache().get_prices_sync([x_token_id])
+            if prices is None:
                 return None
 
-            return x_token_price
+            return prices[x_token_id]
 
         except Exception as e:
             logger.error(e)
@@ -77,15 +231,11 @@ class GeckoPricer:
             x_token_id: str,
     ) -> Union[None, int]:
         try:
-            url = f"https://api.coingecko.com/api/v3/simple/price"
-            params = {
-                "ids": f"{x_token_id}",
-                "vs_currencies": "usd"
-            }
-
-            async with aiohttp.ClientSession() as session:
-                async with session.get(url=url, json=params) as response:
-                    return await response.json()
+            prices = await GeckoPriceCache().get_prices([x_token_id])
+            if prices is None:
+                return None
+
+            return prices[x_token_id]
 
         except Exception as e:
             logger.error(e)
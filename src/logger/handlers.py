@@ -1,9 +1,9 @@
-import threading as th
 from typing import Optional, List, Union
 from typing import TYPE_CHECKING
 
 from src.schemas.logs import LogRecord
 from src.repr.repr_manager import ReprManager
+from src.repr.repr_manager import get_repr_context_id
 from src.internal_queue import InternalQueue
 from src import enums
 
@@ -22,7 +22,7 @@ class ThreadedTaskHandler:
         record = LogRecord(**message.record)
         task: Optional["TaskBase"] = record.extra.get("task")
 
-        ReprManager.push_repr_item_to_thread_items(record, thread=th.get_ident())
+        ReprManager.push_repr_item_to_thread_items(record, thread=get_repr_context_id())
 
         if task is not None and task.task_status in [
             enums.TaskStatus.FAILED,
@@ -0,0 +1,259 @@
+import os
+import json
+import time
+import sqlite3
+import threading as th
+from typing import Optional, Any, Dict, Tuple, Union, Callable, Awaitable, Sequence
+
+from loguru import logger
+
+from src import paths
+
+
+MetadataKey = Tuple[str, str, str]
+
+
+class MetadataCache:
+    """
+    Process-wide disk-backed cache of on-chain metadata (token decimals, pool addresses,
+    account cairo version), keyed by contract address, selector and call args.
+    Entries are loaded from sqlite file on first use. Entries without ttl never expire,
+    entries of mutable data are stored with ttl and can be invalidated per contract.
+    Connection is not used across fork, a forked process opens its own one.
+    """
+    _instance = None
+
+    entries: Dict[MetadataKey, Tuple[Any, Optional[float]]]
+    _db_path: Optional[str]
+    _connection: Optional[sqlite3.Connection]
+    _owner_pid: int
+    _lock: th.Lock
+
+    def __new__(cls):
+        if not cls._instance:
+            instance = super(MetadataCache, cls).__new__(cls)
+            instance.entries = {}
+            instance._db_path = None
+            instance._connection = None
+            instance._owner_pid = os.getpid()
+            instance._lock = th.Lock()
+
+            instance.load(paths.METADATA_CACHE_FILE)
+
+            cls._instance = instance
+
+        return cls._instance
+
+    def load(self, db_path: str):
+        """
+        Open cache file and load all not expired entries
+        Args:
+            db_path: sqlite file path, ':memory:' for cache without persistence
+        """
+        self._reset_after_fork()
+
+        with self._lock:
+            self.entries = {}
+            self._db_path = db_path
+            if self._connection is not None:
+                self._connection.close()
+
+            try:
+                self._connection = self.connect(db_path)
+                self._connection.execute("DELETE FROM metadata WHERE expires_at < ?", (time.time(),))
+                self._connection.commit()
+
+                rows = self._connection.execute(
+                    "SELECT contract_address, selector, args, value, expires_at FROM metadata"
+                ).fetchall()
+
+            except sqlite3.Error as ex:
+                logger.error(f"Error while loading metadata cache, cache is not persisted: {ex}")
+                self._connection = None
+                return
+
+            for contract_address, selector, args, value, expires_at in rows:
+                self.entries[(contract_address, selector, args)] = (json.loads(value), expires_at)
+
+    @staticmethod
+    def connect(db_path: str) -> sqlite3.Connection:
+        """
+        Open cache file and create metadata table if it does not exist
+        Args:
+            db_path: sqlite file path
+        """
+        connection = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        connection.execute(
+            "CREATE TABLE IF NOT EXISTS metadata ("
+            "contract_address TEXT NOT NULL, "
+            "selector TEXT NOT NULL, "
+            "args TEXT NOT NULL, "
+            "value TEXT NOT NULL, "
+            "expires_at REAL, "
+            "PRIMARY KEY (contract_address, selector, args))"
+        )
+        connection.commit()
+
+        return connection
+
+    def _reset_after_fork(self):
+        """
+        Reopen cache file in a forked process, connection and lock of parent process are not used.
+        Inherited connection is not closed, as closing it could release locks held by parent process.
+        """
+        if self._owner_pid == os.getpid():
+            return
+
+        self._owner_pid = os.getpid()
+        self._lock = th.Lock()
+
+        if self._connection is None or self._db_path is None:
+            return
+
+        try:
+            self._connection = self.connect(self._db_path)
+
+        except sqlite3.Error as ex:
+            logger.error(f"Error while reopening metadata cache, cache is not persisted: {ex}")
+            self._connection = None
+
+    @staticmethod
+    def get_key(
+            contract_address: Union[int, str],
+            selector: str,
+            args: Sequence = (),
+    ) -> MetadataKey:
+        if isinstance(contract_address, str):
+            contract_address = int(contract_address, 16)
+
+        return hex(contract_address), selector, json.dumps(list(args))
+
+    def get(
+            self,
+            contract_address: Union[int, str],
+            selector: str,
+            args: Sequence = (),
+    ) -> Optional[Any]:
+        """
+        Get cached value, None if value is not cached or expired
+        Args:
+            contract_address: contract address
+            selector: function name
+            args: call args
+        """
+        key = self.get_key(contract_address, selector, args)
+
+        self._reset_after_fork()
+
+        with self._lock:
+            entry = self.entries.get(key)
+
+        if entry is None:
+            return None
+
+        value, expires_at = entry
+        if expires_at is not None and expires_at < time.time():
+            return None
+
+        return value
+
+    def set(
+            self,
+            contract_address: Union[int, str],
+            selector: str,
+            value: Any,
+            args: Sequence = (),
+            ttl_sec: Optional[float] = None,
+    ):
+        """
+        Cache value in memory and in cache file
+        Args:
+            contract_address: contract address
+            selector: function name
+            value: json serializable value
+            args: call args
+            ttl_sec: entry time to live, None for immutable data
+        """
+        key = self.get_key(contract_address, selector, args)
+        expires_at = time.time() + ttl_sec if ttl_sec is not None else None
+
+        self._reset_after_fork()
+
+        with self._lock:
+            self.entries[key] = (value, expires_at)
+
+            if self._connection is None:
+                return
+
+            try:
+                self._connection.execute(
+                    "INSERT OR REPLACE INTO metadata VALUES (?, ?, ?, ?, ?)",
+                    (*key, json.dumps(value), expires_at)
+                )
+                self._connection.commit()
+
+            except sqlite3.Error as ex:
+                logger.error(f"Error while saving metadata cache entry: {ex}")
+
+    def invalidate(
+            self,
+            contract_address: Union[int, str],
+            selector: Optional[str] = None,
+    ):
+        """
+        Drop cached entries of contract
+        Args:
+            contract_address: contract address
+            selector: function name, None to drop all entries of contract
+        """
+        address_key, _, _ = self.get_key(contract_address, selector or "")
+
+        self._reset_after_fork()
+
+        with self._lock:
+            for key in list(self.entries):
+                if key[0] == address_key and (selector is None or key[1] == selector):
+                    self.entries.pop(key)
+
+            if self._connection is None:
+                return
+
+            try:
+                if selector is None:
+                    self._connection.execute("DELETE FROM metadata WHERE contract_address = ?", (address_key,))
+                else:
+                    self._connection.execute(
+                        "DELETE FROM metadata WHERE contract_address = ? AND selector = ?",
+                        (address_key, selector)
+                    )
+                self._connection.commit()
+
+            except sqlite3.Error as ex:
+                logger.error(f"Error while invalidating metadata cache: {ex}")
+
+    async def get_or_fetch(
+            self,
+            contract_address: Union[int, str],
+            selector: str,
+            fetch: Callable[[], Awaitable[Any]],
+            args: Sequence = (),
+            ttl_sec: Optional[float] = None,
+    ) -> Optional[Any]:
+        """
+        Get cached value or fetch and cache it, None results of fetch are not cached
+        Args:
+            contract_address: contract address
+            selector: function name
+            fetch: coroutine function fetching the value
+            args: call args
+            ttl_sec: entry time to live, None for immutable data
+        """
+        value = self.get(contract_address, selector, args)
+        if value is not None:
+            return value
+
+        value = await fetch()
+        if value is not None:
+            self.set(contract_address, selector, value, args=args, ttl_sec=ttl_sec)
+
+        return value
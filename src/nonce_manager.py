@@ -0,0 +1,75 @@
+import asyncio
+from typing import Optional
+
+from loguru import logger
+from starknet_py.net.full_node_client import FullNodeClient
+
+
+class NonceManager:
+    """
+    Pending nonce of an account tracked locally. Nonce is read from chain once and then
+    handed out sequentially to transactions of the account, so back-to-back transactions
+    don't wait for receipts of previous ones. Nonce is resynced from chain after a rejection.
+    """
+
+    def __init__(self, address: int):
+        self.address = address
+
+        self.next_nonce: Optional[int] = None
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock: Optional[asyncio.Lock] = None
+
+    def _get_lock(self) -> asyncio.Lock:
+        # Lock is bound to event loop, context may be reused on another loop
+        loop = asyncio.get_running_loop()
+        if self._lock is None or self._loop is not loop:
+            self._loop = loop
+            self._lock = asyncio.Lock()
+
+        return self._lock
+
+    async def sync(self, client: FullNodeClient) -> int:
+        """
+        Read pending nonce of account from chain
+        Args:
+            client: client to read nonce with
+        """
+        self.next_nonce = await client.get_contract_nonce(self.address, block_number="pending")
+        return self.next_nonce
+
+    async def get_nonce(self, client: FullNodeClient) -> int:
+        """
+        Get nonce for next transaction without reserving it, e.g. for fee estimation
+        Args:
+            client: client to sync nonce with
+        """
+        async with self._get_lock():
+            if self.next_nonce is None:
+                await self.sync(client)
+
+            return self.next_nonce
+
+    async def acquire(self, client: FullNodeClient) -> int:
+        """
+        Reserve nonce for a transaction to be sent
+        Args:
+            client: client to sync nonce with
+        """
+        async with self._get_lock():
+            if self.next_nonce is None:
+                await self.sync(client)
+
+            nonce = self.next_nonce
+            self.next_nonce += 1
+
+            return nonce
+
+    def invalidate(self):
+        """
+        Drop local nonce, it is read from chain on next use
+        """
+        if self.next_nonce is not None:
+            logger.debug(f"Nonce of {hex(self.address)} invalidated, will be resynced")
+
+        self.next_nonce = None
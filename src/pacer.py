@@ -0,0 +1,127 @@
+import heapq
+import asyncio
+import itertools
+import weakref
+from typing import Optional, List, Tuple, Union
+
+import config
+
+
+class Pacer:
+    """
+    Awaitable delays for an event loop, backed by a single timer heap.
+    All sleeping coroutines share one loop timer armed for the nearest deadline,
+    so a sleeping wallet holds no thread or executor slot.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+
+        self._timers: List[Tuple[float, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+        self._timer_handle: Optional[asyncio.TimerHandle] = None
+        self._timer_deadline: Optional[float] = None
+
+    @property
+    def pending(self) -> int:
+        """
+        Amount of not yet fired delays
+        """
+        return len(self._timers)
+
+    def time(self) -> float:
+        return self.loop.time()
+
+    def sleep_until(self, deadline: float) -> asyncio.Future:
+        """
+        Get future resolved at deadline (loop time)
+        Args:
+            deadline: loop time to wake up at
+        """
+        future = self.loop.create_future()
+
+        if deadline <= self.loop.time():
+            future.set_result(None)
+            return future
+
+        heapq.heappush(self._timers, (deadline, next(self._counter), future))
+
+        if self._timer_deadline is None or deadline < self._timer_deadline:
+            self._arm_timer()
+
+        return future
+
+    def sleep(self, delay_sec: Union[int, float]) -> asyncio.Future:
+        """
+        Get future resolved after delay
+        Args:
+            delay_sec: delay in seconds
+        """
+        return self.sleep_until(self.loop.time() + delay_sec)
+
+    def _arm_timer(self):
+        if self._timer_handle is not None:
+            self._timer_handle.cancel()
+            self._timer_handle = None
+            self._timer_deadline = None
+
+        if not self._timers:
+            return
+
+        self._timer_deadline = self._timers[0][0]
+        self._timer_handle = self.loop.call_at(self._timer_deadline, self._fire)
+
+    def _fire(self):
+        self._timer_handle = None
+        self._timer_deadline = None
+
+        now = self.loop.time()
+        while self._timers and self._timers[0][0] <= now:
+            _, _, future = heapq.heappop(self._timers)
+            if not future.done():
+                future.set_result(None)
+
+        self._arm_timer()
+
+
+_pacers: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Pacer]" = weakref.WeakKeyDictionary()
+
+
+def get_pacer(loop: Optional[asyncio.AbstractEventLoop] = None) -> Pacer:
+    """
+    Get pacer of event loop, current running loop is used by default
+    Args:
+        loop: event loop
+    """
+    if loop is None:
+        loop = asyncio.get_running_loop()
+
+    pacer = _pacers.get(loop)
+    if pacer is None:
+        pacer = Pacer(loop)
+        _pacers[loop] = pacer
+
+    return pacer
+
+
+async def sleep(delay_sec: Union[int, float]):
+    """
+    Non-blocking delay on current event loop
+    Args:
+        delay_sec: delay in seconds
+    """
+    await get_pacer().sleep(delay_sec)
+
+
+async def wallet_delay():
+    """
+    Delay between wallets starts
+    """
+    await sleep(config.DEFAULT_DELAY_SEC)
+
+
+async def retry_delay():
+    """
+    Delay between transaction send retries
+    """
+    await sleep(config.DEFAULT_RETRY_DELAY_SEC)
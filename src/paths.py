@@ -18,6 +18,7 @@ GUI_IMAGES_DIR = os.path.join(GUI_DIR, 'images')
 DARK_MODE_LOGO_IMG = os.path.join(GUI_IMAGES_DIR, 'dark_mode_logo.png')
 LIGHT_MODE_LOGO_IMG = os.path.join(GUI_IMAGES_DIR, 'light_mode_logo.png')
 ACCOUNT_ABI_FILE = os.path.join(ACCOUNT_DIR, "account.abi")
+METADATA_CACHE_FILE = os.path.join(MAIN_DIR, "metadata_cache.db")
 
 
 class JediSwapDir:
@@ -0,0 +1,69 @@
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+import config
+
+
+class PrefetchRead:
+    """
+    Independent read declared by a module to run in prefetch stage
+    """
+
+    def __init__(
+            self,
+            name: str,
+            fetch: Callable[[], Awaitable[Any]],
+            timeout_sec: Optional[float] = None,
+            required: bool = True,
+    ):
+        self.name = name
+        self.fetch = fetch
+        self.timeout_sec = timeout_sec if timeout_sec is not None else config.PREFETCH_READ_TIMEOUT_SEC
+        self.required = required
+
+    async def run(self) -> Any:
+        return await asyncio.wait_for(self.fetch(), timeout=self.timeout_sec)
+
+
+class PrefetchResult:
+    """
+    Values of prefetch reads by read name, with errors of failed reads
+    """
+
+    def __init__(self):
+        self.values: Dict[str, Any] = {}
+        self.errors: Dict[str, Exception] = {}
+        self.required_names: List[str] = []
+
+    @property
+    def is_ok(self) -> bool:
+        return not any(name in self.errors for name in self.required_names)
+
+    def get(self, name: str, default: Any = None) -> Any:
+        return self.values.get(name, default)
+
+    def get_error_message(self) -> str:
+        return ", ".join(
+            f"{name}: {str(error) or type(error).__name__}"
+            for name, error in self.errors.items()
+        )
+
+
+async def run_prefetch(reads: List[PrefetchRead]) -> PrefetchResult:
+    """
+    Run reads concurrently, each with its own timeout. Errors are collected instead of raised.
+    Args:
+        reads: reads to run, names must be unique
+    """
+    result = PrefetchResult()
+    result.required_names = [read.name for read in reads if read.required]
+
+    values = await asyncio.gather(*[read.run() for read in reads], return_exceptions=True)
+
+    for read, value in zip(reads, values):
+        if isinstance(value, Exception):
+            result.errors[read.name] = value
+        else:
+            result.values[read.name] = value
+
+    return result
@@ -0,0 +1,148 @@
+import time
+import asyncio
+import threading as th
+from concurrent.futures import Future
+from typing import Optional, Dict, List
+
+from loguru import logger
+
+from src.schemas.proxy_data import ProxyData
+from src.proxy_manager import ProxyManager
+from src.storage import Storage
+import config
+
+
+class ProxyVerdict:
+    """
+    Result of proxy egress ip check
+    """
+
+    def __init__(self, ip: Optional[str]):
+        self.ip = ip
+        self.checked_at = time.monotonic()
+
+    @property
+    def is_valid(self) -> bool:
+        return self.ip is not None
+
+    @property
+    def is_stale(self) -> bool:
+        ttl_sec = config.PROXY_CHECK_TTL_SEC if self.is_valid else config.PROXY_FAILED_RECHECK_SEC
+        return time.monotonic() - self.checked_at >= ttl_sec
+
+
+class ProxyHealthCache:
+    """
+    Process-wide cache of proxy egress ip checks.
+    Each distinct proxy is checked once on a background event loop, stale verdicts are
+    served as is while being revalidated in background.
+    """
+    _instance = None
+
+    _verdicts: Dict[Optional[str], ProxyVerdict]
+    _checks: Dict[Optional[str], Future]
+    _lock: th.Lock
+    _loop: Optional[asyncio.AbstractEventLoop]
+
+    def __new__(cls):
+        if not cls._instance:
+            instance = super(ProxyHealthCache, cls).__new__(cls)
+            instance._verdicts = {}
+            instance._checks = {}
+            instance._lock = th.Lock()
+            instance._loop = None
+
+            cls._instance = instance
+
+        return cls._instance
+
+    @staticmethod
+    def get_key(proxy_data: Optional[ProxyData]) -> Optional[str]:
+        """
+        Get cache key of proxy, None for direct connection
+        Args:
+            proxy_data: proxy data
+        """
+        if proxy_data is None or not Storage().app_config.use_proxy:
+            return None
+
+        return proxy_data.to_string()
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            th.Thread(target=self._loop.run_forever, name="proxy_health_checks", daemon=True).start()
+
+        return self._loop
+
+    async def _check(self, key: Optional[str], proxy_data: Optional[ProxyData]) -> ProxyVerdict:
+        verdict = ProxyVerdict(ip=await ProxyManager(proxy_data).get_ip())
+
+        if not verdict.is_valid and key is not None:
+            logger.warning(f"Proxy {proxy_data.host}:{proxy_data.port} check failed")
+
+        with self._lock:
+            self._verdicts[key] = verdict
+            self._checks.pop(key, None)
+
+        return verdict
+
+    def _start_check(self, proxy_data: Optional[ProxyData]) -> Future:
+        """
+        Start background check of proxy if it is not running
+        Args:
+            proxy_data: proxy data
+        """
+        key = self.get_key(proxy_data)
+
+        with self._lock:
+            check = self._checks.get(key)
+            if check is None:
+                check = asyncio.run_coroutine_threadsafe(self._check(key, proxy_data), self._get_loop())
+                self._checks[key] = check
+
+            return check
+
+    def get_verdict(self, proxy_data: Optional[ProxyData]) -> Optional[ProxyVerdict]:
+        """
+        Get cached verdict without waiting, stale verdict triggers background revalidation
+        Args:
+            proxy_data: proxy data
+        Returns: cached verdict or None if proxy was not checked yet
+        """
+        with self._lock:
+            verdict = self._verdicts.get(self.get_key(proxy_data))
+
+        if verdict is None or verdict.is_stale:
+            self._start_check(proxy_data)
+
+        return verdict
+
+    async def verify(self, proxy_data: Optional[ProxyData]) -> ProxyVerdict:
+        """
+        Get verdict, waits for check only if proxy was not checked yet
+        Args:
+            proxy_data: proxy data
+        """
+        verdict = self.get_verdict(proxy_data)
+        if verdict is not None:
+            return verdict
+
+        return await asyncio.wrap_future(self._start_check(proxy_data))
+
+    async def revalidate(self, proxy_data: Optional[ProxyData]) -> ProxyVerdict:
+        """
+        Check proxy again and wait for the new verdict
+        Args:
+            proxy_data: proxy data
+        """
+        return await asyncio.wrap_future(self._start_check(proxy_data))
+
+    def prefetch(self, proxies: List[Optional[ProxyData]]):
+        """
+        Start background checks of proxies not checked yet
+        Args:
+            proxies: list of proxies
+        """
+        for proxy_data in proxies:
+            self.get_verdict(proxy_data)
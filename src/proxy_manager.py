@@ -1,26 +1,41 @@
 import aiohttp.typedefs
 from typing import Union, Optional
-from aiohttp_socks import SocksConnector
 
 from loguru import logger
 from starknet_py.net.full_node_client import FullNodeClient
 from starknet_py.net.http_client import HttpMethod
 from src.schemas.proxy_data import ProxyData
 from src.custom_client_session import CustomSession
+from src.transport_registry import TransportRegistry
+from src.transport_registry import TransportKey
 from src.storage import Storage
 
 
 class ProxyManager:
     def __init__(self, proxy_data: ProxyData):
         self.proxy_data = proxy_data
-        self.connector = None
 
-    def get_session(self) -> Union[aiohttp.ClientSession, None]:
+    def get_session(self) -> CustomSession:
+        """
+        Get shared long-lived session for proxy, the session is closed on executor shutdown
+        """
         if self.proxy_data and Storage().app_config.use_proxy:
             return self.get_custom_session_for_proxy()
         else:
             return self.get_custom_session()
 
+    def get_transport_key(self) -> TransportKey:
+        """
+        Get (proxy type, proxy url) of session, to get session of the same proxy on another event loop
+        """
+        if not (self.proxy_data and Storage().app_config.use_proxy):
+            return None, None
+
+        proxies = self.get_proxy()
+        proxy_unit = proxies.get(f"{self.proxy_data.proxy_type}://") if proxies else None
+
+        return self.proxy_data.proxy_type, proxy_unit
+
     def get_proxy(self) -> Union[dict, None, bool]:
         proxy_data = self.proxy_data
         if proxy_data is None:
@@ -49,46 +64,24 @@ class ProxyManager:
                 payload=None,
                 params=None
             )
-            await session.close()
-            await self.close_connector()
 
             return response['ip']
 
         except Exception as ex:
             logger.error(f"Failed to get ip or bad auth params")
-            await session.close()
-            await self.close_connector()
             return None
 
-    def get_custom_session_for_proxy(self) -> aiohttp.ClientSession:
+    def get_custom_session_for_proxy(self) -> CustomSession:
         proxies = self.get_proxy()
 
         proxy_unit: Optional[aiohttp.typedefs.StrOrURL] = (
             proxies.get(f"{self.proxy_data.proxy_type}://") if proxies else None
         )
 
-        if self.proxy_data.proxy_type == 'http':
-            self.connector = aiohttp.TCPConnector(limit=10)
-            custom_session = CustomSession(proxy=proxy_unit, connector=self.connector)
-
-        elif self.proxy_data.proxy_type == 'socks5':
-            self.connector = SocksConnector.from_url(
-                url=proxy_unit
-            )
-            custom_session = CustomSession(connector=self.connector)
-
-        else:
-            raise ValueError(f"Unknown proxy type: {self.proxy_data.proxy_type}")
-
-        return custom_session
-
-    def get_custom_session(self) -> aiohttp.ClientSession:
-        self.connector = aiohttp.TCPConnector(limit=10)
-        custom_session = CustomSession(connector=self.connector)
-
-        return custom_session
+        return TransportRegistry().get_session(
+            proxy_type=self.proxy_data.proxy_type,
+            proxy_url=proxy_unit,
+        )
 
-    async def close_connector(self):
-        if self.connector:
-            await self.connector.close()
-            self.connector = None
+    def get_custom_session(self) -> CustomSession:
+        return TransportRegistry().get_session()
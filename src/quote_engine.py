@@ -0,0 +1,188 @@
+import time
+import asyncio
+import weakref
+import threading as th
+from typing import Any, Awaitable, Callable, Dict, Hashable, Optional, Tuple
+
+from starknet_py.net.full_node_client import FullNodeClient
+
+import config
+
+
+class ReservesSnapshot:
+    """
+    Reserves of a pool read at a block
+    """
+
+    def __init__(self, reserves: Any, block_number: int):
+        self.reserves = reserves
+        self.block_number = block_number
+        self.fetched_at = time.monotonic()
+
+
+class QuoteEngine:
+    """
+    Process-wide cache of pool reserves for off-chain swap quotes.
+    Reserves of a pool are read once per block: snapshot is reused until latest block number changes,
+    block number itself is read at most once per 'QUOTE_BLOCK_CHECK_INTERVAL_SEC'. Concurrent reads
+    of the same pool on an event loop share one request, so any amount of wallets swapping the same
+    pair costs one reserves read per block. Amounts are computed from reserves by DEX modules.
+    """
+    _instance = None
+
+    _snapshots: Dict[Hashable, ReservesSnapshot]
+    _block_number: Optional[int]
+    _block_checked_at: float
+    _pending: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[Hashable, asyncio.Task]]"
+    _lock: th.Lock
+
+    def __new__(cls):
+        if not cls._instance:
+            instance = super(QuoteEngine, cls).__new__(cls)
+            instance._snapshots = {}
+            instance._block_number = None
+            instance._block_checked_at = 0
+            instance._pending = weakref.WeakKeyDictionary()
+            instance._lock = th.Lock()
+
+            cls._instance = instance
+
+        return cls._instance
+
+    async def _fetch_shared(self, key: Hashable, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fetch once for all concurrent callers with the same key on current event loop
+        Args:
+            key: request key
+            fetch: coroutine function doing the request
+        """
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            loop_pending = self._pending.setdefault(loop, {})
+            task = loop_pending.get(key)
+            if task is None:
+                task = loop.create_task(fetch())
+                loop_pending[key] = task
+                task.add_done_callback(lambda _: loop_pending.pop(key, None))
+
+        return await asyncio.shield(task)
+
+    async def fetch_block_number(self, client: FullNodeClient) -> int:
+        block_number = await client.get_block_number()
+
+        with self._lock:
+            self._block_number = block_number
+            self._block_checked_at = time.monotonic()
+
+        return block_number
+
+    async def get_block_number(self, client: FullNodeClient) -> int:
+        """
+        Get latest block number, cached for 'QUOTE_BLOCK_CHECK_INTERVAL_SEC'
+        Args:
+            client: client to read block number with
+        """
+        with self._lock:
+            block_number = self._block_number
+            is_fresh = time.monotonic() - self._block_checked_at < config.QUOTE_BLOCK_CHECK_INTERVAL_SEC
+
+        if block_number is not None and is_fresh:
+            return block_number
+
+        return await self._fetch_shared(
+            key="block_number",
+            fetch=lambda: self.fetch_block_number(client=client),
+        )
+
+    async def get_reserves(
+            self,
+            pool_key: Hashable,
+            client: FullNodeClient,
+            fetch: Callable[[], Awaitable[Any]],
+    ) -> Any:
+        """
+        Get reserves of a pool read at latest block
+        Args:
+            pool_key: key of pool, e.g. DEX name and pool address
+            client: client to read block number with
+            fetch: coroutine function reading reserves of the pool
+        """
+        block_number = await self.get_block_number(client=client)
+
+        with self._lock:
+            snapshot = self._snapshots.get(pool_key)
+
+        if snapshot is not None and snapshot.block_number >= block_number:
+            return snapshot.reserves
+
+        reserves = await self._fetch_shared(key=(pool_key, block_number), fetch=fetch)
+
+        with self._lock:
+            snapshot = self._snapshots.get(pool_key)
+            if snapshot is None or snapshot.block_number <= block_number:
+                self._snapshots[pool_key] = ReservesSnapshot(reserves=reserves, block_number=block_number)
+
+        return reserves
+
+    def invalidate(self, pool_key: Optional[Hashable] = None):
+        """
+        Drop reserves snapshot of a pool
+        Args:
+            pool_key: key of pool, None to drop all snapshots
+        """
+        with self._lock:
+            if pool_key is None:
+                self._snapshots = {}
+            else:
+                self._snapshots.pop(pool_key, None)
+
+    def get_snapshot(self, pool_key: Hashable) -> Optional[ReservesSnapshot]:
+        with self._lock:
+            return self._snapshots.get(pool_key)
+
+
+def get_amount_out_constant_product(
+        amount_in: int,
+        reserve_in: int,
+        reserve_out: int,
+        fee_numerator: int = 997,
+        fee_denominator: int = 1000,
+) -> int:
+    """
+    Get swap output of constant product pool, same integer math as Uniswap V2 'getAmountOut'
+    Args:
+        amount_in: amount of input token in wei
+        reserve_in: pool reserve of input token
+        reserve_out: pool reserve of output token
+        fee_numerator: share of input left after fee, numerator
+        fee_denominator: share of input left after fee, denominator
+    """
+    if amount_in <= 0 or reserve_in <= 0 or reserve_out <= 0:
+        return 0
+
+    amount_in_with_fee = amount_in * fee_numerator
+    numerator = amount_in_with_fee * reserve_out
+    denominator = reserve_in * fee_denominator + amount_in_with_fee
+
+    return numerator // denominator
+
+
+def get_sorted_reserves(
+        token_in: int,
+        token0: int,
+        reserve0: int,
+        reserve1: int,
+) -> Tuple[int, int]:
+    """
+    Get reserves of pair as (reserve in, reserve out) for input token
+    Args:
+        token_in: input token address
+        token0: address of pair token0
+        reserve0: reserve of token0
+        reserve1: reserve of token1
+    """
+    if token_in == token0:
+        return reserve0, reserve1
+
+    return reserve1, reserve0
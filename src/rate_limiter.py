@@ -0,0 +1,129 @@
+import time
+import threading as th
+from typing import Dict, Optional, Tuple, Union
+
+from yarl import URL
+
+from src.storage import Storage
+from src import pacer
+import config
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket. Tokens may go negative, which means requests are
+    queued: each caller reserves its token and sleeps until the reservation is due.
+    """
+
+    def __init__(self, rate: float, burst: int):
+        self.rate = rate
+        self.burst = max(1, burst)
+
+        self._tokens = float(self.burst)
+        self._updated_at = time.monotonic()
+        self._lock = th.Lock()
+
+    def reserve(self) -> float:
+        """
+        Take a token
+        Returns: seconds to wait before the token may be used
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated_at) * self.rate)
+            self._updated_at = now
+
+            self._tokens -= 1
+            if self._tokens >= 0:
+                return 0
+
+            return -self._tokens / self.rate
+
+    async def acquire(self):
+        """
+        Wait for a token
+        """
+        delay_sec = self.reserve()
+        if delay_sec:
+            await pacer.sleep(delay_sec)
+
+
+class RateLimiter:
+    """
+    Process-wide per host token buckets.
+    Hosts from config 'HOSTS_RATE_LIMITS' use their own limits, other hosts use
+    app config 'requests_rate_limit_rps' and 'requests_rate_limit_burst'.
+    """
+    _instance = None
+
+    _buckets: Dict[str, TokenBucket]
+    _lock: th.Lock
+    rate_share: float
+
+    def __new__(cls):
+        if not cls._instance:
+            instance = super(RateLimiter, cls).__new__(cls)
+            instance._buckets = {}
+            instance._lock = th.Lock()
+            instance.rate_share = 1.0
+
+            cls._instance = instance
+
+        return cls._instance
+
+    def set_rate_share(self, rate_share: float):
+        """
+        Set share of configured rates used by this process, e.g. when the limits
+        are split between several worker processes. Resets existing buckets.
+        Args:
+            rate_share: share of rates, (0, 1]
+        """
+        with self._lock:
+            self.rate_share = rate_share
+            self._buckets = {}
+
+    def get_limits(self, host: str) -> Tuple[float, int]:
+        """
+        Get configured (rps, burst) of host
+        Args:
+            host: host name
+        """
+        if host in config.HOSTS_RATE_LIMITS:
+            return config.HOSTS_RATE_LIMITS[host]
+
+        app_config = Storage().app_config
+        if app_config is None:
+            return config.DEFAULT_RATE_LIMIT_RPS, config.DEFAULT_RATE_LIMIT_BURST
+
+        return app_config.requests_rate_limit_rps, app_config.requests_rate_limit_burst
+
+    def get_bucket(self, host: str) -> TokenBucket:
+        """
+        Get or create token bucket of host
+        Args:
+            host: host name
+        """
+        with self._lock:
+            bucket = self._buckets.get(host)
+
+            if bucket is None:
+                rps, burst = self.get_limits(host)
+                bucket = TokenBucket(
+                    rate=rps * self.rate_share,
+                    burst=max(1, int(burst * self.rate_share)),
+                )
+                self._buckets[host] = bucket
+
+            return bucket
+
+    async def acquire(self, url: Union[str, URL, None]):
+        """
+        Wait until a request to url is allowed
+        Args:
+            url: request url
+        """
+        host: Optional[str] = URL(url).host if url else None
+        if not host:
+            return
+
+        await self.get_bucket(host).acquire()
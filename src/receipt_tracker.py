@@ -0,0 +1,319 @@
+import os
+import time
+import asyncio
+import threading as th
+from contextvars import ContextVar
+from typing import Optional, Dict, List
+
+from loguru import logger
+from starknet_py.net.client import _status_to_finality_execution
+from starknet_py.net.client_errors import ClientError
+from starknet_py.net.client_models import TransactionReceipt
+from starknet_py.net.client_models import TransactionExecutionStatus
+from starknet_py.net.client_models import TransactionFinalityStatus
+from starknet_py.net.full_node_client import FullNodeClient
+
+from src.rpc_pool import RpcPool
+from src.transport_registry import TransportRegistry
+from src.transport_registry import TransportKey
+from src import pacer
+import config
+
+
+# Worker slot of executor task, released while the task waits for receipt
+worker_slot_var: ContextVar[Optional[asyncio.Semaphore]] = ContextVar("worker_slot", default=None)
+
+
+class ReceiptWaiter:
+    """
+    Future of a transaction receipt bound to the event loop of a waiting task
+    """
+
+    def __init__(
+            self,
+            loop: asyncio.AbstractEventLoop,
+            timeout_sec: float,
+            transport_key: TransportKey = (None, None),
+    ):
+        self.loop = loop
+        self.future = loop.create_future()
+        self.deadline = time.monotonic() + timeout_sec
+        self.transport_key = transport_key
+
+    def resolve(self, receipt: Optional[TransactionReceipt]):
+        try:
+            self.loop.call_soon_threadsafe(self._set_result, receipt)
+        except RuntimeError:
+            # Waiter loop is closed
+            pass
+
+    def _set_result(self, receipt: Optional[TransactionReceipt]):
+        if not self.future.done():
+            self.future.set_result(receipt)
+
+
+class ReceiptTracker:
+    """
+    Process-wide tracker of sent transactions.
+    Receipts of all pending transactions are polled together once per 'RECEIPT_POLL_INTERVAL_SEC'
+    in background thread. Receipts are requested through the proxy of the wallet that sent the
+    transaction, concurrent receipt requests of one proxy are sent as one RPC batch request.
+    Each waiter gets receipt once transaction is accepted, reverted or rejected, or None on timeout.
+    Waiters and polling thread inherited by a forked process are dropped.
+    """
+    _instance = None
+
+    _waiters: Dict[int, List[ReceiptWaiter]]
+    _lock: th.Lock
+    _polling_thread: Optional[th.Thread]
+    _owner_pid: int
+
+    def __new__(cls):
+        if not cls._instance:
+            instance = super(ReceiptTracker, cls).__new__(cls)
+            instance._waiters = {}
+            instance._lock = th.Lock()
+            instance._polling_thread = None
+            instance._owner_pid = os.getpid()
+
+            cls._instance = instance
+
+        return cls._instance
+
+    def _reset_after_fork(self):
+        """
+        Drop polling thread and waiters inherited from parent process
+        """
+        if self._owner_pid == os.getpid():
+            return
+
+        self._owner_pid = os.getpid()
+        self._lock = th.Lock()
+        self._polling_thread = None
+        self._waiters = {}
+
+    @property
+    def pending_amount(self) -> int:
+        self._reset_after_fork()
+
+        with self._lock:
+            return len(self._waiters)
+
+    def start_polling(self):
+        """
+        Start background polling thread if it is not running
+        """
+        self._reset_after_fork()
+
+        with self._lock:
+            if self._polling_thread is not None and self._polling_thread.is_alive():
+                return
+
+            self._polling_thread = th.Thread(target=self._run_polling, name="receipt_tracker_polling", daemon=True)
+            self._polling_thread.start()
+
+    def _run_polling(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        try:
+            loop.run_until_complete(self.polling_loop())
+        finally:
+            loop.run_until_complete(TransportRegistry().close_sessions())
+            loop.close()
+
+    async def polling_loop(self):
+        while True:
+            await pacer.sleep(config.RECEIPT_POLL_INTERVAL_SEC)
+            await self.poll()
+
+            with self._lock:
+                if not self._waiters:
+                    self._polling_thread = None
+                    return
+
+    @staticmethod
+    def is_final(receipt: TransactionReceipt) -> bool:
+        """
+        Check if transaction is accepted, reverted or rejected
+        Args:
+            receipt: transaction receipt
+        """
+        deprecated_status = _status_to_finality_execution(receipt.status)
+        finality_status = receipt.finality_status or deprecated_status[0]
+        execution_status = receipt.execution_status or deprecated_status[1]
+
+        if execution_status is not None:
+            return True
+
+        return finality_status in (
+            TransactionFinalityStatus.ACCEPTED_ON_L2,
+            TransactionFinalityStatus.ACCEPTED_ON_L1,
+        )
+
+    @staticmethod
+    def is_rejected(receipt: TransactionReceipt) -> bool:
+        """
+        Check if transaction is rejected, nonce of rejected transaction is not used
+        Args:
+            receipt: transaction receipt
+        """
+        execution_status = receipt.execution_status or _status_to_finality_execution(receipt.status)[1]
+        return execution_status == TransactionExecutionStatus.REJECTED
+
+    @staticmethod
+    def get_failure_reason(receipt: TransactionReceipt) -> Optional[str]:
+        """
+        Get revert or rejection reason, None if transaction is not failed
+        Args:
+            receipt: transaction receipt
+        """
+        execution_status = receipt.execution_status or _status_to_finality_execution(receipt.status)[1]
+
+        if execution_status == TransactionExecutionStatus.REJECTED:
+            return receipt.rejection_reason or "rejected"
+
+        if execution_status == TransactionExecutionStatus.REVERTED:
+            return receipt.revert_reason or receipt.revert_error or "reverted"
+
+        return None
+
+    async def fetch_receipt(self, client: FullNodeClient, tx_hash: int) -> Optional[TransactionReceipt]:
+        """
+        Fetch receipt of transaction, None if transaction is not known or not final yet
+        Args:
+            client: client to fetch with
+            tx_hash: transaction hash
+        """
+        try:
+            receipt = await client.get_transaction_receipt(tx_hash=tx_hash)
+
+        except ClientError as ex:
+            if "Transaction hash not found" not in ex.message:
+                logger.debug(f"Error while getting receipt of {hex(tx_hash)}: {ex}")
+            return None
+
+        if not self.is_final(receipt):
+            return None
+
+        return receipt
+
+    @staticmethod
+    def get_client(transport_key: TransportKey) -> FullNodeClient:
+        proxy_type, proxy_url = transport_key
+        session = TransportRegistry().get_session(proxy_type=proxy_type, proxy_url=proxy_url)
+
+        return RpcPool().get_client(session=session)
+
+    async def poll(self):
+        """
+        Fetch receipts of all pending transactions and resolve waiters of final and timed out ones.
+        Each receipt is fetched through the proxy of its first waiter.
+        """
+        with self._lock:
+            tx_hashes = list(self._waiters)
+            transport_keys = [self._waiters[tx_hash][0].transport_key for tx_hash in tx_hashes]
+
+        # Clients are shared per proxy, so receipts of one proxy are batched together
+        clients = {transport_key: self.get_client(transport_key) for transport_key in set(transport_keys)}
+
+        receipts = await asyncio.gather(
+            *[
+                self.fetch_receipt(client=clients[transport_key], tx_hash=tx_hash)
+                for tx_hash, transport_key in zip(tx_hashes, transport_keys)
+            ],
+            return_exceptions=True,
+        )
+
+        now = time.monotonic()
+        resolved: List[tuple] = []
+
+        with self._lock:
+            for tx_hash, receipt in zip(tx_hashes, receipts):
+                if isinstance(receipt, Exception):
+                    logger.debug(f"Error while getting receipt of {hex(tx_hash)}: {receipt}")
+                    receipt = None
+
+                waiters = self._waiters.get(tx_hash, [])
+
+                if receipt is not None:
+                    resolved.extend((waiter, receipt) for waiter in waiters)
+                    waiters = []
+                else:
+                    resolved.extend((waiter, None) for waiter in waiters if waiter.deadline <= now)
+                    waiters = [waiter for waiter in waiters if waiter.deadline > now]
+
+                if waiters:
+                    self._waiters[tx_hash] = waiters
+                else:
+                    self._waiters.pop(tx_hash, None)
+
+        for waiter, receipt in resolved:
+            waiter.resolve(receipt)
+
+    def track(
+            self,
+            tx_hash: int,
+            timeout_sec: float,
+            transport_key: TransportKey = (None, None),
+    ) -> ReceiptWaiter:
+        """
+        Add transaction to pending ones
+        Args:
+            tx_hash: transaction hash
+            timeout_sec: time to wait for receipt
+            transport_key: proxy type and url to fetch receipt through
+        """
+        self._reset_after_fork()
+
+        waiter = ReceiptWaiter(
+            loop=asyncio.get_running_loop(),
+            timeout_sec=timeout_sec,
+            transport_key=transport_key,
+        )
+
+        with self._lock:
+            self._waiters.setdefault(tx_hash, []).append(waiter)
+
+        self.start_polling()
+
+        return waiter
+
+    def untrack(self, tx_hash: int, waiter: ReceiptWaiter):
+        with self._lock:
+            waiters = self._waiters.get(tx_hash, [])
+            if waiter in waiters:
+                waiters.remove(waiter)
+
+            if not waiters:
+                self._waiters.pop(tx_hash, None)
+
+    async def wait_for_receipt(
+            self,
+            tx_hash: int,
+            timeout_sec: float,
+            transport_key: TransportKey = (None, None),
+    ) -> Optional[TransactionReceipt]:
+        """
+        Wait for transaction to be accepted, reverted or rejected.
+        Worker slot of current executor task is released while waiting.
+        Args:
+            tx_hash: transaction hash
+            timeout_sec: time to wait for receipt
+            transport_key: proxy type and url of wallet session, receipt is fetched through it
+        Returns: receipt, None on timeout
+        """
+        waiter = self.track(tx_hash=tx_hash, timeout_sec=timeout_sec, transport_key=transport_key)
+
+        worker_slot = worker_slot_var.get()
+        if worker_slot is not None:
+            worker_slot.release()
+
+        try:
+            return await waiter.future
+
+        finally:
+            self.untrack(tx_hash=tx_hash, waiter=waiter)
+
+            if worker_slot is not None:
+                await worker_slot.acquire()
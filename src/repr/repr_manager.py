@@ -1,4 +1,5 @@
 import threading as th
+from contextvars import ContextVar
 from typing import List, Dict, Union, Optional
 from typing import TYPE_CHECKING
 
@@ -11,6 +12,22 @@ if TYPE_CHECKING:
     from src.tasks_executor.event_manager import TaskExecEventManager
 
 
+repr_context_id: ContextVar[Optional[int]] = ContextVar("repr_context_id", default=None)
+
+
+def get_repr_context_id() -> int:
+    """
+    Get key of repr items for current execution context.
+    Wallet coroutines running on a shared event loop set their own id,
+    otherwise current thread id is used.
+    """
+    context_id = repr_context_id.get()
+    if context_id is None:
+        return th.get_ident()
+
+    return context_id
+
+
 class ReprManager:
     by_thread_repr_items: Dict[int, List[Union[LogRecord, str]]] = {}
 
@@ -46,7 +63,7 @@ class ReprManager:
         """
 
         if thread is None:
-            thread = th.get_ident()
+            thread = get_repr_context_id()
 
         if thread not in ReprManager.by_thread_repr_items:
             ReprManager.by_thread_repr_items[thread] = []
@@ -59,7 +76,7 @@ class ReprManager:
     @staticmethod
     def get_thread_repr_items(thread: Optional[int] = None):
         if thread is None:
-            thread = th.get_ident()
+            thread = get_repr_context_id()
 
         if thread in ReprManager.by_thread_repr_items:
             return ReprManager.by_thread_repr_items[thread]
@@ -69,7 +86,7 @@ class ReprManager:
     @staticmethod
     def delete_thread_repr_items(thread: Optional[int] = None):
         if thread is None:
-            thread = th.get_ident()
+            thread = get_repr_context_id()
 
         if thread in ReprManager.by_thread_repr_items:
             del ReprManager.by_thread_repr_items[thread]
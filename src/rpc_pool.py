@@ -0,0 +1,427 @@
+import time
+import asyncio
+import threading as th
+from typing import Optional, List, Tuple, Union, Awaitable, Set
+
+import aiohttp
+from loguru import logger
+from starknet_py.net.client_errors import ClientError
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.http_client import RpcHttpClient
+from starknet_py.net.http_client import HttpMethod
+
+from src.custom_client_session import CustomSession
+from src.storage import Storage
+from src import pacer
+import config
+
+
+# Methods sent to pinned endpoint, so nonce reads and transactions hit the same node
+WRITE_METHODS = {
+    "getNonce",
+    "addInvokeTransaction",
+    "addDeployAccountTransaction",
+    "addDeclareTransaction",
+}
+
+# Read methods coalesced into JSON-RPC batch requests when issued concurrently
+BATCH_METHODS = {
+    "call",
+    "getNonce",
+    "getClassHashAt",
+    "getTransactionReceipt",
+}
+
+
+class RpcEndpoint:
+    """
+    RPC node url with its health and latency stats
+    """
+
+    def __init__(self, url: str):
+        self.url = url
+
+        self.latency_sec: Optional[float] = None
+        self.failures = 0
+
+    @property
+    def is_healthy(self) -> bool:
+        return self.failures < config.RPC_ENDPOINT_MAX_FAILURES
+
+    @property
+    def sort_key(self) -> Tuple[bool, float]:
+        latency_sec = self.latency_sec if self.latency_sec is not None else config.RPC_REQUEST_TIMEOUT_SEC
+        return not self.is_healthy, latency_sec
+
+    def report_success(self, latency_sec: float):
+        if self.latency_sec is None:
+            self.latency_sec = latency_sec
+        else:
+            self.latency_sec += (latency_sec - self.latency_sec) * config.RPC_LATENCY_SMOOTHING
+
+        self.failures = 0
+
+    def report_failure(self):
+        self.failures += 1
+
+    def __str__(self):
+        return f"<RpcEndpoint {self.url} latency: {self.latency_sec} failures: {self.failures}>"
+
+
+def is_failover_error(ex: Exception, is_write: bool) -> bool:
+    """
+    Check if request should be retried on another endpoint
+    Args:
+        ex: request exception
+        is_write: if request is a write request, timed out writes may be already accepted by the node
+    """
+    if isinstance(ex, aiohttp.ClientConnectionError):
+        return True
+
+    if isinstance(ex, asyncio.TimeoutError):
+        return not is_write
+
+    if isinstance(ex, ClientError) and ex.code is not None:
+        return str(ex.code) == "429" or str(ex.code).startswith("5")
+
+    return False
+
+
+def is_batch_rejection_error(ex: ClientError) -> bool:
+    """
+    Check if node rejected batch request itself, e.g. with 400, 405 or 413 status
+    Args:
+        ex: batch request exception
+    """
+    if ex.code is None:
+        return False
+
+    return str(ex.code).startswith("4") and str(ex.code) != "429"
+
+
+class RpcPool:
+    """
+    Process-wide pool of RPC endpoints from app config 'rpc_url' and 'extra_rpc_urls'.
+    Reads are routed to the fastest healthy endpoint with failover to the next ones,
+    write methods are pinned to 'rpc_url' while it is healthy if 'rpc_pin_writes' is set.
+    Endpoints are probed in background thread.
+    """
+    _instance = None
+
+    endpoints: List[RpcEndpoint]
+    _lock: th.Lock
+    _probing_thread: Optional[th.Thread]
+
+    def __new__(cls):
+        if not cls._instance:
+            instance = super(RpcPool, cls).__new__(cls)
+            instance.endpoints = []
+            instance._lock = th.Lock()
+            instance._probing_thread = None
+
+            cls._instance = instance
+
+        return cls._instance
+
+    def get_urls(self) -> List[str]:
+        app_config = Storage().app_config
+        urls = [app_config.rpc_url, *app_config.extra_rpc_urls]
+
+        return list(dict.fromkeys(url for url in urls if url))
+
+    def update_endpoints(self):
+        """
+        Sync endpoints with app config urls, keeping stats of known endpoints
+        """
+        urls = self.get_urls()
+
+        with self._lock:
+            if [endpoint.url for endpoint in self.endpoints] == urls:
+                return
+
+            known_endpoints = {endpoint.url: endpoint for endpoint in self.endpoints}
+            self.endpoints = [known_endpoints.get(url) or RpcEndpoint(url) for url in urls]
+
+    def get_endpoints(self, method_name: str) -> List[RpcEndpoint]:
+        """
+        Get endpoints to try for a method, in order
+        Args:
+            method_name: rpc method name without 'starknet_' prefix
+        """
+        self.update_endpoints()
+        if len(self.endpoints) > 1:
+            self.start_probing()
+
+        with self._lock:
+            endpoints = sorted(self.endpoints, key=lambda endpoint: endpoint.sort_key)
+            primary_endpoint = self.endpoints[0]
+
+        is_pinned = method_name in WRITE_METHODS and Storage().app_config.rpc_pin_writes
+        if is_pinned and primary_endpoint.is_healthy:
+            endpoints.remove(primary_endpoint)
+            endpoints.insert(0, primary_endpoint)
+
+        return endpoints
+
+    def report_success(self, endpoint: RpcEndpoint, latency_sec: float):
+        with self._lock:
+            endpoint.report_success(latency_sec)
+
+    def report_failure(self, endpoint: RpcEndpoint):
+        with self._lock:
+            endpoint.report_failure()
+
+    def get_client(self, session: Optional[aiohttp.ClientSession] = None) -> FullNodeClient:
+        """
+        Get client with requests routed through the pool
+        Args:
+            session: session for requests
+        """
+        self.update_endpoints()
+
+        client = FullNodeClient(node_url=self.endpoints[0].url, session=session)
+        client._client = PooledRpcHttpClient(pool=self, session=session)
+
+        if isinstance(session, CustomSession):
+            # Session is not evicted while the client is alive
+            session.holders.add(client)
+
+        return client
+
+    def start_probing(self):
+        """
+        Start background probing thread if it is not running
+        """
+        with self._lock:
+            if self._probing_thread is not None and self._probing_thread.is_alive():
+                return
+
+            self._probing_thread = th.Thread(target=self._run_probing, name="rpc_pool_probing", daemon=True)
+            self._probing_thread.start()
+
+    def _run_probing(self):
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        try:
+            loop.run_until_complete(self.probing_loop())
+        finally:
+            loop.close()
+
+    async def probing_loop(self):
+        while True:
+            await self.probe_endpoints()
+            await pacer.sleep(config.RPC_PROBE_INTERVAL_SEC)
+
+    async def probe_endpoints(self):
+        """
+        Measure latency of each endpoint with 'starknet_blockNumber' request
+        """
+        self.update_endpoints()
+
+        async with CustomSession() as session:
+            await asyncio.gather(*[self.probe_endpoint(endpoint, session) for endpoint in self.endpoints])
+
+    async def probe_endpoint(self, endpoint: RpcEndpoint, session: aiohttp.ClientSession):
+        client = RpcHttpClient(url=endpoint.url, session=session)
+        started_at = time.monotonic()
+
+        try:
+            await asyncio.wait_for(client.call("blockNumber", {}), timeout=config.RPC_REQUEST_TIMEOUT_SEC)
+
+        except Exception as ex:
+            logger.debug(f"RPC endpoint {endpoint.url} probe failed: {ex}")
+            self.report_failure(endpoint)
+            return
+
+        self.report_success(endpoint, time.monotonic() - started_at)
+
+
+class PendingRpcCall:
+    """
+    Call waiting to be sent in a batch request
+    """
+
+    def __init__(self, method_name: str, params: dict, future: asyncio.Future):
+        self.method_name = method_name
+        self.params = params
+        self.future = future
+
+    def set_result(self, result):
+        if not self.future.done():
+            self.future.set_result(result)
+
+    def set_exception(self, ex: Exception):
+        if not self.future.done():
+            self.future.set_exception(ex)
+
+    async def resolve(self, coro: Awaitable):
+        try:
+            self.set_result(await coro)
+        except Exception as ex:
+            self.set_exception(ex)
+
+
+class PooledRpcHttpClient(RpcHttpClient):
+    """
+    Rpc http client sending each call to pool endpoints until one succeeds.
+    Batchable reads issued in the same loop iteration are sent as one JSON-RPC batch request.
+    """
+
+    def __init__(self, pool: RpcPool, session: Optional[aiohttp.ClientSession] = None):
+        super().__init__(url=pool.endpoints[0].url, session=session)
+        self.pool = pool
+
+        self._pending_calls: List[PendingRpcCall] = []
+        self._is_flush_scheduled = False
+        self._batch_tasks: Set[asyncio.Task] = set()
+
+    async def call(self, method_name: str, params: dict):
+        if method_name not in BATCH_METHODS or config.RPC_BATCH_MAX_SIZE < 2:
+            return await self.send_call(method_name=method_name, params=params)
+
+        loop = asyncio.get_running_loop()
+        pending_call = PendingRpcCall(method_name=method_name, params=params, future=loop.create_future())
+        self._pending_calls.append(pending_call)
+
+        if not self._is_flush_scheduled:
+            self._is_flush_scheduled = True
+            loop.call_soon(self.flush_pending_calls)
+
+        return await pending_call.future
+
+    def flush_pending_calls(self):
+        """
+        Send calls collected during current loop iteration, grouped by write pinning and batch size
+        """
+        self._is_flush_scheduled = False
+        pending_calls, self._pending_calls = self._pending_calls, []
+
+        for is_write in (False, True):
+            group = [
+                pending_call for pending_call in pending_calls
+                if (pending_call.method_name in WRITE_METHODS) == is_write
+            ]
+
+            for batch_index in range(0, len(group), config.RPC_BATCH_MAX_SIZE):
+                batch = group[batch_index:batch_index + config.RPC_BATCH_MAX_SIZE]
+                batch_task = asyncio.ensure_future(self.send_batch(batch))
+                self._batch_tasks.add(batch_task)
+                batch_task.add_done_callback(self._batch_tasks.discard)
+
+    async def send_call(self, method_name: str, params: dict):
+        payload = {
+            "jsonrpc": "2.0",
+            "method": f"starknet_{method_name}",
+            "params": params,
+            "id": 0,
+        }
+
+        result = await self.send_payload(payload=payload, method_name=method_name)
+
+        if "result" not in result:
+            self.handle_rpc_error(result)
+        return result["result"]
+
+    async def send_batch(self, batch: List[PendingRpcCall]):
+        """
+        Send calls as one batch request and resolve each call future by response id.
+        Falls back to single requests if endpoint does not support batches.
+        Args:
+            batch: pending calls, all of them either pinned or not pinned
+        """
+        if len(batch) == 1:
+            await batch[0].resolve(self.send_call(method_name=batch[0].method_name, params=batch[0].params))
+            return
+
+        payload = [
+            {
+                "jsonrpc": "2.0",
+                "method": f"starknet_{pending_call.method_name}",
+                "params": pending_call.params,
+                "id": call_id,
+            }
+            for call_id, pending_call in enumerate(batch)
+        ]
+
+        try:
+            results = await self.send_payload(payload=payload, method_name=batch[0].method_name)
+
+        except ClientError as ex:
+            if not is_batch_rejection_error(ex):
+                for pending_call in batch:
+                    pending_call.set_exception(ex)
+                return
+
+            results = None
+
+        except Exception as ex:
+            for pending_call in batch:
+                pending_call.set_exception(ex)
+            return
+
+        if not isinstance(results, list):
+            logger.debug(f"RPC {self.url} rejected batch request, sending calls one by one")
+            await self.send_calls_one_by_one(batch)
+            return
+
+        results_by_id = {result.get("id"): result for result in results if isinstance(result, dict)}
+
+        for call_id, pending_call in enumerate(batch):
+            result = results_by_id.get(call_id)
+
+            if result is None:
+                pending_call.set_exception(ClientError(message=f"No response for batch call {pending_call.method_name}"))
+
+            elif "result" not in result:
+                try:
+                    self.handle_rpc_error(result)
+                except Exception as ex:
+                    pending_call.set_exception(ex)
+
+            else:
+                pending_call.set_result(result["result"])
+
+    async def send_calls_one_by_one(self, batch: List[PendingRpcCall]):
+        await asyncio.gather(*[
+            pending_call.resolve(self.send_call(method_name=pending_call.method_name, params=pending_call.params))
+            for pending_call in batch
+        ])
+
+    async def send_payload(self, payload: Union[dict, List[dict]], method_name: str):
+        """
+        Post payload to pool endpoints until one succeeds
+        Args:
+            payload: single or batch request payload
+            method_name: rpc method name, used for endpoint routing
+        """
+        is_write = method_name in WRITE_METHODS
+        endpoints = self.pool.get_endpoints(method_name)
+
+        for endpoint_index, endpoint in enumerate(endpoints):
+            started_at = time.monotonic()
+
+            try:
+                result = await asyncio.wait_for(
+                    self.request(http_method=HttpMethod.POST, address=endpoint.url, payload=payload),
+                    timeout=config.RPC_REQUEST_TIMEOUT_SEC,
+                )
+
+            except Exception as ex:
+                is_last_endpoint = endpoint_index == len(endpoints) - 1
+                if not is_failover_error(ex, is_write=is_write):
+                    raise
+
+                self.pool.report_failure(endpoint)
+
+                if is_last_endpoint:
+                    raise
+
+                logger.warning(f"RPC {endpoint.url} failed on {method_name}, switching to next node")
+                continue
+
+            self.pool.report_success(endpoint, time.monotonic() - started_at)
+
+            self.url = endpoint.url
+
+            return result
@@ -3,6 +3,8 @@ from typing import Optional, List
 from pydantic import BaseModel
 from starknet_py.net.client_models import Call
 
+from src import enums
+
 
 class ModuleExecutionResult(BaseModel):
     execution_status: bool = False
@@ -16,3 +18,31 @@ class TransactionPayloadData(BaseModel):
     amount_x_decimals: float
     amount_y_decimals: float
 
+
+class ExecutionSummary(BaseModel):
+    wallets_processed: int = 0
+    tasks_succeeded: int = 0
+    tasks_failed: int = 0
+    tasks_skipped: int = 0
+
+    def add_task_status(self, task_status: enums.TaskStatus):
+        if task_status == enums.TaskStatus.SUCCESS:
+            self.tasks_succeeded += 1
+        elif task_status == enums.TaskStatus.SKIPPED:
+            self.tasks_skipped += 1
+        else:
+            self.tasks_failed += 1
+
+    def merge(self, other: "ExecutionSummary"):
+        self.wallets_processed += other.wallets_processed
+        self.tasks_succeeded += other.tasks_succeeded
+        self.tasks_failed += other.tasks_failed
+        self.tasks_skipped += other.tasks_skipped
+
+    def __str__(self):
+        return (
+            f"wallets: {self.wallets_processed}, "
+            f"tasks succeeded: {self.tasks_succeeded}, "
+            f"failed: {self.tasks_failed}, "
+            f"skipped: {self.tasks_skipped}"
+        )
@@ -1,10 +1,11 @@
-from typing import Union
+from typing import Union, List
 
 from pydantic import BaseModel
 from pydantic import validator
 from src import enums
 from src import exceptions
 from utils import validation
+import config
 
 
 class AppConfigSchema(BaseModel):
@@ -12,11 +13,18 @@ class AppConfigSchema(BaseModel):
     preserve_logs: bool = True
     use_proxy: bool = True
     rpc_url: str = "https://starknet-mainnet.public.blastapi.io"
+    extra_rpc_urls: List[str] = []
+    rpc_pin_writes: bool = True
+    check_balances_before_run: bool = False
     skip_gas_price_check: bool = True
     target_gas_price: Union[int, float] = 20
     is_gas_price_wait_timeout_needed: bool = False
     time_to_wait_target_gas_price_sec: Union[int, float] = 360
     wallets_amount_to_execute_in_test_mode: int = 3
+    wallets_concurrency_limit: int = config.DEFAULT_WALLETS_CONCURRENCY
+    shard_processes_num: int = config.DEFAULT_SHARD_PROCESSES_NUM
+    requests_rate_limit_rps: Union[int, float] = config.DEFAULT_RATE_LIMIT_RPS
+    requests_rate_limit_burst: int = config.DEFAULT_RATE_LIMIT_BURST
     last_wallet_version: str = "0.3.0"
 
     debug: bool = False
@@ -28,6 +36,13 @@ class AppConfigSchema(BaseModel):
 
         return value
 
+    @validator('extra_rpc_urls', pre=True)
+    def extra_rpc_urls_must_be_valid(cls, value):
+        if isinstance(value, str):
+            value = value.replace(",", " ").split()
+
+        return [url.strip() for url in value if url.strip()]
+
     @validator('target_gas_price', pre=True)
     def target_gas_price_must_be_valid(cls, value):
         value = validation.get_converted_to_int(value, "Gas Price")
@@ -51,3 +66,31 @@ class AppConfigSchema(BaseModel):
         value = validation.get_positive(value, "Wallets amount", include_zero=False)
 
         return value
+
+    @validator('wallets_concurrency_limit', pre=True)
+    def wallets_concurrency_limit_must_be_valid(cls, value):
+        value = validation.get_converted_to_int(value, "Wallets concurrency")
+        value = validation.get_positive(value, "Wallets concurrency", include_zero=False)
+
+        return value
+
+    @validator('shard_processes_num', pre=True)
+    def shard_processes_num_must_be_valid(cls, value):
+        value = validation.get_converted_to_int(value, "Shard processes")
+        value = validation.get_positive(value, "Shard processes", include_zero=False)
+
+        return value
+
+    @validator('requests_rate_limit_rps', pre=True)
+    def requests_rate_limit_rps_must_be_valid(cls, value):
+        value = validation.get_converted_to_float(value, "Requests per second")
+        value = validation.get_positive(value, "Requests per second", include_zero=False)
+
+        return value
+
+    @validator('requests_rate_limit_burst', pre=True)
+    def requests_rate_limit_burst_must_be_valid(cls, value):
+        value = validation.get_converted_to_int(value, "Requests burst")
+        value = validation.get_positive(value, "Requests burst", include_zero=False)
+
+        return value
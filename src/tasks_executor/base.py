@@ -1,9 +1,8 @@
-import time
 import random
 import asyncio
 import multiprocessing as mp
 from abc import abstractmethod
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 from loguru import logger
 
@@ -16,6 +15,10 @@ from src.schemas.wallet_data import WalletData
 from src.storage import ActionStorage
 from src.storage import Storage
 from src.logger import configure_logger
+from src.transport_registry import TransportRegistry
+from src.wallet_context import WalletContext
+from src.wallet_context import wallet_context_var
+from src import pacer
 from src import enums
 
 from utils.repr import message as repr_message_utils
@@ -43,6 +46,20 @@ class TaskExecutorBase:
             task: task to process
             wallet: wallet for task
         """
+        loop = asyncio.get_event_loop()
+        return loop.run_until_complete(self._process_task_async(task=task, wallet=wallet))
+
+    async def _process_task_async(
+            self,
+            task: "TaskBase",
+            wallet: "WalletData",
+    ) -> ModuleExecutionResult:
+        """
+        Base coroutine for task processing, runs on the caller event loop.
+        Args:
+            task: task to process
+            wallet: wallet for task
+        """
         task.task_status = enums.TaskStatus.PROCESSING
 
         logger.debug(f"Processing task: {task.task_id} with wallet: {wallet.name}")
@@ -57,10 +74,7 @@ class TaskExecutorBase:
             )
 
         module_executor = ModuleExecutor(task=task, wallet=wallet)
-
-        loop = asyncio.get_event_loop()
-        task_result_coroutine = module_executor.start()
-        task_result: ModuleExecutionResult = loop.run_until_complete(task_result_coroutine)
+        task_result: ModuleExecutionResult = await module_executor.start()
 
         task_status = enums.TaskStatus.SUCCESS if task_result.execution_status else enums.TaskStatus.FAILED
         task.task_status = task_status
@@ -71,6 +85,21 @@ class TaskExecutorBase:
 
         return task_result
 
+    async def task_delay(
+            self,
+            task: "TaskBase",
+            task_result: Optional[ModuleExecutionResult],
+    ):
+        """
+        Delay between tasks of a wallet
+        Args:
+            task: processed task
+            task_result: result of processed task
+        """
+        time_to_sleep = task_utils.get_time_to_sleep(task=task, task_result=task_result)
+        logger.info(repr_message_utils.task_exec_sleep_message(time_to_sleep))
+        await pacer.sleep(time_to_sleep)
+
     def _process_wallet(
             self,
             wallet: "WalletData",
@@ -82,18 +111,19 @@ class TaskExecutorBase:
             wallet: wallet to process
             tasks: list of tasks to process
         """
+        wallet_context_var.set(WalletContext(wallet))
+
         for task_index, task in enumerate(tasks):
             task_result = self.process_task(
                 task=task,
                 wallet=wallet,
             )
 
-            time_to_sleep = task_utils.get_time_to_sleep(task=task, task_result=task_result)
             is_last_task = task_index == len(tasks) - 1
 
             if not is_last_task:
-                logger.info(repr_message_utils.task_exec_sleep_message(time_to_sleep))
-                time.sleep(time_to_sleep)
+                loop = asyncio.get_event_loop()
+                loop.run_until_complete(self.task_delay(task=task, task_result=task_result))
 
     @abstractmethod
     def process_task(
@@ -148,7 +178,11 @@ class TaskExecutorBase:
 
             if not is_last_wallet:
                 logger.info(repr_message_utils.task_exec_sleep_message(time_to_sleep))
-                time.sleep(time_to_sleep)
+                loop = asyncio.get_event_loop()
+                loop.run_until_complete(pacer.wallet_delay())
+
+        loop = asyncio.get_event_loop()
+        loop.run_until_complete(TransportRegistry().close_sessions())
 
         logger.success("All wallets processed")
 
@@ -164,19 +198,18 @@ class TaskExecutorBase:
 
         return self.processing_process is not None
 
-    def process(
+    def _prepare_processing(
             self,
             wallets: List["WalletData"],
             tasks: List["TaskBase"],
 
             shuffle_wallets: bool = False,
             shuffle_tasks: bool = False,
-    ):
+    ) -> Tuple[List["WalletData"], List["TaskBase"]]:
         """
-        Process
+        Shuffle and index wallets, fill tasks with virtual tasks and snapshot app config
+        Returns: wallets and tasks ready for processing
         """
-        logger.debug("Starting tasks executor")
-
         if shuffle_wallets:
             random.shuffle(wallets)
 
@@ -188,6 +221,28 @@ class TaskExecutorBase:
 
         self._app_config_dict = Storage().app_config.dict()
 
+        return wallets, tasks
+
+    def process(
+            self,
+            wallets: List["WalletData"],
+            tasks: List["TaskBase"],
+
+            shuffle_wallets: bool = False,
+            shuffle_tasks: bool = False,
+    ):
+        """
+        Process
+        """
+        logger.debug("Starting tasks executor")
+
+        wallets, tasks = self._prepare_processing(
+            wallets=wallets,
+            tasks=tasks,
+            shuffle_wallets=shuffle_wallets,
+            shuffle_tasks=shuffle_tasks,
+        )
+
         self.processing_process = mp.Process(target=self._start_processing, args=(wallets, tasks))
         self.processing_process.start()
         self.event_manager.start()
@@ -10,26 +10,71 @@ from src.schemas.tasks.base.base import TaskBase
 from src.schemas.wallet_data import WalletData
 from src.storage import Storage
 from src.tasks_executor.base import TaskExecutorBase
+from src.transport_registry import TransportRegistry
 from src.logger import configure_logger
 
 import config
 
 
-def clear_threads(
-    wallet_threads: List[th.Thread],
-    max_threads_num: int = 0,
-):
+class WalletSlots:
     """
-    Clear executed wallet threads
-    Args:
-        wallet_threads: list of threads
-        max_threads_num: max threads
+    Fixed amount of wallet slots guarded by a condition variable.
+    Waiters are woken up as soon as a slot is released, busy slots are
+    integrated over time to report utilization.
     """
-    while len(wallet_threads) >= max_threads_num:
-        for thread_index, thread in enumerate(wallet_threads):
-            if not thread.is_alive():
-                wallet_threads.pop(thread_index)
-        time.sleep(0.1)
+
+    def __init__(self, slots_num: int):
+        self.slots_num = max(1, slots_num)
+        self.condition = th.Condition()
+
+        self.busy = 0
+        self._busy_time = 0.0
+        self._started_at = time.monotonic()
+        self._changed_at = self._started_at
+
+    def _account_busy_time(self):
+        now = time.monotonic()
+        self._busy_time += self.busy * (now - self._changed_at)
+        self._changed_at = now
+
+    def acquire(self):
+        """
+        Wait for a free slot and take it
+        """
+        with self.condition:
+            self.condition.wait_for(lambda: self.busy < self.slots_num)
+            self._account_busy_time()
+            self.busy += 1
+
+    def release(self):
+        """
+        Free a slot and wake up a waiter
+        """
+        with self.condition:
+            self._account_busy_time()
+            self.busy -= 1
+            self.condition.notify_all()
+
+    def wait_all(self):
+        """
+        Wait until all slots are free
+        """
+        with self.condition:
+            self.condition.wait_for(lambda: self.busy == 0)
+
+    @property
+    def utilization(self) -> float:
+        """
+        Average share of busy slots since creation
+        """
+        with self.condition:
+            self._account_busy_time()
+            elapsed = self._changed_at - self._started_at
+
+            if not elapsed:
+                return 0.0
+
+            return self._busy_time / (elapsed * self.slots_num)
 
 
 class TaskExecutorBatchMultiThread(TaskExecutorBase):
@@ -39,6 +84,7 @@ class TaskExecutorBatchMultiThread(TaskExecutorBase):
         super().__init__()
 
         self.lock: Optional[th.Lock] = None
+        self.slots: Optional[WalletSlots] = None
 
     def _start_processing(
             self,
@@ -52,12 +98,13 @@ class TaskExecutorBatchMultiThread(TaskExecutorBase):
         Storage().update_app_config(config=AppConfigSchema(**self._app_config_dict))
         configure_logger()
         self.lock = th.Lock()
+        self.slots = WalletSlots(config.DEFAULT_WALLETS_THREADS_NUM)
 
-        wallet_threads = []
         for wallet_index, wallet in enumerate(wallets):
-            clear_threads(wallet_threads, max_threads_num=config.DEFAULT_WALLETS_THREADS_NUM)
-            is_last_wallet = wallet_index == len(wallets) - 1
-            loop = asyncio.get_event_loop()
+            if wallet_index != 0:
+                time.sleep(config.DEFAULT_DELAY_SEC)
+
+            self.slots.acquire()
 
             thread = th.Thread(
                 target=self.process_wallet,
@@ -65,42 +112,46 @@ class TaskExecutorBatchMultiThread(TaskExecutorBase):
                     wallet,
                     tasks,
 
-                    loop,
-                )
+                    self.slots,
+                ),
+                name=f"wallet_{wallet_index}",
             )
-
-            if not is_last_wallet:
-                time.sleep(config.DEFAULT_DELAY_SEC)
-
             thread.start()
-            wallet_threads.append(thread)
 
-        clear_threads(wallet_threads)
-        logger.success("All wallets processed")
+        self.slots.wait_all()
+        logger.success(f"All wallets processed (slots utilization: {self.slots.utilization:.0%})")
 
     def process_wallet(
             self,
             wallet: "WalletData",
             tasks: List["TaskBase"],
 
-            loop: Optional[asyncio.AbstractEventLoop] = None,
+            slots: Optional[WalletSlots] = None,
     ):
         """
-        Process a wallet
+        Process a wallet on its own event loop
         Args:
             wallet: wallet to process
             tasks: list of tasks to process
-            loop: asyncio loop
+            slots: wallet slots to release when wallet is processed
         """
 
+        loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
-        self.wait_for_unlock()
 
-        with self.lock:
-            self.event_manager.set_wallet_started(wallet)
+        try:
+            with self.lock:
+                self.event_manager.set_wallet_started(wallet)
 
-        self._process_wallet(wallet=wallet, tasks=tasks)
-        self.event_manager.set_wallet_completed(wallet)
+            self._process_wallet(wallet=wallet, tasks=tasks)
+            self.event_manager.set_wallet_completed(wallet)
+
+        finally:
+            loop.run_until_complete(TransportRegistry().close_sessions())
+            loop.close()
+
+            if slots is not None:
+                slots.release()
 
     def process_task(
             self,
@@ -117,9 +168,5 @@ class TaskExecutorBatchMultiThread(TaskExecutorBase):
 
         return task_result
 
-    def wait_for_unlock(self):
-        while self.lock.locked():
-            time.sleep(0.1)
-
 
 task_executor_batch_multi_thread = TaskExecutorBatchMultiThread()
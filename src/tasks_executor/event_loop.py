@@ -0,0 +1,185 @@
+import asyncio
+from typing import Optional, List
+
+from loguru import logger
+
+from src.schemas.action_models import ModuleExecutionResult
+from src.schemas.action_models import ExecutionSummary
+from src.schemas.app_config import AppConfigSchema
+from src.schemas.tasks.base.base import TaskBase
+from src.schemas.wallet_data import WalletData
+from src.storage import Storage
+from src.tasks_executor.base import TaskExecutorBase
+from src.repr.repr_manager import ReprManager
+from src.repr.repr_manager import repr_context_id
+from src.repr.event_manager import repr_event_manager
+from src.logger import configure_threaded_task_executor_logger
+from src.transport_registry import TransportRegistry
+from src.wallet_context import WalletContext
+from src.wallet_context import wallet_context_var
+from src.proxy_health import ProxyHealthCache
+from src.receipt_tracker import worker_slot_var
+from src import pacer
+from src import enums
+from utils.repr import message as repr_message_utils
+
+
+class TaskExecutorEventLoop(TaskExecutorBase):
+    """
+    Runs all wallets as coroutines on a single event loop.
+    Amount of wallets in flight is limited by app config 'wallets_concurrency_limit',
+    wallets waiting for transaction receipts are not counted.
+    """
+
+    def __init__(
+            self
+    ):
+        super().__init__()
+
+        self.semaphore: Optional[asyncio.Semaphore] = None
+        self.execution_summary: Optional[ExecutionSummary] = None
+        self.log_event_manager = repr_event_manager
+
+    def _start_processing(
+            self,
+            wallets: List["WalletData"],
+            tasks: List["TaskBase"],
+    ):
+        """
+        Start processing async
+        """
+
+        execution_summary = self.run_event_loop(wallets=wallets, tasks=tasks)
+        logger.success(f"All wallets processed ({execution_summary})")
+
+    def run_event_loop(
+            self,
+            wallets: List["WalletData"],
+            tasks: List["TaskBase"],
+
+            start_delay_sec: float = 0,
+    ) -> ExecutionSummary:
+        """
+        Configure executor process and run wallets processing on a new event loop
+        Args:
+            wallets: list of wallets to process
+            tasks: list of tasks to process
+            start_delay_sec: delay before first wallet start
+        Returns: summary of processed wallets and tasks
+        """
+        Storage().update_app_config(config=AppConfigSchema(**self._app_config_dict))
+        configure_threaded_task_executor_logger(self.log_event_manager.queue)
+
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+        try:
+            loop.run_until_complete(self.process_wallets(
+                wallets=wallets,
+                tasks=tasks,
+                start_delay_sec=start_delay_sec,
+            ))
+        finally:
+            loop.run_until_complete(TransportRegistry().close_sessions())
+            loop.close()
+
+        return self.execution_summary
+
+    async def process_wallets(
+            self,
+            wallets: List["WalletData"],
+            tasks: List["TaskBase"],
+
+            start_delay_sec: float = 0,
+    ):
+        """
+        Process wallets concurrently, starting them one by one with default delay
+        Args:
+            wallets: list of wallets to process
+            tasks: list of tasks to process
+            start_delay_sec: delay before first wallet start
+        """
+        self.execution_summary = ExecutionSummary()
+
+        ProxyHealthCache().prefetch([wallet.proxy for wallet in wallets])
+
+        if start_delay_sec:
+            await pacer.sleep(start_delay_sec)
+
+        self.semaphore = asyncio.Semaphore(Storage().app_config.wallets_concurrency_limit)
+
+        wallet_coroutines = []
+        for wallet_index, wallet in enumerate(wallets):
+            await self.semaphore.acquire()
+
+            wallet_coroutine = asyncio.create_task(self.process_wallet(
+                wallet=wallet,
+                tasks=[task.copy() for task in tasks],
+            ))
+            wallet_coroutine.add_done_callback(lambda _: self.semaphore.release())
+            wallet_coroutines.append(wallet_coroutine)
+
+            if wallet_index != len(wallets) - 1:
+                await pacer.wallet_delay()
+
+        await asyncio.gather(*wallet_coroutines, return_exceptions=True)
+
+    async def process_wallet(
+            self,
+            wallet: "WalletData",
+            tasks: List["TaskBase"],
+    ):
+        """
+        Process a wallet
+        Args:
+            wallet: wallet to process
+            tasks: list of tasks to process
+        """
+        repr_context_id.set(id(asyncio.current_task()))
+        wallet_context_var.set(WalletContext(wallet))
+        worker_slot_var.set(self.semaphore)
+
+        self.event_manager.set_wallet_started(wallet)
+
+        for task_index, task in enumerate(tasks):
+            try:
+                task_result = await self.process_task(task=task, wallet=wallet)
+
+            except Exception as ex:
+                logger.exception(ex)
+                task.task_status = enums.TaskStatus.FAILED
+                task_result = None
+
+            self.execution_summary.add_task_status(task.task_status)
+
+            is_last_task = task_index == len(tasks) - 1
+
+            if not is_last_task:
+                await self.task_delay(task=task, task_result=task_result)
+
+        self.execution_summary.wallets_processed += 1
+        self.event_manager.set_wallet_completed(wallet)
+
+    async def process_task(
+            self,
+            task: "TaskBase",
+            wallet: "WalletData",
+    ) -> ModuleExecutionResult:
+        self.event_manager.set_task_started(task, wallet)
+
+        ReprManager.push_repr_item_to_thread_items(
+            repr_message_utils.task_start_message(
+                task=task,
+                wallet=wallet,
+            ),
+        )
+        task_result = await self._process_task_async(
+            task=task,
+            wallet=wallet,
+        )
+        self.event_manager.set_task_completed(task, wallet)
+
+        return task_result
+
+
+task_executor_event_loop = TaskExecutorEventLoop()
@@ -14,12 +14,21 @@ from src.schemas.wallet_data import WalletData
 from src.schemas import event_item
 from src.internal_queue import InternalQueue
 
+import config
+
+
+EventItemType = Union[
+    event_item.WalletStartedEventItem,
+    event_item.TaskStartedEventItem,
+    event_item.WalletCompletedEventItem,
+    event_item.TaskCompletedEventItem,
+]
+
 
 def state_setter(obj: "TaskExecEventManager", state: dict):
     obj.running = state["running"]
 
-    obj.started_events_queue = state["started_events_queue"]
-    obj.completed_events_queue = state["completed_events_queue"]
+    obj.events_queue = state["events_queue"]
 
 
 class TaskExecEventManager:
@@ -35,15 +44,11 @@ class TaskExecEventManager:
         self.running = mp.Event()
         self.listening_thread: Optional[th.Thread] = None
 
-        self.started_events_queue = InternalQueue[Union[
-            event_item.WalletStartedEventItem,
-            event_item.TaskStartedEventItem,
-        ]]()
+        # None item only wakes up the listening thread
+        self.events_queue = InternalQueue[Optional[EventItemType]]()
 
-        self.completed_events_queue = InternalQueue[Union[
-            event_item.WalletCompletedEventItem,
-            event_item.TaskCompletedEventItem,
-        ]]()
+        self.batch_max_size = config.EVENTS_BATCH_MAX_SIZE
+        self.coalesce_interval_sec: Optional[float] = None
 
         self._on_wallet_started_callbacks: List[Callable[[WalletData], None]] = []
         self._on_task_started_callbacks: List[Callable[[TaskBase, WalletData], None]] = []
@@ -51,6 +56,8 @@ class TaskExecEventManager:
         self._on_wallet_completed_callbacks: List[Callable[[WalletData], None]] = []
         self._on_task_completed_callbacks: List[Callable[[TaskBase, WalletData], None]] = []
 
+        self._on_events_batch_callbacks: List[Callable[[List[EventItemType]], None]] = []
+
     def pseudo_callback(self, *args, **kwargs):
         """
         Placeholder method for a completed callback function.
@@ -94,6 +101,26 @@ class TaskExecEventManager:
         """
         self._on_task_completed_callbacks.append(callback)
 
+    def on_events_batch(self, callback: Callable[[List[EventItemType]], None]):
+        """
+        Add a callback function to be called once per dispatched events batch,
+        after per event callbacks of the batch.
+
+        Args:
+            callback (Callable[[List[EventItemType]], None]): The callback function to be called with batch events.
+        """
+        self._on_events_batch_callbacks.append(callback)
+
+    def set_coalescing(self, interval_sec: Optional[float] = config.EVENTS_COALESCE_INTERVAL_SEC):
+        """
+        Enable or disable coalescing mode. In coalescing mode events are collected for
+        'interval_sec' after the first one and dispatched as a single batch.
+
+        Args:
+            interval_sec (Optional[float]): Max delay of an event dispatch, None to disable coalescing.
+        """
+        self.coalesce_interval_sec = interval_sec
+
     def clear_callbacks(self):
         """
         Clear all callbacks.
@@ -102,80 +129,104 @@ class TaskExecEventManager:
         self._on_task_started_callbacks = []
         self._on_wallet_completed_callbacks = []
         self._on_task_completed_callbacks = []
+        self._on_events_batch_callbacks = []
 
     # EVENT CREATORS
     def set_wallet_started(self, wallet: WalletData):
         """
-        Add a wallet to the 'wallets_started_queue'.
+        Add a wallet to the events queue.
 
         Args:
             wallet (WalletData): The wallet to be added to the queue.
         """
-        self.started_events_queue.put_nowait(
+        self.events_queue.put_nowait(
             event_item.WalletStartedEventItem(wallet=wallet)
         )
 
     def set_task_started(self, task: TaskBase, wallet: WalletData):
         """
-        Add a task and associated wallet to the 'tasks_started_queue'.
+        Add a task and associated wallet to the events queue.
 
         Args:
             task (TaskBase): The task that was started.
             wallet (WalletData): The wallet associated with the task.
         """
-        self.started_events_queue.put_nowait(
+        self.events_queue.put_nowait(
             event_item.TaskStartedEventItem(task=task, wallet=wallet)
         )
 
     def set_wallet_completed(self, wallet: WalletData):
         """
-        Add a wallet to the 'wallets_completed_queue'.
+        Add a wallet to the events queue.
 
         Args:
             wallet (WalletData): The wallet to be added to the queue.
         """
-        self.completed_events_queue.put_nowait(
+        self.events_queue.put_nowait(
             event_item.WalletCompletedEventItem(wallet=wallet)
         )
 
     def set_task_completed(self, task: TaskBase, wallet: WalletData):
         """
-        Add a task and associated wallet to the 'tasks_completed_queue'.
+        Add a task and associated wallet to the events queue.
 
         Args:
             task (TaskBase): The task that was completed.
             wallet (WalletData): The wallet associated with the task.
         """
-        self.completed_events_queue.put_nowait(
+        self.events_queue.put_nowait(
             event_item.TaskCompletedEventItem(task=task, wallet=wallet)
         )
 
-    def _process_queue_item(self, queue_name: str):
+    def _get_events_batch(self) -> List[EventItemType]:
         """
-        Process an item from a queue and call the given callback function.
+        Block until an event is available, then drain the queue into a batch.
+        Without coalescing only already queued events are taken, otherwise events are
+        collected until coalesce interval after the first one is passed.
 
-        Args:
-            queue_name (str): The name of the queue to process.
+        Returns:
+            List[EventItemType]: batch of events, may be empty if the thread was woken up.
         """
-        try:
-            _queue: InternalQueue = getattr(self, queue_name)
+        first_item = self.events_queue.get(block=True)
+        if first_item is None:
+            return []
+
+        batch = [first_item]
+        deadline = time.monotonic() + (self.coalesce_interval_sec or 0)
+
+        while len(batch) < self.batch_max_size:
+            timeout = deadline - time.monotonic()
+
+            try:
+                if timeout > 0:
+                    item = self.events_queue.get(block=True, timeout=timeout)
+                else:
+                    item = self.events_queue.get_nowait()
+
+            except queue.Empty:
+                break
+
+            if item is None:
+                break
+
+            batch.append(item)
 
-            queue_item: Union[
-                event_item.WalletStartedEventItem,
-                event_item.TaskStartedEventItem,
-                event_item.WalletCompletedEventItem,
-                event_item.TaskCompletedEventItem,
-            ] = _queue.get_nowait()
+        return batch
 
-            if not self.running.is_set():
-                return
+    def _dispatch_events_batch(self, batch: List[EventItemType]):
+        """
+        Call callbacks for each event of batch, then batch callbacks.
 
+        Args:
+            batch (List[EventItemType]): The events to dispatch.
+        """
+        for queue_item in batch:
             callbacks = getattr(self, self.event_item_callback_map[queue_item.__class__])
             for callback in callbacks:
                 callback(*queue_item.get_data())
 
-        except queue.Empty:
-            time.sleep(0.1)
+        for callback in self._on_events_batch_callbacks:
+            callback(batch)
 
     def listen_for_event_items(self):
         """
@@ -184,8 +235,15 @@ class TaskExecEventManager:
         logger.debug("Listening thread started")
 
         while self.running.is_set():
-            self._process_queue_item("started_events_queue")
-            self._process_queue_item("completed_events_queue")
+            batch = self._get_events_batch()
+
+            if not batch or not self.running.is_set():
+                continue
+
+            try:
+                self._dispatch_events_batch(batch)
+            except Exception as ex:
+                logger.exception(ex)
 
         logger.debug("Listening thread stopped")
 
@@ -194,7 +252,11 @@ class TaskExecEventManager:
         Start the listening thread
         """
         self.running.set()
-        self.listening_thread = th.Thread(target=self.listen_for_event_items)
+
+        if self.listening_thread is not None and self.listening_thread.is_alive():
+            return
+
+        self.listening_thread = th.Thread(target=self.listen_for_event_items, name="task_exec_event_manager")
         self.listening_thread.start()
 
     def stop(self):
@@ -202,6 +264,7 @@ class TaskExecEventManager:
         Stop the listening thread
         """
         self.running.clear()
+        self.events_queue.put_nowait(None)
 
     def __reduce__(self):
         return (
@@ -211,8 +274,7 @@ class TaskExecEventManager:
                 "running": self.running,
 
                 # queues
-                "started_events_queue": self.started_events_queue,
-                "completed_events_queue": self.completed_events_queue,
+                "events_queue": self.events_queue,
             },
             None,
             None,
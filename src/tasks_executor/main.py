@@ -5,6 +5,9 @@ from src.tasks_executor.base import TaskExecutorBase
 from src.tasks_executor.multithread import task_executor_multi_thread
 from src.tasks_executor.batch_multithread import task_executor_batch_multi_thread
 from src.tasks_executor.singlethread import task_executor_single_thread
+from src.tasks_executor.event_loop import task_executor_event_loop
+from src.tasks_executor.sharded import task_executor_sharded
+from src.tasks_executor.scheduler import task_executor_scheduler
 from src.tasks_executor.event_manager import TaskExecEventManager
 from src.schemas.wallet_data import WalletData
 from src.schemas.tasks import TaskBase
@@ -23,6 +26,9 @@ class TaskExecutor(TaskExecutorBase):
 
         task_executor_single_thread.event_manager = self.event_manager
         task_executor_multi_thread.event_manager = self.event_manager
+        task_executor_event_loop.event_manager = self.event_manager
+        task_executor_sharded.event_manager = self.event_manager
+        task_executor_scheduler.event_manager = self.event_manager
 
     def process_task(self, task: "TaskBase", wallet: "WalletData"):
         return self.actual_task_executor.process_task(task=task, wallet=wallet)
@@ -42,6 +48,12 @@ class TaskExecutor(TaskExecutorBase):
             self.actual_task_executor = task_executor_multi_thread
         elif run_mode == enums.RunMode.SYNC:
             self.actual_task_executor = task_executor_single_thread
+        elif run_mode == enums.RunMode.LOOP:
+            self.actual_task_executor = task_executor_event_loop
+        elif run_mode == enums.RunMode.SHARDED:
+            self.actual_task_executor = task_executor_sharded
+        elif run_mode == enums.RunMode.SCHEDULED:
+            self.actual_task_executor = task_executor_scheduler
         else:
             raise ValueError(f"Unknown run mode: {run_mode}")
 
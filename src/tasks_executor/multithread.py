@@ -11,6 +11,7 @@ from src.schemas.tasks.base.base import TaskBase
 from src.schemas.wallet_data import WalletData
 from src.storage import Storage
 from src.tasks_executor.base import TaskExecutorBase
+from src.transport_registry import TransportRegistry
 from src.repr.repr_manager import ReprManager
 from src.repr.event_manager import repr_event_manager
 from src.logger import configure_threaded_task_executor_logger
@@ -19,23 +20,6 @@ from utils.repr import message as repr_message_utils
 import config
 
 
-def clear_threads(
-    wallet_threads: List[th.Thread],
-    max_threads_num: int = 0,
-):
-    """
-    Clear executed wallet threads
-    Args:
-        wallet_threads: list of threads
-        max_threads_num: max threads
-    """
-    while len(wallet_threads) >= max_threads_num:
-        for thread_index, thread in enumerate(wallet_threads):
-            if not thread.is_alive():
-                wallet_threads.pop(thread_index)
-        time.sleep(0.1)
-
-
 class TaskExecutorMultiThread(TaskExecutorBase):
     def __init__(
             self
@@ -61,8 +45,7 @@ class TaskExecutorMultiThread(TaskExecutorBase):
         with ThreadPoolExecutor(max_workers=config.DEFAULT_WALLETS_THREADS_NUM) as executor:
             futures = []
             for wallet_index, wallet in enumerate(wallets):
-                loop = asyncio.get_event_loop()
-                future = executor.submit(self.process_wallet, wallet, tasks, loop)
+                future = executor.submit(self.process_wallet, wallet, tasks)
                 futures.append(future)
 
                 if wallet_index != len(wallets) - 1:
@@ -74,23 +57,26 @@ class TaskExecutorMultiThread(TaskExecutorBase):
             self,
             wallet: "WalletData",
             tasks: List["TaskBase"],
-
-            loop: Optional[asyncio.AbstractEventLoop] = None,
     ):
         """
-        Process a wallet
+        Process a wallet on its own event loop
         Args:
             wallet: wallet to process
             tasks: list of tasks to process
-            loop: asyncio loop
         """
 
+        loop = asyncio.new_event_loop()
         asyncio.set_event_loop(loop)
 
-        self.event_manager.set_wallet_started(wallet)
+        try:
+            self.event_manager.set_wallet_started(wallet)
 
-        self._process_wallet(wallet=wallet, tasks=tasks)
-        self.event_manager.set_wallet_completed(wallet)
+            self._process_wallet(wallet=wallet, tasks=tasks)
+            self.event_manager.set_wallet_completed(wallet)
+
+        finally:
+            loop.run_until_complete(TransportRegistry().close_sessions())
+            loop.close()
 
     def process_task(
             self,
@@ -114,9 +100,5 @@ class TaskExecutorMultiThread(TaskExecutorBase):
 
         return task_result
 
-    def wait_for_unlock(self):
-        while self.lock.locked():
-            time.sleep(0.1)
-
 
 task_executor_multi_thread = TaskExecutorMultiThread()
@@ -0,0 +1,293 @@
+import heapq
+import asyncio
+import itertools
+from typing import Optional, List, Tuple
+
+from loguru import logger
+
+from src.schemas.action_models import ExecutionSummary
+from src.schemas.tasks.base.base import TaskBase
+from src.schemas.wallet_data import WalletData
+from src.storage import Storage
+from src.tasks_executor.event_loop import TaskExecutorEventLoop
+from src.repr.repr_manager import repr_context_id
+from src.wallet_context import WalletContext
+from src.wallet_context import wallet_context_var
+from src.proxy_health import ProxyHealthCache
+from src.balance_scanner import BalanceScanner
+from src.receipt_tracker import worker_slot_var
+from src.pacer import get_pacer
+from src import enums
+from utils.repr import message as repr_message_utils
+from utils import task as task_utils
+
+import config
+
+
+class WalletSchedule:
+    """
+    Wallet with its own tasks list and index of next task to process.
+    """
+
+    def __init__(
+            self,
+            wallet: "WalletData",
+            tasks: List["TaskBase"],
+    ):
+        self.wallet = wallet
+        self.tasks = tasks
+        self.next_task_index = 0
+        self.proxy_deferrals = 0
+
+        self.wallet_context: Optional[WalletContext] = None
+
+    @property
+    def next_task(self) -> "TaskBase":
+        return self.tasks[self.next_task_index]
+
+    @property
+    def is_started(self) -> bool:
+        return self.next_task_index > 0
+
+    @property
+    def is_completed(self) -> bool:
+        return self.next_task_index >= len(self.tasks)
+
+
+class TaskExecutorScheduler(TaskExecutorEventLoop):
+    """
+    Keeps a heap of (ready at, wallet next task) and dispatches the earliest ready
+    wallet task to a bounded worker pool on a single event loop.
+    Pool size is app config 'wallets_concurrency_limit', per wallet delays are kept.
+    Workers waiting for transaction receipts free their slot until receipt is received.
+    """
+
+    def __init__(
+            self
+    ):
+        super().__init__()
+
+        self.ready_heap: List[Tuple[float, int, WalletSchedule]] = []
+        self.heap_changed: Optional[asyncio.Event] = None
+        self._counter = itertools.count()
+
+    def schedule(
+            self,
+            wallet_schedule: WalletSchedule,
+            ready_at: float,
+    ):
+        """
+        Push wallet next task to ready heap
+        Args:
+            wallet_schedule: wallet schedule
+            ready_at: loop time when task is ready
+        """
+        heapq.heappush(self.ready_heap, (ready_at, next(self._counter), wallet_schedule))
+        self.heap_changed.set()
+
+    async def wait_for_heap_change(self, deadline: Optional[float] = None):
+        """
+        Wait until ready heap is changed or deadline is reached
+        Args:
+            deadline: loop time to stop waiting at
+        """
+        self.heap_changed.clear()
+
+        heap_changed_waiter = asyncio.ensure_future(self.heap_changed.wait())
+        waiters = [heap_changed_waiter]
+        if deadline is not None:
+            waiters.append(get_pacer().sleep_until(deadline))
+
+        try:
+            await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        finally:
+            heap_changed_waiter.cancel()
+
+    async def process_wallets(
+            self,
+            wallets: List["WalletData"],
+            tasks: List["TaskBase"],
+
+            start_delay_sec: float = 0,
+    ):
+        """
+        Dispatch ready wallet tasks until all wallets are completed
+        Args:
+            wallets: list of wallets to process
+            tasks: list of tasks to process
+            start_delay_sec: delay before first wallet start
+        """
+        self.execution_summary = ExecutionSummary()
+
+        pacer = get_pacer()
+        self.ready_heap = []
+        self.heap_changed = asyncio.Event()
+        self.semaphore = asyncio.Semaphore(Storage().app_config.wallets_concurrency_limit)
+
+        ProxyHealthCache().prefetch([wallet.proxy for wallet in wallets])
+
+        if Storage().app_config.check_balances_before_run:
+            wallets = await self.sort_wallets_by_balance(wallets=wallets, tasks=tasks)
+
+        start_time = pacer.time() + start_delay_sec
+        for wallet_index, wallet in enumerate(wallets):
+            wallet_schedule = WalletSchedule(
+                wallet=wallet,
+                tasks=[task.copy() for task in tasks],
+            )
+            if wallet_schedule.is_completed:
+                continue
+
+            self.schedule(wallet_schedule, ready_at=start_time + wallet_index * config.DEFAULT_DELAY_SEC)
+
+        running_tasks = set()
+        while self.ready_heap or running_tasks:
+            if not self.ready_heap:
+                await self.wait_for_heap_change()
+                continue
+
+            ready_at = self.ready_heap[0][0]
+            if ready_at > pacer.time():
+                await self.wait_for_heap_change(deadline=ready_at)
+                continue
+
+            await self.semaphore.acquire()
+
+            if not self.ready_heap or self.ready_heap[0][0] > pacer.time():
+                self.semaphore.release()
+                continue
+
+            _, _, wallet_schedule = heapq.heappop(self.ready_heap)
+
+            running_task = asyncio.create_task(self.process_scheduled_task(wallet_schedule))
+            running_tasks.add(running_task)
+            running_task.add_done_callback(running_tasks.discard)
+            running_task.add_done_callback(lambda _: self.on_scheduled_task_done())
+
+    async def sort_wallets_by_balance(
+            self,
+            wallets: List["WalletData"],
+            tasks: List["TaskBase"],
+    ) -> List["WalletData"]:
+        """
+        Scan balances of wallets, skip wallets without ETH for fees and move wallets
+        which can't execute first task to the end
+        Args:
+            wallets: list of wallets to process
+            tasks: list of tasks to process
+        Returns: wallets to process
+        """
+        logger.info(f"Scanning balances of {len(wallets)} wallets")
+        balance_snapshot = await BalanceScanner().scan(wallets)
+
+        wallets_to_process, skipped_wallets = balance_snapshot.sort_wallets(wallets=wallets, tasks=tasks)
+        for wallet in skipped_wallets:
+            logger.warning(f"Wallet {wallet.name} has not enough ETH for fees, skipping")
+            self.report_skipped_wallet(wallet=wallet, tasks=tasks)
+
+        return wallets_to_process
+
+    def report_skipped_wallet(
+            self,
+            wallet: "WalletData",
+            tasks: List["TaskBase"],
+    ):
+        """
+        Mark tasks of a wallet skipped before run as failed, so wallet is counted
+        in execution summary and GUI progress
+        Args:
+            wallet: skipped wallet
+            tasks: list of tasks to process
+        """
+        self.event_manager.set_wallet_started(wallet)
+
+        for task in tasks:
+            task = task.copy()
+            task.task_status = enums.TaskStatus.FAILED
+            task.result_info = "Not enough ETH for fees"
+
+            self.event_manager.set_task_started(task, wallet)
+            self.event_manager.set_task_completed(task, wallet)
+            self.execution_summary.add_task_status(task.task_status)
+
+        self.execution_summary.wallets_processed += 1
+        self.event_manager.set_wallet_completed(wallet)
+
+    def defer_on_failed_proxy(self, wallet_schedule: WalletSchedule) -> bool:
+        """
+        Reschedule wallet if its proxy failed last check, up to 'PROXY_MAX_DEFERRALS' times
+        Args:
+            wallet_schedule: wallet schedule
+        Returns: True if wallet is deferred
+        """
+        if wallet_schedule.proxy_deferrals >= config.PROXY_MAX_DEFERRALS:
+            return False
+
+        verdict = ProxyHealthCache().get_verdict(wallet_schedule.wallet.proxy)
+        if verdict is None or verdict.is_valid:
+            return False
+
+        wallet_schedule.proxy_deferrals += 1
+        logger.warning(
+            f"Proxy of wallet {wallet_schedule.wallet.name} is not valid, "
+            f"deferring wallet for {config.PROXY_DEFER_SEC} sec "
+            f"({wallet_schedule.proxy_deferrals}/{config.PROXY_MAX_DEFERRALS})"
+        )
+        self.schedule(wallet_schedule, ready_at=get_pacer().time() + config.PROXY_DEFER_SEC)
+
+        return True
+
+    def on_scheduled_task_done(self):
+        """
+        Free worker slot and wake up dispatcher
+        """
+        self.semaphore.release()
+        self.heap_changed.set()
+
+    async def process_scheduled_task(
+            self,
+            wallet_schedule: WalletSchedule,
+    ):
+        """
+        Process next task of a wallet and schedule the following one
+        Args:
+            wallet_schedule: wallet schedule
+        """
+        repr_context_id.set(id(asyncio.current_task()))
+
+        wallet = wallet_schedule.wallet
+        task = wallet_schedule.next_task
+
+        if self.defer_on_failed_proxy(wallet_schedule):
+            return
+
+        if not wallet_schedule.is_started:
+            wallet_schedule.wallet_context = WalletContext(wallet)
+            self.event_manager.set_wallet_started(wallet)
+
+        wallet_context_var.set(wallet_schedule.wallet_context)
+        worker_slot_var.set(self.semaphore)
+
+        try:
+            task_result = await self.process_task(task=task, wallet=wallet)
+
+        except Exception as ex:
+            logger.exception(ex)
+            task.task_status = enums.TaskStatus.FAILED
+            task_result = None
+
+        self.execution_summary.add_task_status(task.task_status)
+        wallet_schedule.next_task_index += 1
+
+        if wallet_schedule.is_completed:
+            self.execution_summary.wallets_processed += 1
+            self.event_manager.set_wallet_completed(wallet)
+            return
+
+        time_to_sleep = task_utils.get_time_to_sleep(task=task, task_result=task_result)
+        logger.info(repr_message_utils.task_exec_sleep_message(time_to_sleep))
+
+        self.schedule(wallet_schedule, ready_at=get_pacer().time() + time_to_sleep)
+
+
+task_executor_scheduler = TaskExecutorScheduler()
@@ -0,0 +1,160 @@
+import threading as th
+import multiprocessing as mp
+from typing import List
+
+from loguru import logger
+
+from src.schemas.action_models import ExecutionSummary
+from src.schemas.tasks.base.base import TaskBase
+from src.schemas.wallet_data import WalletData
+from src.storage import Storage
+from src.tasks_executor.event_loop import TaskExecutorEventLoop
+from src.internal_queue import InternalQueue
+from src.rate_limiter import RateLimiter
+
+import config
+
+
+def split_into_shards(
+        wallets: List["WalletData"],
+        shards_num: int,
+) -> List[List["WalletData"]]:
+    """
+    Split wallets into shards, keeping wallets start order interleaved between shards
+    Args:
+        wallets: list of wallets
+        shards_num: max shards amount
+    Returns: list of non-empty shards
+    """
+    shards_num = max(1, min(shards_num, len(wallets)))
+    return [wallets[shard_index::shards_num] for shard_index in range(shards_num)]
+
+
+class TaskExecutorSharded(TaskExecutorEventLoop):
+    """
+    Splits wallets into shards processed by separate worker processes.
+    Each shard runs its own event loop limited by app config 'wallets_concurrency_limit'.
+    """
+
+    def __init__(
+            self
+    ):
+        super().__init__()
+
+        self.shard_processes: List[mp.Process] = []
+        self.shard_results_queue = InternalQueue[ExecutionSummary]()
+
+    def _start_shard_processing(
+            self,
+            shard_index: int,
+            shards_num: int,
+            wallets: List["WalletData"],
+            tasks: List["TaskBase"],
+
+            start_delay_sec: float = 0,
+    ):
+        """
+        Process a shard of wallets in worker process
+        Args:
+            shard_index: index of shard
+            shards_num: amount of shards, requests rate limits are split between them
+            wallets: wallets of shard
+            tasks: list of tasks to process
+            start_delay_sec: delay before first wallet start
+        """
+        RateLimiter().set_rate_share(1 / shards_num)
+
+        execution_summary = self.run_event_loop(
+            wallets=wallets,
+            tasks=tasks,
+            start_delay_sec=start_delay_sec,
+        )
+        logger.info(f"Shard {shard_index + 1} processed ({execution_summary})")
+
+        self.shard_results_queue.put(execution_summary)
+
+    def wait_for_shards(self, shard_processes: List[mp.Process]):
+        """
+        Wait for shard processes and log aggregated summary
+        Args:
+            shard_processes: started shard processes
+        """
+        execution_summary = ExecutionSummary()
+
+        for shard_process in shard_processes:
+            shard_process.join()
+
+        for shard_summary in self.shard_results_queue.get_all():
+            execution_summary.merge(shard_summary)
+
+        if any(shard_process.exitcode != 0 for shard_process in shard_processes):
+            logger.warning(f"Wallets processing stopped ({execution_summary})")
+            return
+
+        logger.success(f"All wallets processed ({execution_summary})")
+
+    def is_running(self):
+        return any(shard_process.is_alive() for shard_process in self.shard_processes)
+
+    def process(
+            self,
+            wallets: List["WalletData"],
+            tasks: List["TaskBase"],
+
+            shuffle_wallets: bool = False,
+            shuffle_tasks: bool = False,
+    ):
+        logger.debug("Starting sharded tasks executor")
+
+        wallets, tasks = self._prepare_processing(
+            wallets=wallets,
+            tasks=tasks,
+            shuffle_wallets=shuffle_wallets,
+            shuffle_tasks=shuffle_tasks,
+        )
+        self.shard_results_queue.clear()
+
+        shards = split_into_shards(wallets, Storage().app_config.shard_processes_num)
+
+        self.shard_processes = []
+        for shard_index, shard_wallets in enumerate(shards):
+            shard_process = mp.Process(
+                target=self._start_shard_processing,
+                args=(
+                    shard_index,
+                    len(shards),
+                    shard_wallets,
+                    tasks,
+
+                    shard_index * config.DEFAULT_DELAY_SEC / len(shards),
+                ),
+                name=f"shard_{shard_index}",
+            )
+            shard_process.start()
+            self.shard_processes.append(shard_process)
+
+        self.event_manager.start()
+
+        summary_thread = th.Thread(
+            target=self.wait_for_shards,
+            args=(self.shard_processes,),
+            name="shards_summary",
+        )
+        summary_thread.start()
+
+    def stop(self):
+        self.event_manager.stop()
+
+        for shard_process in self.shard_processes:
+            shard_process.terminate()
+
+        self.shard_processes = []
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state["shard_processes"] = []
+
+        return state
+
+
+task_executor_sharded = TaskExecutorSharded()
@@ -0,0 +1,189 @@
+import asyncio
+import dataclasses
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from starknet_py.net.account.account import Account
+from starknet_py.net.client_models import SentTransactionResponse
+from starknet_py.net.models.transaction import Invoke
+
+from src.nonce_manager import NonceManager
+import config
+
+
+# Signing is CPU-bound, signatures are computed off the event loop
+signing_executor = ThreadPoolExecutor(max_workers=config.PIPELINE_SIGN_WORKERS, thread_name_prefix="txn_signing")
+
+
+class InvokeTransactionBuilder:
+    """
+    Builds invoke transaction with a single fee estimation.
+    Transaction is signed for estimation with forced max fee or zero max fee. Forced max fee
+    transaction is sent as is, otherwise final transaction is signed once with estimated fee
+    multiplied by 'TXN_FEE_ESTIMATE_MULTIPLIER'.
+    Signing methods take nonce read beforehand and do no network requests.
+    """
+
+    def __init__(
+            self,
+            account: Account,
+            calls: list,
+            cairo_version: int,
+            max_fee: Optional[int] = None,
+            nonce_manager: Optional[NonceManager] = None,
+    ):
+        self.account = account
+        self.calls = calls
+        self.cairo_version = cairo_version
+        self.forced_max_fee = max_fee
+        self.nonce_manager = nonce_manager
+
+        self.estimate_transaction: Optional[Invoke] = None
+        self.overall_fee: Optional[int] = None
+        self.transaction: Optional[Invoke] = None
+
+    @property
+    def max_fee(self) -> int:
+        if self.forced_max_fee is not None:
+            return self.forced_max_fee
+
+        return int(self.overall_fee * config.TXN_FEE_ESTIMATE_MULTIPLIER)
+
+    @property
+    def is_estimation_required(self) -> bool:
+        return self.overall_fee is None and self.forced_max_fee is None
+
+    async def get_nonce(self) -> int:
+        """
+        Get nonce for next transaction without reserving it
+        """
+        if self.nonce_manager is None:
+            return await self.account.get_nonce()
+
+        return await self.nonce_manager.get_nonce(self.account.client)
+
+    async def reserve_nonce(self) -> int:
+        """
+        Reserve nonce for transaction to be sent
+        """
+        if self.nonce_manager is None:
+            return await self.account.get_nonce()
+
+        return await self.nonce_manager.acquire(self.account.client)
+
+    async def sign(self, max_fee: int, nonce: int) -> Invoke:
+        """
+        Sign transaction in signing thread pool
+        Args:
+            max_fee: max fee in wei
+            nonce: nonce of transaction
+        """
+        # Account reads nonce from chain only if nonce is not passed
+        transaction = await self.account._prepare_invoke(
+            calls=self.calls,
+            nonce=nonce,
+            max_fee=max_fee,
+            cairo_version=self.cairo_version,
+        )
+
+        signature = await asyncio.get_running_loop().run_in_executor(
+            signing_executor,
+            self.account.signer.sign_transaction,
+            transaction,
+        )
+
+        return dataclasses.replace(transaction, signature=signature)
+
+    async def sign_for_estimation(self, nonce: Optional[int] = None) -> Invoke:
+        """
+        Sign transaction to be estimated, with forced max fee or zero max fee
+        Args:
+            nonce: nonce of transaction, read if None
+        """
+        if nonce is None:
+            nonce = await self.get_nonce()
+
+        self.estimate_transaction = await self.sign(
+            max_fee=self.forced_max_fee if self.forced_max_fee is not None else 0,
+            nonce=nonce,
+        )
+
+        return self.estimate_transaction
+
+    async def estimate_fee(self) -> int:
+        """
+        Estimate fee of signed transaction
+        Returns: overall fee in wei
+        """
+        if self.estimate_transaction is None:
+            await self.sign_for_estimation()
+
+        try:
+            estimated_fee = await self.account.client.estimate_fee(tx=self.estimate_transaction)
+
+        except Exception:
+            # Estimation fails on nonce mismatch too, resync nonce on next use
+            if self.nonce_manager is not None:
+                self.nonce_manager.invalidate()
+            raise
+
+        self.overall_fee = estimated_fee.overall_fee
+
+        return self.overall_fee
+
+    async def build(self, nonce: int) -> Invoke:
+        """
+        Get transaction to send, estimated transaction is reused if max fee is forced and nonce is not changed
+        Args:
+            nonce: nonce of transaction
+        """
+        if self.is_estimation_required:
+            await self.estimate_fee()
+
+        if self.estimate_transaction is not None and self.forced_max_fee is not None:
+            if nonce == self.estimate_transaction.nonce:
+                return self.estimate_transaction
+
+        return await self.sign(max_fee=self.max_fee, nonce=nonce)
+
+    async def sign_final(self, nonce: Optional[int] = None) -> Invoke:
+        """
+        Sign final transaction
+        Args:
+            nonce: nonce reserved for transaction, reserved if None
+        """
+        if nonce is None:
+            nonce = await self.reserve_nonce()
+
+        try:
+            self.transaction = await self.build(nonce=nonce)
+            return self.transaction
+
+        except Exception:
+            # Reserved nonce is not used
+            if self.nonce_manager is not None:
+                self.nonce_manager.invalidate()
+            raise
+
+    async def submit(self) -> SentTransactionResponse:
+        """
+        Send signed final transaction
+        """
+        if self.transaction is None:
+            await self.sign_final()
+
+        try:
+            return await self.account.client.send_transaction(self.transaction)
+
+        except Exception:
+            # Rejected or lost transaction leaves local nonce ahead of chain
+            if self.nonce_manager is not None:
+                self.nonce_manager.invalidate()
+            raise
+
+    async def send(self) -> SentTransactionResponse:
+        """
+        Sign final transaction and send it
+        """
+        await self.sign_final()
+        return await self.submit()
@@ -0,0 +1,249 @@
+import asyncio
+import weakref
+import contextvars
+import threading as th
+from typing import Any, Awaitable, Callable, Dict, List, Set, Tuple
+
+from loguru import logger
+from starknet_py.net.client_models import SentTransactionResponse
+
+from src.receipt_tracker import ReceiptTracker
+from src.transaction_builder import InvokeTransactionBuilder
+import config
+
+
+PipelineStep = Tuple[str, Callable[[], Awaitable[Any]]]
+
+
+class PipelineJob:
+    """
+    Steps of a transaction to be run one by one, each step in its own stage.
+    Steps run in context of the task that created the job, so their logs keep its wallet.
+    Future gets result of the last step or exception of the failed one.
+    """
+
+    def __init__(self, steps: List[PipelineStep]):
+        self.steps = steps
+        self.step_index = 0
+        self.future = asyncio.get_running_loop().create_future()
+        self.context = contextvars.copy_context()
+
+    @property
+    def stage_name(self) -> str:
+        return self.steps[self.step_index][0]
+
+    async def run_step(self) -> bool:
+        """
+        Run current step of the job
+        Returns: True if job has next step to be run
+        """
+        _, step = self.steps[self.step_index]
+
+        try:
+            result = await self.context.run(asyncio.ensure_future, step())
+
+        except Exception as ex:
+            if not self.future.done():
+                self.future.set_exception(ex)
+            return False
+
+        self.step_index += 1
+        if self.step_index < len(self.steps):
+            return True
+
+        if not self.future.done():
+            self.future.set_result(result)
+        return False
+
+
+class PipelineStage:
+    """
+    Bounded queue of jobs with a limited amount of workers.
+    Workers are spawned when jobs are queued and exit once the queue is empty,
+    so no idle tasks are left on the event loop.
+    """
+
+    def __init__(
+            self,
+            name: str,
+            workers_amount: int,
+            queue_size: int,
+    ):
+        self.name = name
+        self.workers_amount = workers_amount
+
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+        self.workers: Set[asyncio.Task] = set()
+
+        self.next_stages: Dict[str, "PipelineStage"] = {}
+
+    @property
+    def depth(self) -> int:
+        return self.queue.qsize()
+
+    async def put(self, job: PipelineJob):
+        if self.queue.full():
+            logger.debug(f"Transaction pipeline stage '{self.name}' is full ({self.depth} jobs queued)")
+
+        await self.queue.put(job)
+        self.spawn_workers()
+
+    def spawn_workers(self):
+        self.workers = {worker for worker in self.workers if not worker.done()}
+
+        while len(self.workers) < min(self.workers_amount, self.queue.qsize()):
+            # Workers are shared by all wallets, don't inherit context of the spawning one
+            self.workers.add(contextvars.Context().run(asyncio.ensure_future, self.work()))
+
+    async def work(self):
+        while not self.queue.empty():
+            job: PipelineJob = self.queue.get_nowait()
+
+            try:
+                has_next_step = await job.run_step()
+                if has_next_step:
+                    # Waits for free place in the next stage queue, so slow stages hold back fast ones
+                    await self.next_stages[job.stage_name].put(job)
+
+            except Exception as ex:
+                if not job.future.done():
+                    job.future.set_exception(ex)
+
+            finally:
+                self.queue.task_done()
+
+
+class TransactionPipeline:
+    """
+    Transactions of all wallets pass through shared stages connected by bounded queues, one set
+    per event loop: signing with 'PIPELINE_SIGN_WORKERS' workers signing in a thread pool of the same
+    size, estimation and submission with 'PIPELINE_ESTIMATE_WORKERS' and 'PIPELINE_SUBMIT_WORKERS'
+    workers. Nonce is read before a job enters the pipeline, so signing stage does no network requests.
+    Jobs only move forward through stages, as a job sent back to a full earlier stage could deadlock
+    with workers of that stage.
+    Confirmation is done by ReceiptTracker in background. Queue depths show which stage a run is
+    bottlenecked on.
+    """
+    _instance = None
+
+    _stages: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, PipelineStage]]"
+    _lock: th.Lock
+
+    def __new__(cls):
+        if not cls._instance:
+            instance = super(TransactionPipeline, cls).__new__(cls)
+            instance._stages = weakref.WeakKeyDictionary()
+            instance._lock = th.Lock()
+
+            cls._instance = instance
+
+        return cls._instance
+
+    @staticmethod
+    def create_stages() -> Dict[str, PipelineStage]:
+        stages = {
+            "sign": PipelineStage(
+                name="sign",
+                workers_amount=config.PIPELINE_SIGN_WORKERS,
+                queue_size=config.PIPELINE_QUEUE_SIZE,
+            ),
+            "estimate": PipelineStage(
+                name="estimate",
+                workers_amount=config.PIPELINE_ESTIMATE_WORKERS,
+                queue_size=config.PIPELINE_QUEUE_SIZE,
+            ),
+            "submit": PipelineStage(
+                name="submit",
+                workers_amount=config.PIPELINE_SUBMIT_WORKERS,
+                queue_size=config.PIPELINE_QUEUE_SIZE,
+            ),
+        }
+
+        for stage in stages.values():
+            stage.next_stages = stages
+
+        return stages
+
+    def get_stages(self) -> Dict[str, PipelineStage]:
+        """
+        Get stages of current event loop
+        """
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            stages = self._stages.get(loop)
+            if stages is None:
+                stages = self.create_stages()
+                self._stages[loop] = stages
+
+            return stages
+
+    async def run(self, steps: List[PipelineStep]) -> Any:
+        """
+        Run steps through pipeline stages
+        Args:
+            steps: stage name and step coroutine function pairs
+        Returns: result of the last step
+        """
+        job = PipelineJob(steps=steps)
+        await self.get_stages()[job.stage_name].put(job)
+
+        return await job.future
+
+    async def estimate(self, transaction_builder: InvokeTransactionBuilder) -> int:
+        """
+        Sign transaction for estimation and estimate its fee
+        Args:
+            transaction_builder: builder of transaction
+        Returns: overall fee in wei
+        """
+        nonce = await transaction_builder.get_nonce()
+
+        return await self.run([
+            ("sign", lambda: transaction_builder.sign_for_estimation(nonce=nonce)),
+            ("estimate", transaction_builder.estimate_fee),
+        ])
+
+    async def submit(self, transaction_builder: InvokeTransactionBuilder) -> SentTransactionResponse:
+        """
+        Sign final transaction and send it, fee is estimated first if it is not estimated yet.
+        Estimation and submission are separate jobs, so no job goes back to signing stage.
+        Args:
+            transaction_builder: builder of transaction
+        """
+        nonce = await transaction_builder.reserve_nonce()
+
+        try:
+            if transaction_builder.is_estimation_required:
+                await self.run([
+                    ("sign", lambda: transaction_builder.sign_for_estimation(nonce=nonce)),
+                    ("estimate", transaction_builder.estimate_fee),
+                ])
+
+            return await self.run([
+                ("sign", lambda: transaction_builder.sign_final(nonce=nonce)),
+                ("submit", transaction_builder.submit),
+            ])
+
+        except Exception:
+            # Reserved nonce is not used
+            if transaction_builder.nonce_manager is not None:
+                transaction_builder.nonce_manager.invalidate()
+            raise
+
+    def get_queue_depths(self) -> Dict[str, int]:
+        """
+        Get amount of queued jobs of each stage summed over all event loops,
+        'confirm' is amount of transactions waiting for receipt
+        """
+        with self._lock:
+            loops_stages = list(self._stages.values())
+
+        queue_depths = {"sign": 0, "estimate": 0, "submit": 0}
+        for stages in loops_stages:
+            for name, stage in stages.items():
+                queue_depths[name] += stage.depth
+
+        queue_depths["confirm"] = ReceiptTracker().pending_amount
+
+        return queue_depths
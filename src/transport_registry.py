@@ -0,0 +1,145 @@
+import time
+import asyncio
+import weakref
+import threading as th
+from typing import Dict, Optional, Set, Tuple
+
+import aiohttp
+from aiohttp_socks import SocksConnector
+
+from src.custom_client_session import CustomSession
+import config
+
+
+TransportKey = Tuple[Optional[str], Optional[str]]
+
+
+class TransportRegistry:
+    """
+    Long-lived keep-alive sessions keyed by (proxy type, proxy url), one set per event loop.
+    Connector of a session pools connections per host. Sessions idle for 'TRANSPORT_IDLE_TIMEOUT_SEC'
+    are closed only if no request is in flight and no client holds them, others live until
+    'close_sessions' is called on executor shutdown.
+    """
+    _instance = None
+
+    _sessions: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[TransportKey, CustomSession]]"
+    _closing: Set[asyncio.Task]
+    _lock: th.Lock
+
+    def __new__(cls):
+        if not cls._instance:
+            instance = super(TransportRegistry, cls).__new__(cls)
+            instance._sessions = weakref.WeakKeyDictionary()
+            instance._closing = set()
+            instance._lock = th.Lock()
+
+            cls._instance = instance
+
+        return cls._instance
+
+    @staticmethod
+    def get_connector_kwargs() -> dict:
+        return {
+            "limit": config.TRANSPORT_POOL_LIMIT,
+            "limit_per_host": config.TRANSPORT_POOL_LIMIT_PER_HOST,
+            "ttl_dns_cache": config.TRANSPORT_DNS_CACHE_TTL_SEC,
+            "keepalive_timeout": config.TRANSPORT_KEEPALIVE_TIMEOUT_SEC,
+        }
+
+    def create_session(
+            self,
+            proxy_type: Optional[str] = None,
+            proxy_url: Optional[str] = None,
+    ) -> CustomSession:
+        """
+        Create session with pooled connector
+        Args:
+            proxy_type: 'http' or 'socks5', None for direct connection
+            proxy_url: proxy url
+        """
+        if proxy_type is None:
+            connector = aiohttp.TCPConnector(**self.get_connector_kwargs())
+            return CustomSession(connector=connector)
+
+        if proxy_type == 'http':
+            connector = aiohttp.TCPConnector(**self.get_connector_kwargs())
+            return CustomSession(proxy=proxy_url, connector=connector)
+
+        if proxy_type == 'socks5':
+            connector = SocksConnector.from_url(url=proxy_url, **self.get_connector_kwargs())
+            return CustomSession(connector=connector)
+
+        raise ValueError(f"Unknown proxy type: {proxy_type}")
+
+    def get_session(
+            self,
+            proxy_type: Optional[str] = None,
+            proxy_url: Optional[str] = None,
+    ) -> CustomSession:
+        """
+        Get shared session of current event loop, the session must not be closed by caller
+        Args:
+            proxy_type: 'http' or 'socks5', None for direct connection
+            proxy_url: proxy url
+        """
+        loop = asyncio.get_event_loop()
+        key = (proxy_type, proxy_url)
+
+        with self._lock:
+            sessions = self._sessions.setdefault(loop, {})
+            self.evict_idle_sessions(loop, sessions)
+
+            session = sessions.get(key)
+            if session is None or session.closed:
+                session = self.create_session(proxy_type=proxy_type, proxy_url=proxy_url)
+                sessions[key] = session
+
+            session.last_used_at = time.monotonic()
+
+            return session
+
+    def evict_idle_sessions(
+            self,
+            loop: asyncio.AbstractEventLoop,
+            sessions: Dict[TransportKey, CustomSession],
+    ):
+        """
+        Close sessions idle for 'TRANSPORT_IDLE_TIMEOUT_SEC' which are not in use
+        Args:
+            loop: event loop of sessions
+            sessions: sessions of the loop
+        """
+        now = time.monotonic()
+
+        for key, session in list(sessions.items()):
+            if session.closed:
+                sessions.pop(key)
+                continue
+
+            if session.is_in_use or now - session.last_used_at < config.TRANSPORT_IDLE_TIMEOUT_SEC:
+                continue
+
+            sessions.pop(key)
+
+            # Task is referenced until done, so it is not garbage collected before session is closed
+            close_task = loop.create_task(session.close())
+            self._closing.add(close_task)
+            close_task.add_done_callback(self._closing.discard)
+
+    async def close_sessions(self):
+        """
+        Close all sessions of current event loop
+        """
+        loop = asyncio.get_running_loop()
+
+        with self._lock:
+            sessions = self._sessions.pop(loop, {})
+            closing = [task for task in self._closing if task.get_loop() is loop]
+
+        for session in sessions.values():
+            if not session.closed:
+                await session.close()
+
+        if closing:
+            await asyncio.gather(*closing, return_exceptions=True)
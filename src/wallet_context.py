@@ -0,0 +1,136 @@
+import asyncio
+from contextvars import ContextVar
+from typing import Optional, Any, Dict
+
+from starknet_py.net.account.account import Account
+from starknet_py.net.full_node_client import FullNodeClient
+from starknet_py.net.models import StarknetChainId
+from starknet_py.net.signer.stark_curve_signer import KeyPair
+
+from src.schemas.wallet_data import WalletData
+from src.proxy_manager import ProxyManager
+from src.proxy_health import ProxyHealthCache
+from src.nonce_manager import NonceManager
+from src.rpc_pool import RpcPool
+from src.custom_client_session import CustomSession
+from utils.key_manager.key_manager import get_key_pair_from_pk
+
+
+class WalletContext:
+    """
+    Per wallet state shared by all tasks of the wallet: derived key pair and address,
+    session, client and account, proxy status, local nonce and cached chain state.
+    Everything is derived lazily on first use.
+    """
+
+    def __init__(self, wallet_data: "WalletData"):
+        self.wallet_data = wallet_data
+
+        self.chain_state: Dict[str, Any] = {}
+
+        self._address: Optional[str] = None
+        self._key_pair: Optional[KeyPair] = None
+        self._proxy_manager: Optional[ProxyManager] = None
+        self._nonce_manager: Optional[NonceManager] = None
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._client: Optional[FullNodeClient] = None
+        self._account: Optional[Account] = None
+
+    @property
+    def address(self) -> str:
+        if self._address is None:
+            self._address = self.wallet_data.address
+
+        return self._address
+
+    @property
+    def key_pair(self) -> KeyPair:
+        if self._key_pair is None:
+            self._key_pair = get_key_pair_from_pk(self.wallet_data.private_key)
+
+        return self._key_pair
+
+    @property
+    def proxy_manager(self) -> ProxyManager:
+        if self._proxy_manager is None:
+            self._proxy_manager = ProxyManager(self.wallet_data.proxy)
+
+        return self._proxy_manager
+
+    @property
+    def nonce_manager(self) -> NonceManager:
+        if self._nonce_manager is None:
+            self._nonce_manager = NonceManager(int(self.address, 16))
+
+        return self._nonce_manager
+
+    @property
+    def session(self) -> CustomSession:
+        return self.proxy_manager.get_session()
+
+    def _setup_account(self):
+        loop = asyncio.get_event_loop()
+        session = self.session
+
+        # Sessions are bound to event loop, rebuild client if loop or evicted session is changed
+        if self._account is not None and self._loop is loop and self._client._client.session is session:
+            return
+
+        self._loop = loop
+        self._client = RpcPool().get_client(session=session)
+        self._account = Account(
+            address=self.address,
+            client=self._client,
+            key_pair=self.key_pair,
+            chain=StarknetChainId.MAINNET,
+        )
+
+    @property
+    def client(self) -> FullNodeClient:
+        self._setup_account()
+        return self._client
+
+    @property
+    def account(self) -> Account:
+        self._setup_account()
+        return self._account
+
+    async def get_proxy_ip(self) -> Optional[str]:
+        """
+        Get current ip from proxy health cache, None if proxy is not valid
+        """
+        verdict = await ProxyHealthCache().verify(self.wallet_data.proxy)
+        return verdict.ip
+
+    def get_chain_state(self, key: str, default: Any = None) -> Any:
+        return self.chain_state.get(key, default)
+
+    def set_chain_state(self, key: str, value: Any):
+        self.chain_state[key] = value
+
+    def invalidate_chain_state(self):
+        """
+        Drop cached chain state and local nonce, e.g. after account deploy or upgrade
+        """
+        self.chain_state = {}
+
+        if self._nonce_manager is not None:
+            self._nonce_manager.invalidate()
+
+
+wallet_context_var: ContextVar[Optional[WalletContext]] = ContextVar("wallet_context", default=None)
+
+
+def get_wallet_context(wallet_data: "WalletData") -> WalletContext:
+    """
+    Get context of wallet being processed, a new context is created if wallet is not processed
+    Args:
+        wallet_data: wallet data
+    """
+    wallet_context = wallet_context_var.get()
+
+    if wallet_context is None or wallet_context.wallet_data.wallet_id != wallet_data.wallet_id:
+        return WalletContext(wallet_data)
+
+    return wallet_context
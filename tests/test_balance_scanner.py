@@ -0,0 +1,75 @@
+import asyncio
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+import numpy as np
+import pandas as pd
+
+from contracts.base import TokenBase
+from src.balance_scanner import BalanceScanner
+from src.balance_scanner import BalanceSnapshot
+
+
+class FakeWalletContext:
+    def __init__(self, wallet):
+        self.address = wallet.address
+        self.client = None
+
+
+class TestBalanceScanner(unittest.TestCase):
+    def setUp(self):
+        self.tokens = [
+            TokenBase(symbol="eth", contract_address="0x1"),
+            TokenBase(symbol="usdc", contract_address="0x2"),
+            TokenBase(symbol="ETH", contract_address="0x3"),
+        ]
+        self.wallets = [
+            SimpleNamespace(wallet_id=index, name=f"Wallet {index}", address=hex(0x100 + index))
+            for index in range(3)
+        ]
+
+    def scan(self, balances_wei: dict) -> BalanceSnapshot:
+        async def fetch_balance_wei(client, token, wallet_address):
+            balance_wei = balances_wei[(wallet_address, token.symbol)]
+            if isinstance(balance_wei, Exception):
+                raise balance_wei
+
+            return balance_wei
+
+        async def fetch_decimals(client, token):
+            return {"eth": 18, "usdc": 6}[token.symbol]
+
+        with mock.patch("src.balance_scanner.WalletContext", FakeWalletContext), \
+                mock.patch.object(BalanceScanner, "fetch_balance_wei", side_effect=fetch_balance_wei), \
+                mock.patch.object(BalanceScanner, "fetch_decimals", side_effect=fetch_decimals):
+            return asyncio.run(BalanceScanner(tokens=self.tokens).scan(self.wallets))
+
+    def test_scan_table(self):
+        snapshot = self.scan({
+            ("0x100", "eth"): 10 ** 18, ("0x100", "usdc"): 5 * 10 ** 6,
+            ("0x101", "eth"): 0, ("0x101", "usdc"): ValueError("timeout"),
+            ("0x102", "eth"): 10 ** 16, ("0x102", "usdc"): 0,
+        })
+
+        self.assertEqual(list(snapshot.balances.columns), ["eth", "usdc"])
+        self.assertEqual(list(snapshot.balances.index), ["0x100", "0x101", "0x102"])
+        self.assertEqual(snapshot.get_balance(self.wallets[0], "USDC"), 5)
+        self.assertIsNone(snapshot.get_balance(self.wallets[1], "usdc"))
+        self.assertEqual(snapshot.get_wallet_balances(self.wallets[1]), {"eth": 0})
+
+    def test_sort_wallets(self):
+        snapshot = BalanceSnapshot(
+            balances=pd.DataFrame(
+                [[1, 0], [0, 100], [0.1, 100], [np.nan, np.nan]],
+                index=["0x100", "0x101", "0x102", "0x103"],
+                columns=["eth", "usdc"],
+            ),
+        )
+        wallets = [*self.wallets, SimpleNamespace(wallet_id=3, address="0x103")]
+        task = SimpleNamespace(coin_x="USDC", min_amount_out=10, use_all_balance=False)
+
+        wallets_to_process, skipped_wallets = snapshot.sort_wallets(wallets=wallets, tasks=[task])
+
+        self.assertEqual(wallets_to_process, [wallets[2], wallets[3], wallets[0]])
+        self.assertEqual(skipped_wallets, [wallets[1]])
@@ -0,0 +1,45 @@
+import unittest
+from unittest import mock
+
+from starknet_py.contract import Contract
+from starknet_py.net.full_node_client import FullNodeClient
+
+from src.contract_registry import ContractRegistry
+from src import paths
+
+
+class TestContractRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = ContractRegistry()
+        self.client = FullNodeClient(node_url="http://127.0.0.1")
+
+    def test_abi_file_read_once(self):
+        with mock.patch("utils.file_manager.FileManager.read_abi_from_file", return_value=[]) as read_abi:
+            abi = self.registry.get_abi("registry_test.abi")
+
+            self.assertIs(self.registry.get_abi("registry_test.abi"), abi)
+            read_abi.assert_called_once()
+
+    def test_contract_handles_share_parsed_abi(self):
+        abi = self.registry.get_abi(paths.ACCOUNT_ABI_FILE)
+
+        first_contract = self.registry.get_contract(address="0x1", abi=abi, provider=self.client)
+        second_contract = self.registry.get_contract(address="0x2", abi=abi, provider=self.client)
+
+        self.assertIs(first_contract.data.parsed_abi, second_contract.data.parsed_abi)
+        self.assertEqual(first_contract.address, 0x1)
+        self.assertEqual(second_contract.address, 0x2)
+        self.assertIs(second_contract.functions["getVersion"].client, self.client)
+        self.assertEqual(second_contract.functions["getVersion"].contract_data.address, 0x2)
+
+    def test_prepared_call_matches_contract(self):
+        abi = self.registry.get_abi(paths.ACCOUNT_ABI_FILE)
+        contract = Contract(address="0x3", abi=abi, provider=self.client)
+        registry_contract = self.registry.get_contract(address="0x3", abi=abi, provider=self.client)
+
+        prepared_call = contract.functions["getVersion"].prepare()
+        registry_prepared_call = registry_contract.functions["getVersion"].prepare()
+
+        self.assertEqual(registry_prepared_call.to_addr, prepared_call.to_addr)
+        self.assertEqual(registry_prepared_call.selector, prepared_call.selector)
+        self.assertEqual(registry_prepared_call.calldata, prepared_call.calldata)
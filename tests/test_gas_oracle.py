@@ -0,0 +1,78 @@
+import sys
+import asyncio
+import unittest
+import multiprocessing as mp
+from unittest import mock
+
+from src.gas_oracle import GasOracle
+from src.gas_oracle import GasPriceSnapshot
+
+
+class TestGasOracle(unittest.TestCase):
+    def setUp(self):
+        self.gas_oracle = GasOracle()
+        self.gas_oracle.latest = None
+        self.gas_oracle.failures = 0
+
+        self.gas_prices_gwei = [30, 25, 10]
+        self.fetches = 0
+
+        async def fetch_snapshot():
+            gas_price_gwei = self.gas_prices_gwei[min(self.fetches, len(self.gas_prices_gwei) - 1)]
+            self.fetches += 1
+            return GasPriceSnapshot(stark_gas_price=gas_price_gwei * 10 ** 9)
+
+        patchers = [
+            mock.patch.object(self.gas_oracle, "fetch_snapshot", fetch_snapshot),
+            mock.patch("config.GAS_ORACLE_POLL_INTERVAL_SEC", 0.01),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.addCleanup(self.wait_for_polling_stop)
+
+    def wait_for_polling_stop(self):
+        polling_thread = self.gas_oracle._polling_thread
+        if polling_thread is not None:
+            polling_thread.join(timeout=1)
+
+    def test_waiters_share_polls(self):
+        async def run():
+            return await asyncio.gather(*[self.gas_oracle.below(target_price_gwei=20) for _ in range(50)])
+
+        snapshots = asyncio.run(run())
+
+        self.assertTrue(all(snapshot.get_gas_price_gwei() == 10 for snapshot in snapshots))
+        self.assertEqual(self.fetches, 3)
+
+    def test_fresh_snapshot_served_from_cache(self):
+        snapshot = asyncio.run(self.gas_oracle.get_latest())
+
+        self.assertIs(asyncio.run(self.gas_oracle.get_latest()), snapshot)
+        self.assertEqual(self.fetches, 1)
+
+    def test_wait_timeout(self):
+        self.gas_prices_gwei = [30]
+
+        snapshot = asyncio.run(self.gas_oracle.below(target_price_gwei=20, timeout_sec=0.05))
+
+        self.assertIsNone(snapshot)
+        self.assertEqual(self.gas_oracle.latest.get_gas_price_gwei(), 30)
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "fork start method is used on linux")
+    def test_polling_in_forked_process(self):
+        snapshots = []
+        self.gas_oracle.subscribe(snapshots.append)
+        self.addCleanup(self.gas_oracle.unsubscribe, snapshots.append)
+        asyncio.run(self.gas_oracle.get_latest())
+
+        results = mp.get_context("fork").Queue()
+        process = mp.get_context("fork").Process(
+            target=lambda: results.put(asyncio.run(self.gas_oracle.below(target_price_gwei=20)).get_gas_price_gwei()),
+            daemon=True,
+        )
+        process.start()
+        process.join(timeout=5)
+
+        self.assertEqual(results.get(timeout=1), 10)
@@ -0,0 +1,86 @@
+import sys
+import time
+import asyncio
+import unittest
+import multiprocessing as mp
+from unittest import mock
+
+from src.gecko_pricer import GeckoPriceCache
+from src.gecko_pricer import GeckoPricer
+
+
+class TestGeckoPriceCache(unittest.TestCase):
+    def setUp(self):
+        self.price_cache = GeckoPriceCache()
+        self.price_cache.prices = {}
+        self.price_cache.fetched_at = None
+        self.price_cache._requested_ids = set()
+
+        self.fetched_ids = []
+
+        async def fetch_prices(ids):
+            self.fetched_ids.append(ids)
+            await asyncio.sleep(0.01)
+            return {coin_id: 2.0 for coin_id in ids}
+
+        patchers = [
+            mock.patch.object(self.price_cache, "fetch_prices", fetch_prices),
+            mock.patch.object(GeckoPriceCache, "get_tokens_ids", return_value=["ethereum", "usd-coin"]),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_tokens_fetched_in_single_request(self):
+        async def run():
+            return await asyncio.gather(*[
+                GeckoPricer().is_target_price_valid(
+                    x_token_id="ethereum",
+                    y_token_id="usd-coin",
+                    x_amount=1,
+                    y_amount=1.5,
+                    max_price_difference_percent=1,
+                )
+                for _ in range(20)
+            ])
+
+        results = asyncio.run(run())
+
+        self.assertTrue(all(is_valid for is_valid, _ in results))
+        self.assertEqual(self.fetched_ids, [["ethereum", "usd-coin"]])
+
+    def test_stale_prices_served_while_revalidated(self):
+        self.assertEqual(GeckoPricer.get_simple_price_of_token_sync("ethereum"), 2.0)
+
+        self.price_cache.prices["ethereum"] = 1.0
+        self.price_cache.fetched_at = time.monotonic() - 120
+
+        self.assertEqual(GeckoPricer.get_simple_price_of_token_sync("ethereum"), 1.0)
+
+        refresh = self.price_cache._refresh
+        if refresh is not None:
+            refresh.result(timeout=1)
+
+        self.assertEqual(GeckoPricer.get_simple_price_of_token_sync("ethereum"), 2.0)
+        self.assertEqual(len(self.fetched_ids), 2)
+
+    def test_unknown_id_added_to_batch(self):
+        prices = asyncio.run(self.price_cache.get_prices(["dai"]))
+
+        self.assertEqual(prices, {"dai": 2.0})
+        self.assertEqual(self.fetched_ids, [["dai", "ethereum", "usd-coin"]])
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "fork start method is used on linux")
+    def test_refresh_in_forked_process(self):
+        self.assertEqual(GeckoPricer.get_simple_price_of_token_sync("ethereum"), 2.0)
+        self.price_cache.fetched_at = time.monotonic() - 3600
+
+        results = mp.get_context("fork").Queue()
+        process = mp.get_context("fork").Process(
+            target=lambda: results.put(GeckoPricer.get_simple_price_of_token_sync("ethereum")),
+            daemon=True,
+        )
+        process.start()
+        process.join(timeout=5)
+
+        self.assertEqual(results.get(timeout=1), 2.0)
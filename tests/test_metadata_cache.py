@@ -0,0 +1,93 @@
+import os
+import sys
+import asyncio
+import tempfile
+import unittest
+import multiprocessing as mp
+from unittest import mock
+
+from src.metadata_cache import MetadataCache
+
+
+class TestMetadataCache(unittest.TestCase):
+    def setUp(self):
+        self.db_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(self.db_dir.cleanup)
+        self.db_path = os.path.join(self.db_dir.name, "metadata_cache.db")
+
+        with mock.patch("src.paths.METADATA_CACHE_FILE", ":memory:"):
+            self.metadata_cache = MetadataCache()
+
+        self.metadata_cache.load(self.db_path)
+        self.addCleanup(self.metadata_cache.load, ":memory:")
+
+        self.fetches = 0
+
+    async def fetch_decimals(self):
+        self.fetches += 1
+        return 18
+
+    def get_decimals(self, contract_address):
+        return asyncio.run(self.metadata_cache.get_or_fetch(
+            contract_address=contract_address,
+            selector="decimals",
+            fetch=self.fetch_decimals,
+        ))
+
+    def test_value_fetched_once(self):
+        self.assertEqual(self.get_decimals("0x049d"), 18)
+        self.assertEqual(self.get_decimals(0x49d), 18)
+        self.assertEqual(self.fetches, 1)
+
+    def test_entries_loaded_from_file(self):
+        self.get_decimals("0x049d")
+        self.metadata_cache.set("0x1", "getVersion", 1, ttl_sec=-1)
+
+        self.metadata_cache.load(self.db_path)
+
+        self.assertEqual(self.metadata_cache.get("0x049d", "decimals"), 18)
+        self.assertIsNone(self.metadata_cache.get("0x1", "getVersion"))
+
+    def test_invalidate_by_selector(self):
+        self.metadata_cache.set("0x1", "getVersion", 1)
+        self.metadata_cache.set("0x1", "decimals", 18)
+
+        self.metadata_cache.invalidate("0x1", selector="getVersion")
+        self.metadata_cache.load(self.db_path)
+
+        self.assertIsNone(self.metadata_cache.get("0x1", "getVersion"))
+        self.assertEqual(self.metadata_cache.get("0x1", "decimals"), 18)
+
+    def test_none_not_cached(self):
+        async def fetch_missing_pool():
+            self.fetches += 1
+            return None
+
+        for _ in range(2):
+            asyncio.run(self.metadata_cache.get_or_fetch(
+                contract_address="0x2",
+                selector="get_pair",
+                args=(1, 2),
+                fetch=fetch_missing_pool,
+            ))
+
+        self.assertEqual(self.fetches, 2)
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "fork start method is used on linux")
+    def test_connection_reopened_in_forked_process(self):
+        parent_connection = self.metadata_cache._connection
+
+        results = mp.get_context("fork").Queue()
+
+        def set_in_child():
+            self.metadata_cache.set("0x3", "decimals", 6)
+            results.put(self.metadata_cache._connection is not parent_connection)
+
+        process = mp.get_context("fork").Process(target=set_in_child, daemon=True)
+        process.start()
+        process.join(timeout=5)
+
+        self.assertTrue(results.get(timeout=1))
+
+        self.metadata_cache.load(self.db_path)
+        self.assertEqual(self.metadata_cache.get("0x3", "decimals"), 6)
@@ -0,0 +1,39 @@
+import asyncio
+import unittest
+
+from src.nonce_manager import NonceManager
+
+
+class FakeClient:
+    def __init__(self, chain_nonce: int):
+        self.chain_nonce = chain_nonce
+        self.nonce_reads = 0
+
+    async def get_contract_nonce(self, contract_address, block_number=None):
+        self.nonce_reads += 1
+        await asyncio.sleep(0.01)
+        return self.chain_nonce
+
+
+class TestNonceManager(unittest.TestCase):
+    def setUp(self):
+        self.client = FakeClient(chain_nonce=5)
+        self.nonce_manager = NonceManager(address=0x1)
+
+    def test_sequential_nonces(self):
+        async def acquire_nonces():
+            return await asyncio.gather(*[self.nonce_manager.acquire(self.client) for _ in range(3)])
+
+        self.assertEqual(asyncio.run(acquire_nonces()), [5, 6, 7])
+        self.assertEqual(self.client.nonce_reads, 1)
+        self.assertEqual(asyncio.run(self.nonce_manager.get_nonce(self.client)), 8)
+
+    def test_resync_after_invalidate(self):
+        asyncio.run(self.nonce_manager.acquire(self.client))
+        asyncio.run(self.nonce_manager.acquire(self.client))
+
+        self.nonce_manager.invalidate()
+        self.client.chain_nonce = 6
+
+        self.assertEqual(asyncio.run(self.nonce_manager.acquire(self.client)), 6)
+        self.assertEqual(self.client.nonce_reads, 2)
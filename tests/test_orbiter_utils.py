@@ -0,0 +1,32 @@
+import unittest
+from unittest import mock
+
+from utils.orbiter_utils import OrbiterRouteTable
+from utils.orbiter_utils import get_orbiter_bridge_data_by_token
+from utils.orbiter_utils import get_available_tokens_for_chain
+
+
+class TestOrbiterRouteTable(unittest.TestCase):
+    def setUp(self):
+        self.route_table = OrbiterRouteTable()
+        self.route_table.file_mtime = None
+
+    def test_route_lookup(self):
+        chain_data = get_orbiter_bridge_data_by_token(chain_id=9019, token_symbol="eth")
+
+        self.assertEqual(chain_data.makerAddress, self.route_table.raw_routes[(4, 19)]["ETH-ETH"]["makerAddress"])
+        self.assertEqual(get_available_tokens_for_chain(chain_id=9019), ["ETH", "USDT", "USDC"])
+        self.assertIsNone(get_orbiter_bridge_data_by_token(chain_id=9019, token_symbol="unknown"))
+        self.assertIsNone(get_available_tokens_for_chain(chain_id=9999))
+
+    def test_file_parsed_once(self):
+        with mock.patch.object(self.route_table, "load", wraps=self.route_table.load) as load:
+            for _ in range(3):
+                get_orbiter_bridge_data_by_token(chain_id=9019, token_symbol="ETH")
+
+            self.assertEqual(load.call_count, 1)
+
+            with mock.patch.object(OrbiterRouteTable, "get_file_mtime", return_value=0):
+                get_available_tokens_for_chain(chain_id=9019)
+
+            self.assertEqual(load.call_count, 2)
@@ -0,0 +1,51 @@
+import asyncio
+import unittest
+
+from src.pacer import Pacer
+from src.pacer import get_pacer
+
+
+class TestPacer(unittest.TestCase):
+    def test_delays_resolve_in_deadline_order(self):
+        async def run():
+            pacer = get_pacer()
+            woken = []
+
+            async def sleeper(name: str, delay: float):
+                await pacer.sleep(delay)
+                woken.append(name)
+
+            await asyncio.gather(
+                sleeper("slow", 0.03),
+                sleeper("fast", 0.01),
+                sleeper("medium", 0.02),
+            )
+            return woken, pacer.pending
+
+        woken, pending = asyncio.run(run())
+        self.assertEqual(woken, ["fast", "medium", "slow"])
+        self.assertEqual(pending, 0)
+
+    def test_non_positive_delay_resolved_immediately(self):
+        async def run():
+            return get_pacer().sleep(0).done()
+
+        self.assertTrue(asyncio.run(run()))
+
+    def test_cancelled_sleep_does_not_break_timer(self):
+        async def run():
+            pacer = get_pacer()
+            cancelled = asyncio.ensure_future(pacer.sleep(0.01))
+            cancelled.cancel()
+            await pacer.sleep(0.02)
+            return pacer.pending
+
+        self.assertEqual(asyncio.run(run()), 0)
+
+    def test_pacer_per_event_loop(self):
+        loop = asyncio.new_event_loop()
+        try:
+            self.assertIs(get_pacer(loop), get_pacer(loop))
+            self.assertIsInstance(get_pacer(loop), Pacer)
+        finally:
+            loop.close()
@@ -0,0 +1,55 @@
+import time
+import asyncio
+import unittest
+
+from src.prefetch import PrefetchRead
+from src.prefetch import run_prefetch
+
+
+class TestPrefetch(unittest.TestCase):
+    @staticmethod
+    def make_read(name: str, value, delay_sec: float = 0.1, **kwargs) -> PrefetchRead:
+        async def fetch():
+            await asyncio.sleep(delay_sec)
+            if isinstance(value, Exception):
+                raise value
+
+            return value
+
+        return PrefetchRead(name=name, fetch=fetch, **kwargs)
+
+    def test_reads_run_concurrently(self):
+        reads = [self.make_read(name=f"balance_{index}", value=index) for index in range(5)]
+
+        started_at = time.monotonic()
+        result = asyncio.run(run_prefetch(reads))
+
+        self.assertLess(time.monotonic() - started_at, 0.3)
+        self.assertTrue(result.is_ok)
+        self.assertEqual(result.get("balance_3"), 3)
+
+    def test_errors_aggregated(self):
+        reads = [
+            self.make_read(name="balance_x", value=10),
+            self.make_read(name="decimals_x", value=18, delay_sec=1, timeout_sec=0.05),
+            self.make_read(name="quote", value=ValueError("no route"), required=False),
+        ]
+
+        result = asyncio.run(run_prefetch(reads))
+
+        self.assertFalse(result.is_ok)
+        self.assertEqual(result.get("balance_x"), 10)
+        self.assertIsNone(result.get("decimals_x"))
+        self.assertIsInstance(result.errors["decimals_x"], asyncio.TimeoutError)
+        self.assertEqual(result.get_error_message(), "decimals_x: TimeoutError, quote: no route")
+
+    def test_optional_read_failure(self):
+        reads = [
+            self.make_read(name="balance_x", value=10),
+            self.make_read(name="allowance_x", value=ValueError("reverted"), required=False),
+        ]
+
+        result = asyncio.run(run_prefetch(reads))
+
+        self.assertTrue(result.is_ok)
+        self.assertIn("allowance_x", result.errors)
@@ -0,0 +1,62 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from src.schemas.app_config import AppConfigSchema
+from src.schemas.proxy_data import ProxyData
+from src.storage import Storage
+from src.proxy_health import ProxyHealthCache
+
+
+class TestProxyHealthCache(unittest.TestCase):
+    def setUp(self):
+        Storage().update_app_config(AppConfigSchema(use_proxy=True))
+
+        self.proxy_health_cache = ProxyHealthCache()
+        self.proxy_health_cache._verdicts = {}
+        self.proxy_health_cache._checks = {}
+
+        self.proxy_data = ProxyData(host="127.0.0.1", port=8080, proxy_type="http")
+
+        self.get_ip_calls = 0
+        self.ips = ["1.1.1.1"]
+
+        async def get_ip(_):
+            self.get_ip_calls += 1
+            await asyncio.sleep(0.01)
+            return self.ips[-1]
+
+        patcher = mock.patch("src.proxy_manager.ProxyManager.get_ip", get_ip)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_concurrent_checks_deduplicated(self):
+        async def run():
+            return await asyncio.gather(*[self.proxy_health_cache.verify(self.proxy_data) for _ in range(5)])
+
+        verdicts = asyncio.run(run())
+
+        self.assertEqual({verdict.ip for verdict in verdicts}, {"1.1.1.1"})
+        self.assertEqual(self.get_ip_calls, 1)
+
+    def test_verdict_served_from_cache(self):
+        self.assertIsNone(self.proxy_health_cache.get_verdict(self.proxy_data))
+
+        verdict = asyncio.run(self.proxy_health_cache.verify(self.proxy_data))
+
+        self.assertIs(self.proxy_health_cache.get_verdict(self.proxy_data), verdict)
+        self.assertEqual(self.get_ip_calls, 1)
+
+    def test_stale_verdict_revalidated_in_background(self):
+        asyncio.run(self.proxy_health_cache.verify(self.proxy_data))
+        self.ips.append(None)
+
+        with mock.patch("config.PROXY_CHECK_TTL_SEC", 0):
+            stale_verdict = self.proxy_health_cache.get_verdict(self.proxy_data)
+            new_verdict = asyncio.run(self.proxy_health_cache.revalidate(self.proxy_data))
+
+        self.assertEqual(stale_verdict.ip, "1.1.1.1")
+        self.assertFalse(new_verdict.is_valid)
+        self.assertIs(self.proxy_health_cache.get_verdict(self.proxy_data), new_verdict)
+        self.assertEqual(self.get_ip_calls, 2)
+
@@ -0,0 +1,80 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from src.quote_engine import QuoteEngine
+from src.quote_engine import get_sorted_reserves
+from src.quote_engine import get_amount_out_constant_product
+from modules.sithswap.math import get_amount_out as get_sith_amount_out
+from modules.sithswap.math import FEE_PROBE_AMOUNT
+
+
+class FakeClient:
+    def __init__(self, block_number: int):
+        self.block_number = block_number
+        self.block_reads = 0
+
+    async def get_block_number(self):
+        self.block_reads += 1
+        await asyncio.sleep(0.01)
+        return self.block_number
+
+
+class TestQuoteEngine(unittest.TestCase):
+    def setUp(self):
+        self.engine = QuoteEngine()
+        self.engine.invalidate()
+        self.engine._block_number = None
+        self.engine._block_checked_at = 0
+
+        self.client = FakeClient(block_number=100)
+        self.reserves_reads = 0
+
+    async def fetch_reserves(self):
+        self.reserves_reads += 1
+        await asyncio.sleep(0.01)
+        return self.reserves_reads, 10 ** 18, 2 * 10 ** 18
+
+    def get_reserves(self, amount: int = 1) -> list:
+        async def get():
+            return await asyncio.gather(*[
+                self.engine.get_reserves(pool_key=("dex", 0x1), client=self.client, fetch=self.fetch_reserves)
+                for _ in range(amount)
+            ])
+
+        return asyncio.run(get())
+
+    def test_reserves_read_once_per_block(self):
+        reserves = self.get_reserves(amount=50)
+
+        self.assertEqual(len(set(reserves)), 1)
+        self.assertEqual(self.reserves_reads, 1)
+        self.assertEqual(self.client.block_reads, 1)
+
+        self.get_reserves()
+        self.assertEqual(self.reserves_reads, 1)
+
+        with mock.patch("config.QUOTE_BLOCK_CHECK_INTERVAL_SEC", 0):
+            self.get_reserves()
+            self.assertEqual(self.reserves_reads, 1)
+
+            self.client.block_number = 101
+            self.get_reserves()
+            self.assertEqual(self.reserves_reads, 2)
+
+    def test_constant_product_amount_out(self):
+        reserve_in, reserve_out = get_sorted_reserves(token_in=0x2, token0=0x1, reserve0=4000, reserve1=10 ** 6)
+        self.assertEqual((reserve_in, reserve_out), (10 ** 6, 4000))
+
+        amount_out = get_amount_out_constant_product(amount_in=10 ** 4, reserve_in=reserve_in, reserve_out=reserve_out)
+        self.assertEqual(amount_out, 10 ** 4 * 997 * 4000 // (10 ** 6 * 1000 + 10 ** 4 * 997))
+        self.assertEqual(get_amount_out_constant_product(amount_in=1, reserve_in=0, reserve_out=4000), 0)
+
+    def test_sith_amount_out(self):
+        fee = FEE_PROBE_AMOUNT * 3 // 1000
+        volatile_amount_out = get_sith_amount_out(10 ** 6, 10 ** 12, 10 ** 12, fee, False, 6, 6)
+        self.assertEqual(volatile_amount_out, 997000 * 10 ** 12 // (10 ** 12 + 997000))
+
+        # Stable curve keeps price close to 1:1 for balanced pool of tokens with different decimals
+        stable_amount_out = get_sith_amount_out(10 ** 18, 10 ** 24, 10 ** 12, 0, True, 18, 6)
+        self.assertAlmostEqual(stable_amount_out, 10 ** 6, delta=1)
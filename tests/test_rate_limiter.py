@@ -0,0 +1,59 @@
+import asyncio
+import time
+import unittest
+
+from src.rate_limiter import TokenBucket
+from src.rate_limiter import RateLimiter
+
+import config
+
+
+class TestTokenBucket(unittest.TestCase):
+    def test_burst_is_not_delayed(self):
+        bucket = TokenBucket(rate=1, burst=3)
+
+        delays = [bucket.reserve() for _ in range(3)]
+        self.assertEqual(delays, [0, 0, 0])
+
+    def test_requests_over_burst_are_queued(self):
+        bucket = TokenBucket(rate=10, burst=1)
+
+        delays = [bucket.reserve() for _ in range(4)]
+        self.assertEqual(delays[0], 0)
+        for queue_position, delay in enumerate(delays[1:], start=1):
+            self.assertAlmostEqual(delay, queue_position / 10, delta=0.01)
+
+    def test_acquire_waits_for_token(self):
+        bucket = TokenBucket(rate=20, burst=1)
+
+        async def run():
+            started_at = time.monotonic()
+            for _ in range(3):
+                await bucket.acquire()
+            return time.monotonic() - started_at
+
+        self.assertGreaterEqual(asyncio.run(run()), 0.09)
+
+
+class TestRateLimiter(unittest.TestCase):
+    def tearDown(self):
+        RateLimiter().set_rate_share(1)
+
+    def test_bucket_per_host(self):
+        rate_limiter = RateLimiter()
+
+        rpc_bucket = rate_limiter.get_bucket("rpc.example.com")
+        self.assertIs(rpc_bucket, rate_limiter.get_bucket("rpc.example.com"))
+        self.assertIsNot(rpc_bucket, rate_limiter.get_bucket("api.coingecko.com"))
+
+        self.assertEqual(
+            rate_limiter.get_bucket("api.coingecko.com").rate,
+            config.HOSTS_RATE_LIMITS["api.coingecko.com"][0]
+        )
+
+    def test_rate_share(self):
+        rate_limiter = RateLimiter()
+        rate_limiter.set_rate_share(0.5)
+
+        rps, _ = config.HOSTS_RATE_LIMITS["api.coingecko.com"]
+        self.assertEqual(rate_limiter.get_bucket("api.coingecko.com").rate, rps * 0.5)
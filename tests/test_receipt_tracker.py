@@ -0,0 +1,133 @@
+import sys
+import time
+import asyncio
+import unittest
+import threading as th
+import multiprocessing as mp
+from unittest import mock
+
+from starknet_py.net.client_models import TransactionReceipt
+from starknet_py.net.client_models import TransactionExecutionStatus
+from starknet_py.net.client_models import TransactionFinalityStatus
+
+from src.receipt_tracker import ReceiptTracker
+from src.receipt_tracker import worker_slot_var
+
+
+class TestReceiptTracker(unittest.TestCase):
+    def setUp(self):
+        self.receipt_tracker = ReceiptTracker()
+
+        self.polls = 0
+        self.accepted_after_polls = 2
+
+        self.receipt_clients = {}
+
+        async def poll():
+            self.polls += 1
+            await original_poll()
+
+        async def fetch_receipt(client, tx_hash):
+            self.receipt_clients[tx_hash] = client
+
+            if tx_hash == 0xdead or self.polls < self.accepted_after_polls:
+                return None
+
+            return TransactionReceipt(
+                transaction_hash=tx_hash,
+                execution_status=TransactionExecutionStatus.SUCCEEDED,
+                finality_status=TransactionFinalityStatus.ACCEPTED_ON_L2,
+            )
+
+        original_poll = self.receipt_tracker.poll
+        patchers = [
+            mock.patch.object(self.receipt_tracker, "poll", poll),
+            mock.patch.object(self.receipt_tracker, "fetch_receipt", fetch_receipt),
+            mock.patch.object(self.receipt_tracker, "get_client", lambda transport_key: transport_key),
+            mock.patch("config.RECEIPT_POLL_INTERVAL_SEC", 0.01),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.addCleanup(self.wait_for_polling_stop)
+
+    def wait_for_polling_stop(self):
+        polling_thread = self.receipt_tracker._polling_thread
+        if polling_thread is not None:
+            polling_thread.join(timeout=1)
+
+    def test_pending_transactions_share_polls(self):
+        async def run():
+            return await asyncio.gather(*[
+                self.receipt_tracker.wait_for_receipt(tx_hash=tx_hash, timeout_sec=5) for tx_hash in range(1, 101)
+            ])
+
+        receipts = asyncio.run(run())
+
+        self.assertEqual([receipt.transaction_hash for receipt in receipts], list(range(1, 101)))
+        self.assertEqual(self.polls, 2)
+        self.assertEqual(self.receipt_tracker.pending_amount, 0)
+
+    def test_timeout(self):
+        receipt = asyncio.run(self.receipt_tracker.wait_for_receipt(tx_hash=0xdead, timeout_sec=0.05))
+
+        self.assertIsNone(receipt)
+        self.assertEqual(self.receipt_tracker.pending_amount, 0)
+
+    def test_worker_slot_released_while_waiting(self):
+        async def run():
+            worker_slot = asyncio.Semaphore(1)
+            await worker_slot.acquire()
+            worker_slot_var.set(worker_slot)
+
+            receipt_waiter = asyncio.create_task(self.receipt_tracker.wait_for_receipt(tx_hash=1, timeout_sec=5))
+            await asyncio.wait_for(worker_slot.acquire(), timeout=1)
+            worker_slot.release()
+
+            await receipt_waiter
+            return worker_slot.locked()
+
+        self.assertTrue(asyncio.run(run()))
+
+    def test_receipts_fetched_through_wallet_proxy(self):
+        proxy_key = ("http", "http://127.0.0.1:8080")
+
+        async def run():
+            return await asyncio.gather(
+                self.receipt_tracker.wait_for_receipt(tx_hash=1, timeout_sec=5),
+                self.receipt_tracker.wait_for_receipt(tx_hash=2, timeout_sec=5, transport_key=proxy_key),
+            )
+
+        asyncio.run(run())
+
+        self.assertEqual(self.receipt_clients, {1: (None, None), 2: proxy_key})
+
+    def test_rejected_receipt(self):
+        rejected_receipt = TransactionReceipt(transaction_hash=1, execution_status=TransactionExecutionStatus.REJECTED)
+        reverted_receipt = TransactionReceipt(transaction_hash=2, execution_status=TransactionExecutionStatus.REVERTED)
+
+        self.assertTrue(self.receipt_tracker.is_rejected(rejected_receipt))
+        self.assertFalse(self.receipt_tracker.is_rejected(reverted_receipt))
+        self.assertEqual(self.receipt_tracker.get_failure_reason(reverted_receipt), "reverted")
+
+    @unittest.skipUnless(sys.platform.startswith("linux"), "fork start method is used on linux")
+    def test_polling_in_forked_process(self):
+        pending_waiter = th.Thread(
+            target=lambda: asyncio.run(self.receipt_tracker.wait_for_receipt(tx_hash=0xdead, timeout_sec=0.5))
+        )
+        pending_waiter.start()
+        time.sleep(0.05)
+
+        results = mp.get_context("fork").Queue()
+        process = mp.get_context("fork").Process(
+            target=lambda: results.put(
+                asyncio.run(self.receipt_tracker.wait_for_receipt(tx_hash=1, timeout_sec=5)).transaction_hash
+            ),
+            daemon=True,
+        )
+        process.start()
+        process.join(timeout=5)
+        pending_waiter.join()
+
+        self.assertEqual(results.get(timeout=1), 1)
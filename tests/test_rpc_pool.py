@@ -0,0 +1,146 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from starknet_py.net.client_errors import ClientError
+
+from src.schemas.app_config import AppConfigSchema
+from src.storage import Storage
+from src.rpc_pool import RpcPool
+
+
+class TestRpcPool(unittest.TestCase):
+    def setUp(self):
+        Storage().update_app_config(AppConfigSchema(
+            rpc_url="https://main.rpc",
+            extra_rpc_urls="https://fast.rpc, https://slow.rpc",
+        ))
+
+        self.pool = RpcPool()
+        self.pool.endpoints = []
+        self.pool.update_endpoints()
+
+        probing_patcher = mock.patch.object(RpcPool, "start_probing")
+        probing_patcher.start()
+        self.addCleanup(probing_patcher.stop)
+
+        self.main, self.fast, self.slow = self.pool.endpoints
+        self.main.report_success(0.3)
+        self.fast.report_success(0.1)
+        self.slow.report_success(0.5)
+
+    def tearDown(self):
+        self.pool.endpoints = []
+
+    def test_reads_routed_by_latency(self):
+        endpoints = self.pool.get_endpoints("call")
+        self.assertEqual(endpoints, [self.fast, self.main, self.slow])
+
+    def test_writes_pinned_to_main_rpc(self):
+        endpoints = self.pool.get_endpoints("addInvokeTransaction")
+        self.assertEqual(endpoints[0], self.main)
+
+    def test_unhealthy_endpoint_moved_last(self):
+        for _ in range(3):
+            self.fast.report_failure()
+
+        endpoints = self.pool.get_endpoints("call")
+        self.assertEqual(endpoints[-1], self.fast)
+
+    def test_failover_on_server_error(self):
+        requested_urls = []
+
+        async def request(http_method, address, payload, params=None):
+            requested_urls.append(address)
+            if address == self.fast.url:
+                raise ClientError(code="503", message="Service Unavailable")
+
+            return {"result": "0x1"}
+
+        client = self.pool.get_client()
+
+        with mock.patch.object(client._client, "request", side_effect=request):
+            result = asyncio.run(client._client.call("blockNumber", {}))
+
+        self.assertEqual(result, "0x1")
+        self.assertEqual(requested_urls, [self.fast.url, self.main.url])
+        self.assertEqual(self.fast.failures, 1)
+
+    def test_client_error_not_retried(self):
+        async def request(http_method, address, payload, params=None):
+            raise ClientError(code="400", message="Bad Request")
+
+        client = self.pool.get_client()
+
+        with mock.patch.object(client._client, "request", side_effect=request):
+            with self.assertRaises(ClientError):
+                asyncio.run(client._client.call("blockNumber", {}))
+
+    def test_concurrent_reads_sent_as_batch(self):
+        payloads = []
+
+        async def request(http_method, address, payload, params=None):
+            payloads.append(payload)
+            return [
+                {"id": 2, "result": "0x3"},
+                {"id": 1, "error": {"code": 20, "message": "Contract not found"}},
+                {"id": 0, "result": ["0x1"]},
+            ]
+
+        async def read_burst(client):
+            return await asyncio.gather(
+                client.call("call", {"request": "balanceOf"}),
+                client.call("getClassHashAt", {"contract_address": "0x1"}),
+                client.call("call", {"request": "decimals"}),
+                return_exceptions=True,
+            )
+
+        client = self.pool.get_client()
+
+        with mock.patch.object(client._client, "request", side_effect=request):
+            balance, class_hash, decimals = asyncio.run(read_burst(client._client))
+
+        self.assertEqual(len(payloads), 1)
+        self.assertEqual([item["method"] for item in payloads[0]], [
+            "starknet_call",
+            "starknet_getClassHashAt",
+            "starknet_call",
+        ])
+        self.assertEqual(balance, ["0x1"])
+        self.assertIsInstance(class_hash, ClientError)
+        self.assertEqual(decimals, "0x3")
+
+    def test_rejected_batch_sent_one_by_one(self):
+        payloads = []
+
+        async def request(http_method, address, payload, params=None):
+            payloads.append(payload)
+            if isinstance(payload, list):
+                raise ClientError(code="405", message="Batch requests are not supported")
+            return {"result": payload["params"]["contract_address"]}
+
+        async def read_burst(client):
+            return await asyncio.gather(
+                client.call("getClassHashAt", {"contract_address": "0x1"}),
+                client.call("getClassHashAt", {"contract_address": "0x2"}),
+            )
+
+        client = self.pool.get_client()
+
+        with mock.patch.object(client._client, "request", side_effect=request):
+            results = asyncio.run(read_burst(client._client))
+
+        self.assertEqual(results, ["0x1", "0x2"])
+        self.assertEqual(len(payloads), 3)
+
+    def test_single_read_not_batched(self):
+        async def request(http_method, address, payload, params=None):
+            self.assertIsInstance(payload, dict)
+            return {"result": "0x1"}
+
+        client = self.pool.get_client()
+
+        with mock.patch.object(client._client, "request", side_effect=request):
+            result = asyncio.run(client._client.call("getNonce", {}))
+
+        self.assertEqual(result, "0x1")
@@ -0,0 +1,202 @@
+import time
+import threading as th
+import asyncio
+import unittest
+from unittest import mock
+
+from src.schemas.app_config import AppConfigSchema
+from src.storage import Storage
+from src.tasks_executor.sharded import split_into_shards
+from src.tasks_executor.scheduler import TaskExecutorScheduler
+from src.tasks_executor.event_manager import TaskExecEventManager
+from src.tasks_executor.batch_multithread import WalletSlots
+from src import enums
+
+
+class TestSplitIntoShards(unittest.TestCase):
+    def test_wallets_interleaved_between_shards(self):
+        shards = split_into_shards(list(range(7)), shards_num=3)
+        self.assertEqual(shards, [[0, 3, 6], [1, 4], [2, 5]])
+
+    def test_shards_amount_limited_by_wallets_amount(self):
+        shards = split_into_shards(list(range(2)), shards_num=8)
+        self.assertEqual(shards, [[0], [1]])
+
+    def test_single_shard(self):
+        shards = split_into_shards(list(range(3)), shards_num=1)
+        self.assertEqual(shards, [[0, 1, 2]])
+
+
+class FakeTask:
+    def __init__(self, name: str):
+        self.name = name
+        self.task_status = enums.TaskStatus.CREATED
+
+    def copy(self):
+        return FakeTask(self.name)
+
+
+class FakeWallet(str):
+    proxy = None
+
+    @property
+    def name(self) -> str:
+        return str(self)
+
+
+class TestTaskExecutorScheduler(unittest.TestCase):
+    def setUp(self):
+        Storage().update_app_config(AppConfigSchema(wallets_concurrency_limit=2))
+
+        self.executor = TaskExecutorScheduler()
+        self.executor.event_manager = mock.MagicMock()
+
+        self.processed = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        async def process_task(task, wallet):
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            self.processed.append((wallet, task.name))
+
+            await asyncio.sleep(0.01)
+
+            self.in_flight -= 1
+            task.task_status = enums.TaskStatus.SUCCESS
+
+        self.executor.process_task = process_task
+        self.proxy_verdicts = {}
+
+    def run_scheduler(self, wallets: list, tasks: list):
+        proxy_health_cache = mock.MagicMock()
+        proxy_health_cache.get_verdict.side_effect = lambda proxy: self.proxy_verdicts.get(proxy)
+
+        with mock.patch("config.DEFAULT_DELAY_SEC", 0.005), \
+                mock.patch("config.PROXY_DEFER_SEC", 0.02), \
+                mock.patch("utils.task.get_time_to_sleep", return_value=0.05), \
+                mock.patch("src.tasks_executor.scheduler.ProxyHealthCache", return_value=proxy_health_cache):
+            asyncio.run(self.executor.process_wallets(wallets=wallets, tasks=tasks))
+
+    def test_tasks_dispatched_by_ready_time(self):
+        self.run_scheduler(wallets=[FakeWallet("w1"), FakeWallet("w2"), FakeWallet("w3")], tasks=[FakeTask("t1"), FakeTask("t2")])
+
+        self.assertEqual(
+            self.processed,
+            [("w1", "t1"), ("w2", "t1"), ("w3", "t1"), ("w1", "t2"), ("w2", "t2"), ("w3", "t2")]
+        )
+        self.assertEqual(self.executor.execution_summary.wallets_processed, 3)
+        self.assertEqual(self.executor.execution_summary.tasks_succeeded, 6)
+
+    def test_wallet_with_failed_proxy_deferred(self):
+        wallets = [mock.MagicMock(proxy="p1"), mock.MagicMock(proxy="p2")]
+        self.proxy_verdicts["p1"] = mock.MagicMock(is_valid=False)
+
+        with mock.patch("config.PROXY_MAX_DEFERRALS", 1):
+            self.run_scheduler(wallets=wallets, tasks=[FakeTask("t1")])
+
+        self.assertEqual(self.processed, [(wallets[1], "t1"), (wallets[0], "t1")])
+        self.assertEqual(self.executor.execution_summary.wallets_processed, 2)
+
+    def test_worker_pool_is_bounded(self):
+        self.run_scheduler(wallets=[FakeWallet(i) for i in range(10)], tasks=[FakeTask("t1")])
+
+        self.assertEqual(len(self.processed), 10)
+        self.assertLessEqual(self.max_in_flight, 2)
+
+    def test_wallet_without_eth_reported(self):
+        Storage().update_app_config(AppConfigSchema(wallets_concurrency_limit=2, check_balances_before_run=True))
+        wallets = [FakeWallet("w1"), FakeWallet("w2")]
+
+        balance_snapshot = mock.MagicMock()
+        balance_snapshot.sort_wallets.return_value = ([wallets[0]], [wallets[1]])
+        balance_scanner = mock.MagicMock()
+        balance_scanner.scan = mock.AsyncMock(return_value=balance_snapshot)
+
+        with mock.patch("src.tasks_executor.scheduler.BalanceScanner", return_value=balance_scanner):
+            self.run_scheduler(wallets=wallets, tasks=[FakeTask("t1"), FakeTask("t2")])
+
+        self.assertEqual(self.processed, [("w1", "t1"), ("w1", "t2")])
+        self.assertEqual(self.executor.execution_summary.wallets_processed, 2)
+        self.assertEqual(self.executor.execution_summary.tasks_failed, 2)
+        self.executor.event_manager.set_wallet_completed.assert_any_call(wallets[1])
+
+
+class TestTaskExecEventManager(unittest.TestCase):
+    def setUp(self):
+        self.event_manager = TaskExecEventManager()
+
+        self.batches = []
+        self.started_wallets = []
+
+        self.event_manager.on_wallet_started(self.started_wallets.append)
+        self.event_manager.on_events_batch(self.batches.append)
+
+    def tearDown(self):
+        self.event_manager.stop()
+        self.event_manager.listening_thread.join(timeout=1)
+
+    def wait_for_wallets(self, amount: int, timeout: float = 2):
+        deadline = time.monotonic() + timeout
+        while len(self.started_wallets) < amount and time.monotonic() < deadline:
+            time.sleep(0.005)
+
+    def test_events_dispatched_in_order(self):
+        self.event_manager.start()
+
+        for wallet_index in range(20):
+            self.event_manager.set_wallet_started(wallet_index)
+
+        self.wait_for_wallets(20)
+        self.assertEqual(self.started_wallets, list(range(20)))
+
+    def test_coalescing_dispatches_single_batch(self):
+        self.event_manager.set_coalescing(0.2)
+        self.event_manager.start()
+
+        for wallet_index in range(50):
+            self.event_manager.set_wallet_started(wallet_index)
+
+        self.wait_for_wallets(50)
+        self.assertEqual(len(self.batches), 1)
+        self.assertEqual(len(self.batches[0]), 50)
+
+    def test_stop_wakes_listening_thread(self):
+        self.event_manager.start()
+        self.event_manager.stop()
+
+        self.event_manager.listening_thread.join(timeout=1)
+        self.assertFalse(self.event_manager.listening_thread.is_alive())
+
+
+class TestWalletSlots(unittest.TestCase):
+    def test_waiter_takes_slot_as_soon_as_released(self):
+        slots = WalletSlots(slots_num=1)
+        slots.acquire()
+
+        acquired = th.Event()
+
+        def waiter():
+            slots.acquire()
+            acquired.set()
+
+        waiter_thread = th.Thread(target=waiter)
+        waiter_thread.start()
+
+        self.assertFalse(acquired.wait(timeout=0.05))
+
+        slots.release()
+        self.assertTrue(acquired.wait(timeout=1))
+
+        waiter_thread.join()
+        slots.release()
+        slots.wait_all()
+        self.assertEqual(slots.busy, 0)
+
+    def test_utilization(self):
+        slots = WalletSlots(slots_num=2)
+        slots.acquire()
+        time.sleep(0.05)
+        slots.release()
+
+        self.assertAlmostEqual(slots.utilization, 0.5, delta=0.1)
@@ -0,0 +1,53 @@
+import copy
+import unittest
+from unittest import mock
+
+from contracts.tokens.main import Tokens
+from src.templates._tokens_template import TOKENS_DATA
+
+
+class TestTokens(unittest.TestCase):
+    def setUp(self):
+        self.tokens_data = copy.deepcopy(TOKENS_DATA)
+
+        patchers = [
+            mock.patch(
+                "utils.file_manager.FileManager.read_data_from_json_file",
+                side_effect=lambda file_path: self.tokens_data,
+            ),
+            mock.patch("contracts.tokens.main.Tokens._get_token_abi", return_value=[]),
+        ]
+        for patcher in patchers:
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.tokens = Tokens()
+        self.tokens.update_tokens_data()
+
+    def test_shared_instance(self):
+        self.assertIs(Tokens(), self.tokens)
+
+    def test_lookups(self):
+        eth = self.tokens.get_by_name("ETH")
+        eth_address = "0x049D36570D4E46F48E99674BD3FCC84644DDD6B96F7C741B1562B82F9E004DC7"
+
+        self.assertEqual(eth.symbol, "eth")
+        self.assertEqual(self.tokens.get_cg_id_by_name("eth"), "ethereum")
+        self.assertIs(self.tokens.get_by_contract_address(eth_address), eth)
+        self.assertIn(eth, self.tokens.get_tokens_by_protocol("JediSwap"))
+        self.assertIsNone(self.tokens.get_by_name("unknown"))
+        self.assertIsNone(self.tokens.get_by_contract_address("0x1"))
+
+    def test_reload(self):
+        self.tokens_data[0]["custom"] = [{
+            "symbol": "new",
+            "contract_address": "0x1",
+            "available_protocols": ["jediswap"],
+        }]
+
+        self.assertIsNone(self.tokens.get_by_name("new"))
+
+        self.tokens.update_tokens_data()
+
+        self.assertEqual(self.tokens.get_by_contract_address("0x01").symbol, "new")
+        self.assertEqual(self.tokens.get_tokens_by_protocol("jediswap")[-1].symbol, "new")
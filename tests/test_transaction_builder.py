@@ -0,0 +1,104 @@
+import asyncio
+import unittest
+import threading
+from dataclasses import dataclass
+from types import SimpleNamespace
+
+from src.nonce_manager import NonceManager
+from src.transaction_builder import InvokeTransactionBuilder
+import config
+
+
+class FakeClient:
+    def __init__(self, chain_nonce: int, overall_fee: int):
+        self.chain_nonce = chain_nonce
+        self.overall_fee = overall_fee
+        self.estimated = []
+        self.sent = []
+
+    async def get_contract_nonce(self, contract_address, block_number=None):
+        return self.chain_nonce
+
+    async def estimate_fee(self, tx):
+        self.estimated.append(tx)
+        return SimpleNamespace(overall_fee=self.overall_fee)
+
+    async def send_transaction(self, transaction):
+        self.sent.append(transaction)
+        return SimpleNamespace(transaction_hash=len(self.sent))
+
+
+@dataclass(frozen=True)
+class FakeInvoke:
+    calls: list
+    nonce: int
+    max_fee: int
+    signature: list
+
+
+class FakeSigner:
+    def __init__(self):
+        self.signing_threads = []
+
+    def sign_transaction(self, transaction: FakeInvoke) -> list:
+        self.signing_threads.append(threading.current_thread().name)
+        return [transaction.nonce, transaction.max_fee]
+
+
+class FakeAccount:
+    def __init__(self, client: FakeClient):
+        self.address = 0x1
+        self.client = client
+        self.signer = FakeSigner()
+        self.signed = []
+
+    async def _prepare_invoke(self, calls, *, nonce=None, max_fee=None, cairo_version=0):
+        transaction = FakeInvoke(calls=calls, nonce=nonce, max_fee=max_fee, signature=[])
+        self.signed.append(transaction)
+        return transaction
+
+
+class TestInvokeTransactionBuilder(unittest.TestCase):
+    def setUp(self):
+        self.client = FakeClient(chain_nonce=3, overall_fee=1000)
+        self.account = FakeAccount(client=self.client)
+
+    def get_builder(self, max_fee=None) -> InvokeTransactionBuilder:
+        return InvokeTransactionBuilder(
+            account=self.account,
+            calls=[],
+            cairo_version=1,
+            max_fee=max_fee,
+            nonce_manager=NonceManager(address=self.account.address),
+        )
+
+    def test_estimated_fee_reused(self):
+        builder = self.get_builder()
+
+        async def estimate_and_send():
+            await builder.estimate_fee()
+            return await builder.send()
+
+        asyncio.run(estimate_and_send())
+
+        self.assertEqual(len(self.client.estimated), 1)
+        self.assertEqual(len(self.account.signed), 2)
+        self.assertEqual(self.account.signed[0].max_fee, 0)
+        self.assertEqual(self.client.sent[0].max_fee, int(1000 * config.TXN_FEE_ESTIMATE_MULTIPLIER))
+        self.assertEqual(self.client.sent[0].nonce, 3)
+        self.assertEqual(self.client.sent[0].signature, [3, self.client.sent[0].max_fee])
+        self.assertTrue(all(name.startswith("txn_signing") for name in self.account.signer.signing_threads))
+
+    def test_forced_fee_signed_once(self):
+        builder = self.get_builder(max_fee=5000)
+
+        async def estimate_and_send():
+            await builder.estimate_fee()
+            return await builder.send()
+
+        asyncio.run(estimate_and_send())
+
+        self.assertEqual(len(self.client.estimated), 1)
+        self.assertEqual(len(self.account.signed), 1)
+        self.assertIs(self.client.sent[0], builder.estimate_transaction)
+        self.assertEqual(self.client.sent[0].max_fee, 5000)
@@ -0,0 +1,125 @@
+import asyncio
+import unittest
+import contextvars
+from unittest import mock
+
+from src.transaction_pipeline import TransactionPipeline
+
+
+wallet_var: contextvars.ContextVar = contextvars.ContextVar("wallet", default=None)
+
+
+class FakeTransactionBuilder:
+    def __init__(self, nonce: int):
+        self.nonce = nonce
+        self.nonce_manager = None
+        self.max_fee = None
+
+    @property
+    def is_estimation_required(self) -> bool:
+        return self.max_fee is None
+
+    async def reserve_nonce(self) -> int:
+        return self.nonce
+
+    async def sign_for_estimation(self, nonce: int):
+        pass
+
+    async def estimate_fee(self) -> int:
+        await asyncio.sleep(0.01)
+        self.max_fee = 1000
+        return self.max_fee
+
+    async def sign_final(self, nonce: int):
+        pass
+
+    async def submit(self) -> int:
+        return self.nonce
+
+
+class TestTransactionPipeline(unittest.TestCase):
+    def setUp(self):
+        self.pipeline = TransactionPipeline()
+        self.running = {"sign": 0, "estimate": 0}
+        self.max_running = {"sign": 0, "estimate": 0}
+
+    def get_step(self, stage_name: str, result, delay_sec: float = 0.01):
+        async def step():
+            self.running[stage_name] += 1
+            self.max_running[stage_name] = max(self.max_running[stage_name], self.running[stage_name])
+            await asyncio.sleep(delay_sec)
+            self.running[stage_name] -= 1
+
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        return stage_name, step
+
+    @mock.patch("config.PIPELINE_SIGN_WORKERS", 2)
+    @mock.patch("config.PIPELINE_ESTIMATE_WORKERS", 8)
+    def test_stage_concurrency(self):
+        async def run_jobs():
+            return await asyncio.gather(*[
+                self.pipeline.run([self.get_step("sign", None), self.get_step("estimate", i, delay_sec=0.05)])
+                for i in range(10)
+            ])
+
+        self.assertEqual(asyncio.run(run_jobs()), list(range(10)))
+        self.assertEqual(self.max_running["sign"], 2)
+        self.assertGreater(self.max_running["estimate"], 2)
+
+    def test_step_error(self):
+        async def run_job():
+            return await self.pipeline.run([
+                self.get_step("sign", ValueError("sign failed")),
+                self.get_step("estimate", 1),
+            ])
+
+        with self.assertRaises(ValueError):
+            asyncio.run(run_job())
+
+        self.assertEqual(self.max_running["estimate"], 0)
+
+    def test_queue_depths(self):
+        async def get_depths():
+            jobs = [
+                asyncio.create_task(self.pipeline.run([self.get_step("sign", None)]))
+                for _ in range(5)
+            ]
+            await asyncio.sleep(0.005)
+            depths = self.pipeline.get_queue_depths()
+            await asyncio.gather(*jobs)
+            return depths
+
+        queue_depths = asyncio.run(get_depths())
+
+        self.assertEqual(queue_depths["sign"], 5 - 2)
+        self.assertEqual(queue_depths["estimate"], 0)
+        self.assertIn("confirm", queue_depths)
+
+    def test_steps_run_in_job_context(self):
+        async def get_wallet():
+            await asyncio.sleep(0.01)
+            return wallet_var.get()
+
+        async def run_job(wallet: str):
+            wallet_var.set(wallet)
+            return await self.pipeline.run([("sign", get_wallet), ("estimate", get_wallet)])
+
+        async def run_jobs():
+            return await asyncio.gather(*[run_job(f"wallet_{i}") for i in range(5)])
+
+        self.assertEqual(asyncio.run(run_jobs()), [f"wallet_{i}" for i in range(5)])
+
+    @mock.patch("config.PIPELINE_SIGN_WORKERS", 1)
+    @mock.patch("config.PIPELINE_ESTIMATE_WORKERS", 1)
+    @mock.patch("config.PIPELINE_QUEUE_SIZE", 1)
+    def test_submit_with_full_queues(self):
+        async def submit_all():
+            return await asyncio.wait_for(
+                asyncio.gather(*[self.pipeline.submit(FakeTransactionBuilder(nonce=i)) for i in range(20)]),
+                timeout=5,
+            )
+
+        self.assertEqual(asyncio.run(submit_all()), list(range(20)))
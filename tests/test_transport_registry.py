@@ -0,0 +1,69 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from src.transport_registry import TransportRegistry
+from src.rpc_pool import RpcPool
+
+
+class TestTransportRegistry(unittest.TestCase):
+    def test_session_reused_per_proxy(self):
+        async def run():
+            registry = TransportRegistry()
+
+            direct_session = registry.get_session()
+            proxy_session = registry.get_session(proxy_type="http", proxy_url="http://127.0.0.1:8080")
+
+            self.assertIs(direct_session, registry.get_session())
+            self.assertIsNot(direct_session, proxy_session)
+            self.assertEqual(proxy_session.proxy, "http://127.0.0.1:8080")
+
+            await registry.close_sessions()
+            return direct_session, proxy_session
+
+        sessions = asyncio.run(run())
+        self.assertTrue(all(session.closed for session in sessions))
+
+    def test_sessions_separated_by_loop(self):
+        async def get_session():
+            session = TransportRegistry().get_session()
+            await TransportRegistry().close_sessions()
+            return session
+
+        self.assertIsNot(asyncio.run(get_session()), asyncio.run(get_session()))
+
+    def test_idle_session_evicted(self):
+        async def run():
+            registry = TransportRegistry()
+
+            idle_session = registry.get_session()
+            with mock.patch("config.TRANSPORT_IDLE_TIMEOUT_SEC", 0):
+                new_session = registry.get_session()
+
+            await asyncio.sleep(0)
+            await registry.close_sessions()
+            return idle_session, new_session
+
+        idle_session, new_session = asyncio.run(run())
+        self.assertIsNot(idle_session, new_session)
+        self.assertTrue(idle_session.closed)
+
+    def test_held_session_not_evicted(self):
+        async def run():
+            registry = TransportRegistry()
+
+            held_session = registry.get_session()
+            holder = RpcPool().get_client(session=held_session)
+
+            with mock.patch("config.TRANSPORT_IDLE_TIMEOUT_SEC", 0):
+                self.assertIs(registry.get_session(), held_session)
+
+                del holder
+                new_session = registry.get_session()
+
+            await registry.close_sessions()
+            return held_session, new_session
+
+        held_session, new_session = asyncio.run(run())
+        self.assertIsNot(held_session, new_session)
+        self.assertTrue(held_session.closed)
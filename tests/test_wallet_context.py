@@ -0,0 +1,51 @@
+import asyncio
+import unittest
+
+from src.schemas.app_config import AppConfigSchema
+from src.schemas.wallet_data import WalletData
+from src.storage import Storage
+from src.transport_registry import TransportRegistry
+from src.wallet_context import WalletContext
+from src.wallet_context import wallet_context_var
+from src.wallet_context import get_wallet_context
+
+
+class TestWalletContext(unittest.TestCase):
+    def setUp(self):
+        Storage().update_app_config(AppConfigSchema(use_proxy=False))
+
+        self.wallet = WalletData(private_key="0x" + "1" * 64)
+        self.other_wallet = WalletData(private_key="0x" + "2" * 64)
+
+    def test_context_of_processed_wallet_is_shared(self):
+        wallet_context = WalletContext(self.wallet)
+        token = wallet_context_var.set(wallet_context)
+
+        try:
+            self.assertIs(get_wallet_context(self.wallet), wallet_context)
+            self.assertIsNot(get_wallet_context(self.other_wallet), wallet_context)
+        finally:
+            wallet_context_var.reset(token)
+
+    def test_account_built_once_per_loop(self):
+        wallet_context = WalletContext(self.wallet)
+
+        async def get_accounts():
+            accounts = wallet_context.account, wallet_context.account
+            await TransportRegistry().close_sessions()
+            return accounts
+
+        first_account, second_account = asyncio.run(get_accounts())
+        self.assertIs(first_account, second_account)
+        self.assertEqual(hex(first_account.address), hex(int(self.wallet.address, 16)))
+
+        self.assertIsNot(asyncio.run(get_accounts())[0], first_account)
+
+    def test_chain_state_invalidation(self):
+        wallet_context = WalletContext(self.wallet)
+        wallet_context.set_chain_state("cairo_version", 1)
+
+        self.assertEqual(wallet_context.get_chain_state("cairo_version"), 1)
+
+        wallet_context.invalidate_chain_state()
+        self.assertIsNone(wallet_context.get_chain_state("cairo_version"))
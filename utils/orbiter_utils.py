@@ -1,44 +1,135 @@
-from typing import Union
+import os
+import threading as th
+from typing import Union, Dict, List, Tuple, Optional
+
+from loguru import logger
 
 from utils.file_manager import FileManager
 from src import paths
 from src.schemas.data_models import OrbiterChainData
 
 
-def get_orbiter_bridge_data_by_chain(chain_id: int) -> Union[dict, None]:
-    bridge_data = FileManager.read_data_from_json_file(paths.OrbiterDir.BRIDGE_DATA_FILE)
-    chain_id = str(chain_id)
+STARKNET_ORBITER_CHAIN = 4
 
-    for key, value in bridge_data.items():
-        dst_id = key.split("-")[1]
-        if int(dst_id) == int(chain_id[2:]):
-            return value
+OrbiterRouteKey = Tuple[int, int, str]
 
-    return None
 
+class OrbiterRouteTable:
+    """
+    Orbiter bridge routes from bridge data file, indexed by (src chain, dst chain, dst token).
+    File is parsed once and reloaded only when its modification time is changed.
+    """
+    _instance = None
 
-def get_orbiter_bridge_data_by_token(
-        chain_id: int,
-        token_symbol: str
-) -> Union[OrbiterChainData, None]:
+    routes: Dict[OrbiterRouteKey, OrbiterChainData]
+    raw_routes: Dict[Tuple[int, int], dict]
+    tokens_by_route: Dict[Tuple[int, int], List[str]]
+    file_mtime: Optional[float]
+    _lock: th.Lock
 
-    chain_data = get_orbiter_bridge_data_by_chain(chain_id)
-    if chain_data is None:
-        return None
+    def __new__(cls):
+        if not cls._instance:
+            instance = super(OrbiterRouteTable, cls).__new__(cls)
+            instance.routes = {}
+            instance.raw_routes = {}
+            instance.tokens_by_route = {}
+            instance.file_mtime = None
+            instance._lock = th.Lock()
 
-    for key, value in chain_data.items():
-        symbol = key.split("-")[1]
-        if symbol.lower() == token_symbol.lower():
-            return OrbiterChainData(**value)
+            cls._instance = instance
 
-    return None
+        return cls._instance
 
+    @staticmethod
+    def get_file_mtime() -> Optional[float]:
+        try:
+            return os.path.getmtime(paths.OrbiterDir.BRIDGE_DATA_FILE)
+        except OSError:
+            return None
 
-def get_available_tokens_for_chain(chain_id: int):
-    chain_data = get_orbiter_bridge_data_by_chain(chain_id)
-    if chain_data is None:
-        return None
+    def reload_if_changed(self):
+        """
+        Reload routes if bridge data file is changed since last load
+        """
+        file_mtime = self.get_file_mtime()
+        if file_mtime is not None and file_mtime == self.file_mtime:
+            return
+
+        with self._lock:
+            if file_mtime is not None and file_mtime == self.file_mtime:
+                return
+
+            self.load()
+            self.file_mtime = file_mtime
+
+    def load(self):
+        """
+        Parse bridge data file and rebuild indexes
+        """
+        bridge_data = FileManager.read_data_from_json_file(paths.OrbiterDir.BRIDGE_DATA_FILE) or {}
+
+        routes = {}
+        raw_routes = {}
+        tokens_by_route = {}
+        for chains_key, chain_data in bridge_data.items():
+            src_chain, dst_chain = (int(chain) for chain in chains_key.split("-"))
+            raw_routes[(src_chain, dst_chain)] = chain_data
+            tokens_by_route[(src_chain, dst_chain)] = [key.split("-")[1] for key in chain_data.keys()]
+
+            for tokens_key, route_data in chain_data.items():
+                token_symbol = tokens_key.split("-")[1].lower()
+
+                try:
+                    routes.setdefault((src_chain, dst_chain, token_symbol), OrbiterChainData(**route_data))
+                except ValueError as ex:
+                    logger.error(f"Invalid Orbiter route {chains_key} {tokens_key}: {ex}")
+
+        self.routes = routes
+        self.raw_routes = raw_routes
+        self.tokens_by_route = tokens_by_route
+
+    @staticmethod
+    def get_dst_chain(chain_id: int) -> int:
+        """
+        Get Orbiter chain number from Orbiter chain id, e.g. 9019 -> 19
+        Args:
+            chain_id: orbiter chain id
+        """
+        return int(str(chain_id)[2:])
 
-    return [key.split("-")[1] for key in chain_data.keys()]
+    def get_chain_data(self, chain_id: int, src_chain: int = STARKNET_ORBITER_CHAIN) -> Union[dict, None]:
+        self.reload_if_changed()
+        return self.raw_routes.get((src_chain, self.get_dst_chain(chain_id)))
 
+    def get_route(
+            self,
+            chain_id: int,
+            token_symbol: str,
+            src_chain: int = STARKNET_ORBITER_CHAIN,
+    ) -> Union[OrbiterChainData, None]:
+        self.reload_if_changed()
+        return self.routes.get((src_chain, self.get_dst_chain(chain_id), token_symbol.lower()))
 
+    def get_tokens(self, chain_id: int, src_chain: int = STARKNET_ORBITER_CHAIN) -> Union[List[str], None]:
+        self.reload_if_changed()
+
+        tokens = self.tokens_by_route.get((src_chain, self.get_dst_chain(chain_id)))
+        if tokens is None:
+            return None
+
+        return list(tokens)
+
+
+def get_orbiter_bridge_data_by_chain(chain_id: int) -> Union[dict, None]:
+    return OrbiterRouteTable().get_chain_data(chain_id)
+
+
+def get_orbiter_bridge_data_by_token(
+        chain_id: int,
+        token_symbol: str
+) -> Union[OrbiterChainData, None]:
+    return OrbiterRouteTable().get_route(chain_id=chain_id, token_symbol=token_symbol)
+
+
+def get_available_tokens_for_chain(chain_id: int):
+    return OrbiterRouteTable().get_tokens(chain_id)